@@ -1,3 +1,4 @@
+# dashboard: determinista  (NUEVO: el Dashboard puede reutilizar su salida)
 
 class Tren:
     def __init__(self, fabricante, modelo, capacidad, color, tipo_motor, tonelaje):
@@ -1,11 +1,23 @@
 
 # -*- coding: utf-8 -*-
+# dashboard: determinista  (NUEVO: el Dashboard puede reutilizar su salida)
 """
 Gestor simple de nómina con POO:
 - Herencia: Empleado -> EmpleadoAsalariado / EmpleadoPorHoras
 - Encapsulación: atributos privados con @property (validación)
 - Polimorfismo: calcular_pago() implementado distinto en cada derivada
+- Nómina por lotes: NominaPorLotes guarda a los empleados agrupados por tipo en columnas
+  (salarios; tarifas y horas) y calcula todos los pagos de una vez, con el mismo
+  resultado exacto que calcular_nomina().
 """
+from array import array
+import sys
+import time
+
+try:
+    import numpy as np  # opcional: sin numpy se recorre las columnas array('d') en Python
+except ImportError:
+    np = None
 
 class Empleado:
     """Clase base: define interfaz común para los empleados."""
@@ -92,7 +104,120 @@ def calcular_nomina(empleados: list) -> float:
     return sum(emp.calcular_pago() for emp in empleados)
 
 
+# NUEVO: motor por lotes para nóminas de cientos de miles de empleados.
+# Sacar los datos de los objetos cuesta tanto como llamar a calcular_pago(), así que las
+# columnas se arman UNA vez (o directo con agregar_*) y se reutilizan en cada cálculo.
+class NominaPorLotes:
+    """
+    Columnas por tipo (array('d')): salarios; tarifas y horas. Cada fila recuerda su posición
+    original para devolver los pagos en orden y sumar igual que calcular_nomina().
+    Subclases con otro calcular_pago() se guardan como objetos y se calculan uno por uno.
+    """
+    def __init__(self, empleados: list = ()):
+        self.salarios = array("d")
+        self.tarifas = array("d")
+        self.horas = array("d")
+        self._pos_salarios = array("q")
+        self._pos_horas = array("q")
+        self._otros = []  # (posición, empleado)
+        self._n = 0
+        for emp in empleados:
+            self.agregar(emp)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def agregar(self, emp: Empleado) -> None:
+        if type(emp) is EmpleadoAsalariado:
+            self._pos_salarios.append(self._n); self.salarios.append(emp.salario_mensual)
+        elif type(emp) is EmpleadoPorHoras:
+            self._pos_horas.append(self._n); self.tarifas.append(emp.tarifa_hora); self.horas.append(emp.horas_trabajadas)
+        else:
+            self._otros.append((self._n, emp))
+        self._n += 1
+
+    def agregar_asalariado(self, salario_mensual: float) -> None:
+        """Como agregar(EmpleadoAsalariado(...)) sin crear el objeto (misma validación)."""
+        if salario_mensual < 0:
+            raise ValueError("El salario mensual no puede ser negativo.")
+        self._pos_salarios.append(self._n); self.salarios.append(salario_mensual)
+        self._n += 1
+
+    def agregar_por_horas(self, tarifa_hora: float, horas_trabajadas: float) -> None:
+        if tarifa_hora < 0:
+            raise ValueError("La tarifa por hora no puede ser negativa.")
+        if horas_trabajadas < 0:
+            raise ValueError("Las horas trabajadas no pueden ser negativas.")
+        self._pos_horas.append(self._n); self.tarifas.append(tarifa_hora); self.horas.append(horas_trabajadas)
+        self._n += 1
+
+    def _pagos_por_horas(self):
+        # Misma regla y mismas operaciones, en el mismo orden, que EmpleadoPorHoras.calcular_pago()
+        # -> resultados idénticos bit a bit.
+        if np is not None:
+            h, t = np.frombuffer(self.horas), np.frombuffer(self.tarifas)  # vistas, sin copiar
+            return np.where(h <= 40, h * t, 40 * t + (h - 40) * t * 1.5)
+        return [h * t if h <= 40 else 40 * t + (h - 40) * t * 1.5 for h, t in zip(self.horas, self.tarifas)]
+
+    def pagos(self) -> list:
+        """Pago de cada empleado, en el orden en que se agregaron."""
+        if np is not None:
+            pagos = np.empty(self._n)
+            if self._pos_salarios:
+                pagos[np.frombuffer(self._pos_salarios, dtype=np.int64)] = np.frombuffer(self.salarios)
+            if self._pos_horas:
+                pagos[np.frombuffer(self._pos_horas, dtype=np.int64)] = self._pagos_por_horas()
+            for i, emp in self._otros:
+                pagos[i] = emp.calcular_pago()
+            return pagos.tolist()
+        pagos = [0.0] * self._n
+        for i, pago in zip(self._pos_salarios, self.salarios):
+            pagos[i] = pago
+        for i, pago in zip(self._pos_horas, self._pagos_por_horas()):
+            pagos[i] = pago
+        for i, emp in self._otros:
+            pagos[i] = emp.calcular_pago()
+        return pagos
+
+    def total(self) -> float:
+        """Igual a calcular_nomina() de los mismos empleados (se suma en el orden original)."""
+        if self._otros or (self._pos_salarios and self._pos_horas):
+            return sum(self.pagos())
+        # Un solo tipo: no hace falta reordenar.
+        if self._pos_salarios:
+            return sum(self.salarios)
+        pagos = self._pagos_por_horas()
+        return sum(pagos.tolist() if np is not None else pagos)
+
+
+# python NominaEmpleados.py --bench [empleados]
+def benchmark(n=300000):
+    import random
+    rnd = random.Random(6)
+    empleados = [EmpleadoAsalariado(f"A{i}", rnd.uniform(450, 3000)) if i % 3 == 0 else
+                 EmpleadoPorHoras(f"H{i}", rnd.uniform(4, 30), rnd.choice([rnd.uniform(0, 40), rnd.uniform(40, 70)]))
+                 for i in range(n)]
+    t0 = time.perf_counter()
+    total = calcular_nomina(empleados)
+    t1 = time.perf_counter()
+    nomina = NominaPorLotes(empleados)
+    t2 = time.perf_counter()
+    total_lote = nomina.total()
+    t3 = time.perf_counter()
+    assert total == total_lote, (total, total_lote)
+    assert nomina.pagos() == [emp.calcular_pago() for emp in empleados]
+    print(f"{n} empleados ({'numpy' if np is not None else 'sin numpy'}), total ${total:,.2f} (idéntico)")
+    print(f"calcular_nomina            {(t1 - t0) * 1000:8.1f} ms")
+    print(f"NominaPorLotes (armar)     {(t2 - t1) * 1000:8.1f} ms  (una vez)")
+    print(f"NominaPorLotes.total()     {(t3 - t2) * 1000:8.1f} ms  (x{(t1 - t0) / (t3 - t2):.1f})")
+
+
 if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        i = sys.argv.index("--bench")
+        benchmark(int(sys.argv[i + 1]) if len(sys.argv) > i + 1 else 300000)
+        sys.exit(0)
+
     # --- Demostración simple ---
     # 1) Crear empleados (uno asalariado y dos por horas)
     ana = EmpleadoAsalariado("Ana", salario_mensual=1200)
@@ -107,3 +232,4 @@ if __name__ == "__main__":
     # 3) Calcular nómina total
     total = calcular_nomina(empleados)
     print(f"\nNómina total a pagar: ${total:.2f}")
+    print(f"Nómina por lotes:      ${NominaPorLotes(empleados).total():.2f}")
@@ -1,3 +1,30 @@
+# CAMBIO: faltaban los imports y el logger que usan las clases (el script no arrancaba).
+from pathlib import Path
+from array import array
+import asyncio
+from collections import deque
+from contextlib import contextmanager
+from itertools import accumulate
+from typing import Iterable, Iterator
+import gc
+import logging
+import mmap
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+from rotacion import ArchivoRotativo, PoliticaRotacion, leer_lineas  # NUEVO
+import recursos  # NUEVO: rastreo opcional de recursos (apagado = un if por llamada)
+
+log = logging.getLogger("gestor")
+
+_NL = b"\n"
+_IOV_MAX = os.sysconf("SC_IOV_MAX") if hasattr(os, "sysconf") and "SC_IOV_MAX" in os.sysconf_names else 1024
+
+
 class GestorArchivo:
     """
     Clase que DEMUESTRA el uso de:
@@ -10,15 +37,35 @@ class GestorArchivo:
     - __del__ lo invoca el recolector de basura cuando el objeto queda sin referencias.
       *No es determinístico ni está garantizado en un momento exacto.*
     - __exit__ se ejecuta al SALIR del bloque 'with', con o sin excepciones.
+    - NUEVO: rotacion=PoliticaRotacion(...) corta el archivo por tamaño y/o por día; los
+      segmentos viejos se comprimen en segundo plano y leer_historial() los recorre en orden.
+    - NUEVO: write_lines escribe por bloques (una escritura por bloque, no por línea) y con
+      writev=True usa un descriptor binario y os.writev (sin unir las líneas en memoria); en ese
+      modo write_lines también acepta líneas bytes, que se escriben sin codificar.
     """
 
-    def __init__(self, path: str | Path, mode: str = "a", encoding: str = "utf-8", buffering: int = 1):
+    def __init__(self, path: str | Path, mode: str = "a", encoding: str = "utf-8", buffering: int = 1,
+                 rotacion: PoliticaRotacion | None = None, writev: bool = False):
         """
         Constructor: prepara el objeto y abre el archivo (recurso a gestionar).
         """
         self.path: Path = Path(path)
-        self._fh = open(self.path, mode=mode, encoding=encoding, buffering=buffering)
+        self.encoding = encoding
+        self._rotativo = rotacion is not None
+        self._writev = writev
+        if writev:
+            if not hasattr(os, "writev"):
+                raise ValueError("os.writev no está disponible en este sistema.")
+            if self._rotativo or mode not in ("a", "w"):
+                raise ValueError("writev=True solo admite mode 'a' o 'w' y sin rotación.")
+            self._fh = open(self.path, mode=mode + "b", buffering=0)  # cada escritura va directo al SO
+        elif self._rotativo:
+            self._fh = ArchivoRotativo(self.path, rotacion, mode=mode, encoding=encoding, buffering=buffering)
+        else:
+            self._fh = open(self.path, mode=mode, encoding=encoding, buffering=buffering)
         self._cerrado: bool = False
+        if recursos.ACTIVO:
+            recursos.registrar(self, str(self.path))
         log.info(f"[GestorArchivo.__init__] Abrí: {self.path} (mode={mode}, encoding={encoding})")
 
     def write_line(self, text: str) -> None:
@@ -27,20 +74,95 @@ class GestorArchivo:
         """
         if self._cerrado:
             raise RuntimeError("Archivo cerrado.")
-        self._fh.write(text.rstrip("\n") + "\n")
+        linea = text.rstrip("\n") + "\n"
+        if self._writev:
+            self._escribir_todo([linea.encode(self.encoding)])
+            return
+        if self._rotativo and self._fh.reservar(len(linea.encode(self.encoding))):
+            self._fh.rotar()
+        self._fh.write(linea)
 
-    def write_lines(self, lines: Iterable[str]) -> None:
+    def write_lines(self, lines: Iterable[str], bloque: int = 1 << 16) -> None:
         """
-        Escribe múltiples líneas, reutilizando write_line.
+        Escribe múltiples líneas (mismo resultado que write_line en bucle).
+        CAMBIO: junta ~'bloque' caracteres y hace UNA escritura por bloque; antes cada línea
+        pagaba la revisión de cierre, un rstrip+concatenación y (con buffering=1) un syscall.
+        Con rotación se sigue línea por línea para que max_bytes sea exacto.
         """
+        if self._cerrado:
+            raise RuntimeError("Archivo cerrado.")
+        if self._rotativo:
+            for line in lines:
+                self.write_line(line)
+            return
+        if self._writev:
+            self._lineas_writev(lines)
+            return
+        pendientes, tam = [], 0
         for line in lines:
-            self.write_line(line)
+            if line.endswith("\n"):
+                line = line.rstrip("\n")
+            pendientes.append(line)
+            tam += len(line) + 1
+            if tam >= bloque:
+                self._bloque_texto(pendientes)
+                pendientes, tam = [], 0
+        if pendientes:
+            self._bloque_texto(pendientes)
+
+    def _bloque_texto(self, lineas: list) -> None:
+        lineas.append("")  # para que el join deje el "\n" final
+        self._fh.write("\n".join(lineas))
+
+    def _lineas_writev(self, lines: Iterable[str | bytes]) -> None:
+        """Un os.writev cada IOV_MAX/2 líneas: cada línea y su salto van como buffers separados."""
+        enc, bufs = self.encoding, []
+        for linea in lines:
+            if not isinstance(linea, bytes):
+                linea = linea.encode(enc)
+            if linea.endswith(_NL):
+                linea = linea.rstrip(_NL)
+            bufs += (linea, _NL)
+            if len(bufs) + 2 > _IOV_MAX:  # CAMBIO: la próxima línea ya no cabría (IOV_MAX impar)
+                self._escribir_todo(bufs)
+                bufs = []
+        if bufs:
+            self._escribir_todo(bufs)
+
+    def _escribir_todo(self, bufs: list) -> None:
+        """os.writev puede escribir menos de lo pedido: se completa el resto."""
+        fd = self._fh.fileno()
+        escrito, total = os.writev(fd, bufs), sum(map(len, bufs))
+        if escrito < total:
+            resto = memoryview(b"".join(bufs))[escrito:]
+            while resto:
+                resto = resto[os.write(fd, resto):]
+
+    def lector(self) -> "LectorArchivo":
+        """
+        NUEVO: LectorArchivo sobre lo escrito hasta ahora (vacía el buffer antes de mapear).
+        """
+        if self._cerrado:
+            raise RuntimeError("Archivo cerrado.")
+        self._fh.flush()
+        return LectorArchivo(self.path, encoding=self.encoding)
+
+    @staticmethod
+    def leer_historial(path: str | Path, encoding: str = "utf-8") -> Iterator[str]:
+        """
+        NUEVO: líneas de los segmentos rotados (más viejo primero) y del archivo activo,
+        en streaming (los .gz se descomprimen al vuelo).
+        """
+        for linea in leer_lineas(path, encoding):
+            yield linea.rstrip("\r\n")
 
     def close(self) -> None:
         """
         Cierre EXPLÍCITO (recomendado). Idempotente: seguro si se llama más de una vez.
         """
         if not self._cerrado:
+            if recursos.ACTIVO:
+                recursos.liberado(self)
             try:
                 self._fh.close()
                 log.info(f"[GestorArchivo.close] Cerré: {self.path}")
@@ -69,6 +191,8 @@ class GestorArchivo:
         Debe ser SILENCIOSO ante errores y actuar solo como respaldo.
         """
         if hasattr(self, "_cerrado") and not self._cerrado:
+            if recursos.ACTIVO:
+                recursos.liberado(self, "__del__")
             try:
                 self._fh.close()
                 log.warning(f"[GestorArchivo.__del__] Cerré automáticamente (olvido) -> {self.path}")
@@ -79,6 +203,168 @@ class GestorArchivo:
                 self._cerrado = True
 
 
+class LectorArchivo:
+    """
+    NUEVO: lado de LECTURA de GestorArchivo, con mmap (el SO trae solo las páginas que se tocan).
+
+    - linea(n): acceso directo a la línea n. El índice de inicios de línea se arma de forma
+      perezosa, solo hasta donde se pidió (array de enteros, no una lista de str).
+    - invertido() / cola(k): desde el final hacia atrás con rfind, sin índice ni leer el resto.
+    - rango_bytes(a, b) / rango_lineas(i, j): memoryview sobre el mapa, sin copiar.
+      Usarlas con 'with' (o release()) para poder cerrar: un mmap con vistas vivas no se cierra.
+
+    Mismo ciclo de vida que GestorArchivo: __init__ adquiere (archivo + mapa), close() explícito
+    e idempotente, 'with' garantiza el cierre y __del__ es solo la red de seguridad.
+    Las líneas se devuelven sin el salto final (LF o CRLF).
+    """
+
+    BLOQUE = 1 << 20  # el índice avanza de a 1 MiB
+
+    def __init__(self, path: str | Path, encoding: str = "utf-8"):
+        self.path: Path = Path(path)
+        self.encoding = encoding
+        self._fh = open(self.path, "rb")
+        self._tam = os.fstat(self._fh.fileno()).st_size
+        # Un archivo vacío no se puede mapear: se usa b"" (mismas operaciones de búsqueda).
+        self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ) if self._tam else b""
+        self._inicios = array("q", [0])   # inicio de cada línea ya indexada
+        self._completo = self._tam == 0
+        self._cerrado: bool = False
+        if recursos.ACTIVO:
+            recursos.registrar(self, str(self.path))
+        log.info(f"[LectorArchivo.__init__] Mapeé: {self.path} ({self._tam} bytes)")
+
+    def _vivo(self) -> None:
+        if self._cerrado:
+            raise RuntimeError("Archivo cerrado.")
+
+    def _indexar_hasta(self, n: int | None) -> None:
+        """Agrega inicios de línea hasta conocer la línea n (None = todas).
+        Por bloques: split + accumulate calculan los offsets en C, no un find por línea."""
+        mm, inicios, tam = self._mm, self._inicios, self._tam
+        while not self._completo and (n is None or len(inicios) <= n + 1):
+            pos = inicios[-1]
+            fin = min(pos + self.BLOQUE, tam)
+            bloque = mm[pos:fin]
+            ultimo = bloque.rfind(b"\n")
+            if ultimo >= 0:
+                largos = map(len, bloque[:ultimo].split(b"\n"))
+                nuevos = accumulate(map((1).__add__, largos), initial=pos)
+                next(nuevos)            # 'pos' ya estaba
+                inicios.extend(nuevos)
+                hay_mas = fin < tam
+            else:                       # línea más larga que el bloque
+                j = mm.find(b"\n", fin) if fin < tam else -1
+                hay_mas = j >= 0
+                if hay_mas:
+                    inicios.append(j + 1)
+            if inicios[-1] == tam:      # el archivo termina en salto: no abre otra línea
+                inicios.pop()
+                self._completo = True
+            elif not hay_mas:           # lo que queda es la última línea, sin salto final
+                self._completo = True
+
+    def _limites(self, n: int) -> tuple:
+        self._indexar_hasta(n)
+        if n + 1 < len(self._inicios):
+            return self._inicios[n], self._inicios[n + 1]
+        return self._inicios[n], self._tam
+
+    def __len__(self) -> int:
+        self._vivo()
+        self._indexar_hasta(None)
+        return 0 if self._tam == 0 else len(self._inicios)
+
+    def linea(self, n: int) -> str:
+        """Línea n (0 = primera; negativos cuentan desde el final)."""
+        self._vivo()
+        total = None
+        if n < 0:
+            total = len(self); n += total
+        else:
+            self._indexar_hasta(n)
+            if self._completo:
+                total = 0 if self._tam == 0 else len(self._inicios)
+        if n < 0 or (total is not None and n >= total):
+            raise IndexError(f"Línea fuera de rango: {n}")
+        a, b = self._limites(n)
+        return self._mm[a:b].decode(self.encoding).rstrip("\r\n")
+
+    def invertido(self) -> Iterator[str]:
+        """Líneas desde la última hacia la primera."""
+        self._vivo()
+        mm, fin = self._mm, self._tam
+        if fin == 0:
+            return
+        if mm[fin - 1:fin] == b"\n":
+            fin -= 1                    # el salto final no abre una línea vacía
+        while True:
+            ini = mm.rfind(b"\n", 0, fin) + 1
+            yield mm[ini:fin].decode(self.encoding).rstrip("\r")
+            if ini == 0:
+                break
+            fin = ini - 1
+
+    def cola(self, k: int = 10) -> list:
+        """Últimas k líneas, en orden normal (como 'tail')."""
+        lineas = []
+        for linea in self.invertido():
+            if len(lineas) >= k:
+                break
+            lineas.append(linea)
+        return lineas[::-1]
+
+    def rango_bytes(self, inicio: int, fin: int) -> memoryview:
+        """Bytes [inicio, fin) del archivo SIN copiar."""
+        self._vivo()
+        return memoryview(self._mm)[inicio:fin]
+
+    def rango_lineas(self, i: int, j: int) -> memoryview:
+        """Bytes de las líneas [i, j) (con sus saltos) SIN copiar."""
+        self._vivo()
+        if i >= j:
+            return memoryview(b"")
+        return self.rango_bytes(self._limites(i)[0], self._limites(j - 1)[1])
+
+    def close(self) -> None:
+        """
+        Cierre EXPLÍCITO. Idempotente. Falla (sin cerrar) si quedan vistas de rango_* sin liberar.
+        """
+        if not self._cerrado:
+            if isinstance(self._mm, mmap.mmap):
+                try:
+                    self._mm.close()
+                except BufferError:
+                    raise RuntimeError("Quedan vistas de rango_bytes()/rango_lineas() sin liberar "
+                                       "(úsalas con 'with').") from None
+            if recursos.ACTIVO:
+                recursos.liberado(self)
+            try:
+                self._fh.close()
+                log.info(f"[LectorArchivo.close] Cerré: {self.path}")
+            finally:
+                self._cerrado = True
+
+    def __enter__(self) -> "LectorArchivo":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+    def __del__(self):
+        if hasattr(self, "_cerrado") and not self._cerrado:
+            if recursos.ACTIVO:
+                recursos.liberado(self, "__del__")
+            try:
+                self.close()
+                log.warning(f"[LectorArchivo.__del__] Cerré automáticamente (olvido) -> {self.path}")
+            except Exception:
+                pass
+            finally:
+                self._cerrado = True
+
+
 class ConexionSimulada:
     """
     Segunda clase para demostrar otro recurso (socket) y el patrón de limpieza.
@@ -87,31 +373,76 @@ class ConexionSimulada:
     - close: cierre explícito del socket (buena práctica).
     - __del__: red de seguridad si se olvidó cerrar.
     - (Opcional) __enter__/__exit__ para usarlo con 'with'.
+    - NUEVO: conectar=True conecta de verdad (p.ej. a ServidorEco) y enviar_ping manda los
+      bytes y espera el eco; así la conexión se puede reutilizar (ver PoolConexiones).
     """
 
-    def __init__(self, host: str = "localhost", port: int = 80, timeout: float = 1.0):
+    def __init__(self, host: str = "localhost", port: int = 80, timeout: float = 1.0, conectar: bool = False):
         self.host = host
         self.port = port
         self.timeout = timeout
         self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._sock.settimeout(self.timeout)
         self._cerrado = False
+        self.conectada = False
+        if recursos.ACTIVO:
+            recursos.registrar(self, f"{host}:{port}")
         log.info(f"[ConexionSimulada.__init__] Socket creado para {self.host}:{self.port} (timeout={self.timeout})")
         # Para la demo NO conectamos a ningún sitio real (evita dependencias de red).
+        if conectar:
+            try:
+                self._sock.connect((host, port))
+            except OSError:
+                self.close()
+                raise
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # ping-pong: sin Nagle
+            self.conectada = True
 
-    def enviar_ping(self, data: bytes = b"ping") -> None:
+    def enviar_ping(self, data: bytes = b"ping") -> bytes | None:
         """
-        Método ilustrativo (no conecta).
+        Sin conectar: método ilustrativo (solo registra).
+        NUEVO: conectada, envía 'data' y devuelve el eco recibido.
         """
         if self._cerrado:
             raise RuntimeError("Conexión cerrada.")
-        log.info(f"[ConexionSimulada.enviar_ping] Simulando envío de {data!r} a {self.host}:{self.port}")
+        if not self.conectada:
+            log.info(f"[ConexionSimulada.enviar_ping] Simulando envío de {data!r} a {self.host}:{self.port}")
+            return None
+        self._sock.sendall(data)
+        recibido = bytearray()
+        while len(recibido) < len(data):
+            trozo = self._sock.recv(len(data) - len(recibido))
+            if not trozo:
+                raise ConnectionError("El servidor cerró la conexión.")
+            recibido += trozo
+        return bytes(recibido)
+
+    def viva(self) -> bool:
+        """
+        NUEVO: chequeo de salud sin bloquear. Una conexión inactiva sana no tiene nada para leer:
+        b"" = el otro extremo cerró; datos sobrantes = protocolo desfasado (tampoco sirve).
+        """
+        if self._cerrado or not self.conectada:
+            return False
+        try:
+            self._sock.setblocking(False)
+            self._sock.recv(1, socket.MSG_PEEK)
+            return False                 # b"" (cerrada) o datos sobrantes
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+        finally:
+            if not self._cerrado:
+                self._sock.settimeout(self.timeout)
 
     def close(self) -> None:
         """
         Cierre explícito del socket (idempotente).
         """
         if not self._cerrado:
+            if recursos.ACTIVO:
+                recursos.liberado(self)
             try:
                 self._sock.close()
                 log.info("[ConexionSimulada.close] Socket cerrado.")
@@ -127,6 +458,8 @@ class ConexionSimulada:
 
     def __del__(self):
         if hasattr(self, "_cerrado") and not self._cerrado:
+            if recursos.ACTIVO:
+                recursos.liberado(self, "__del__")
             try:
                 self._sock.close()
                 log.warning("[ConexionSimulada.__del__] Cerré socket automáticamente (olvido).")
@@ -136,10 +469,553 @@ class ConexionSimulada:
                 self._cerrado = True
 
 
+class PoolConexiones:
+    """
+    NUEVO: pool de ConexionSimulada conectadas a un mismo host:port.
+
+    - max_tamano: conexiones en uso a la vez; obtener() espera un cupo (hasta espera_max).
+    - Las libres se reutilizan en orden LIFO (la más recién usada, la más "tibia").
+    - Al sacar una libre se descartan las que llevan más de inactividad_max segundos sin uso
+      y las que no pasan ConexionSimulada.viva().
+    - Si el bloque 'with pool.obtener()' termina con excepción la conexión se cierra en vez de
+      volver al pool (puede haber quedado a mitad de un intercambio).
+
+        with PoolConexiones("127.0.0.1", puerto) as pool:
+            with pool.obtener() as conn:
+                conn.enviar_ping(b"hola")
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 80, max_tamano: int = 8,
+                 inactividad_max: float = 30.0, timeout: float = 1.0, espera_max: float | None = None):
+        if max_tamano < 1:
+            raise ValueError("max_tamano debe ser al menos 1.")
+        self.host, self.port, self.timeout = host, port, timeout
+        self.max_tamano, self.inactividad_max, self.espera_max = max_tamano, inactividad_max, espera_max
+        self._libres: deque = deque()   # (conexion, monotonic del último uso)
+        self._cupos = threading.BoundedSemaphore(max_tamano)
+        self._lock = threading.Lock()
+        self.creadas = self.reutilizadas = self.descartadas = 0
+        self._cerrado = False
+        log.info(f"[PoolConexiones.__init__] Pool para {host}:{port} (max={max_tamano})")
+
+    def _sacar_libre(self) -> ConexionSimulada | None:
+        ahora = time.monotonic()
+        with self._lock:
+            while self._libres and ahora - self._libres[0][1] > self.inactividad_max:
+                self._libres.popleft()[0].close(); self.descartadas += 1   # las más viejas, a la izquierda
+            while self._libres:
+                conn, _ = self._libres.pop()
+                if conn.viva():
+                    self.reutilizadas += 1
+                    return conn
+                conn.close(); self.descartadas += 1
+        return None
+
+    def _crear(self) -> ConexionSimulada:
+        conn = ConexionSimulada(self.host, self.port, self.timeout, conectar=True)
+        with self._lock:
+            self.creadas += 1
+        return conn
+
+    def _devolver(self, conn: ConexionSimulada) -> None:
+        with self._lock:
+            if not self._cerrado and not conn._cerrado:
+                self._libres.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    @contextmanager
+    def obtener(self) -> Iterator[ConexionSimulada]:
+        if self._cerrado:
+            raise RuntimeError("Pool cerrado.")
+        if not self._cupos.acquire(timeout=self.espera_max):
+            raise TimeoutError(f"No hubo conexión libre en {self.espera_max} s (max_tamano={self.max_tamano}).")
+        conn = None
+        try:
+            conn = self._sacar_libre() or self._crear()
+            yield conn
+        except BaseException:
+            if conn is not None:
+                conn.close()
+                with self._lock:
+                    self.descartadas += 1
+                conn = None
+            raise
+        finally:
+            if conn is not None:
+                self._devolver(conn)
+            self._cupos.release()
+
+    def libres(self) -> int:
+        return len(self._libres)
+
+    def close(self) -> None:
+        """
+        Cierra las conexiones libres; las que estén prestadas se cierran al devolverse.
+        """
+        if not self._cerrado:
+            with self._lock:
+                self._cerrado = True
+                libres, self._libres = self._libres, deque()
+            for conn, _ in libres:
+                conn.close()
+            log.info(f"[PoolConexiones.close] Pool cerrado ({self.creadas} creadas, {self.reutilizadas} reutilizadas).")
+
+    def __enter__(self) -> "PoolConexiones":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+    def __del__(self):
+        if hasattr(self, "_cerrado") and not self._cerrado:
+            try:
+                self.close()
+                log.warning("[PoolConexiones.__del__] Cerré el pool automáticamente (olvido).")
+            except Exception:
+                pass
+
+
+class _ServidorTCPEco(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, direccion):
+        super().__init__(direccion, _ManejadorEco)
+        self.aceptadas = 0
+        self.activas: set = set()
+        self.lock = threading.Lock()
+
+
+class _ManejadorEco(socketserver.BaseRequestHandler):
+    def handle(self):
+        sock = self.request
+        with self.server.lock:
+            self.server.aceptadas += 1
+            self.server.activas.add(sock)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            while True:
+                datos = sock.recv(65536)
+                if not datos:
+                    return
+                sock.sendall(datos)
+        except OSError:
+            pass  # close() del servidor cortó la conexión
+        finally:
+            with self.server.lock:
+                self.server.activas.discard(sock)
+
+
+class ServidorEco:
+    """
+    NUEVO: servidor eco local (un hilo por conexión) para probar y medir ConexionSimulada sin
+    depender de la red. port=0 elige un puerto libre; 'aceptadas' cuenta conexiones nuevas.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._srv = _ServidorTCPEco((host, port))
+        self.host, self.port = self._srv.server_address[:2]
+        self._hilo = threading.Thread(target=self._srv.serve_forever, name="servidor-eco", daemon=True)
+        self._hilo.start()
+        self._cerrado = False
+        log.info(f"[ServidorEco.__init__] Escuchando en {self.host}:{self.port}")
+
+    @property
+    def aceptadas(self) -> int:
+        return self._srv.aceptadas
+
+    def close(self) -> None:
+        if not self._cerrado:
+            try:
+                self._srv.shutdown()
+                self._srv.server_close()
+                self._hilo.join()
+                with self._srv.lock:   # como un reinicio real: los clientes ven la conexión cerrada
+                    for sock in self._srv.activas:
+                        try:
+                            sock.shutdown(socket.SHUT_RDWR)
+                        except OSError:
+                            pass
+            finally:
+                self._cerrado = True
+
+    def __enter__(self) -> "ServidorEco":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+
+class ConexionAsincrona:
+    """
+    NUEVO: variante asyncio de ConexionSimulada (conectada), con el mismo ciclo de vida:
+
+        async with ConexionAsincrona(host, port) as conn:   # __aenter__ conecta
+            eco = await conn.enviar_ping(b"hola")
+        # __aexit__ -> await close()  (explícito, idempotente); __del__ solo como respaldo
+
+    - Pipelining: varias corrutinas pueden llamar enviar_ping a la vez sobre el MISMO stream;
+      cada pedido se escribe al momento y una tarea lectora entrega las respuestas en orden
+      (FIFO), sin esperar la respuesta anterior para mandar la siguiente.
+    - pipeline(mensajes) es el atajo para mandar una lista entera así.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 80, timeout: float = 5.0):
+        self.host, self.port, self.timeout = host, port, timeout
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._esperando: deque = deque()      # (largo, futuro) en el orden en que se enviaron
+        self._hay_pedidos: asyncio.Event | None = None
+        self._lectora: asyncio.Task | None = None
+        self._cerrado = False
+
+    async def abrir(self) -> "ConexionAsincrona":
+        if self._cerrado:
+            raise RuntimeError("Conexión cerrada.")
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout)
+        self._writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._hay_pedidos = asyncio.Event()
+        self._lectora = asyncio.get_running_loop().create_task(self._leer_respuestas())
+        log.info(f"[ConexionAsincrona.abrir] Conectada a {self.host}:{self.port}")
+        return self
+
+    async def _leer_respuestas(self) -> None:
+        error: Exception = ConnectionError("Conexión cerrada con pedidos pendientes.")
+        try:
+            while True:
+                if not self._esperando:
+                    self._hay_pedidos.clear()
+                    await self._hay_pedidos.wait()
+                    continue
+                largo, fut = self._esperando[0]
+                datos = await self._reader.readexactly(largo)
+                self._esperando.popleft()
+                if not fut.done():
+                    fut.set_result(datos)
+        except (OSError, asyncio.IncompleteReadError) as e:
+            error = ConnectionError(f"Se perdió la conexión: {e}")
+        finally:
+            self._fallar_pendientes(error)
+
+    def _fallar_pendientes(self, error: Exception) -> None:
+        while self._esperando:
+            _, fut = self._esperando.popleft()
+            if not fut.done():
+                fut.set_exception(error)
+
+    def _pedir(self, mensajes: list) -> list:
+        """Registra un futuro por mensaje y los escribe todos juntos (una sola escritura)."""
+        if self._cerrado or self._writer is None:
+            raise RuntimeError("Conexión cerrada (o sin abrir).")
+        if self._lectora.done():
+            raise ConnectionError("Se perdió la conexión.")
+        crear = asyncio.get_running_loop().create_future
+        futuros = [crear() for _ in mensajes]
+        self._esperando.extend(zip(map(len, mensajes), futuros))
+        self._writer.write(b"".join(mensajes))
+        self._hay_pedidos.set()
+        return futuros
+
+    async def enviar_ping(self, data: bytes = b"ping") -> bytes:
+        fut, = self._pedir([data])
+        await self._writer.drain()            # contrapresión si el buffer de envío se llena
+        return await asyncio.wait_for(fut, self.timeout)
+
+    async def pipeline(self, mensajes: Iterable[bytes]) -> list:
+        """Manda todos los mensajes sin esperar respuestas intermedias; ecos en el mismo orden.
+        Un solo plazo (timeout) para el lote completo."""
+        futuros = self._pedir(list(mensajes))
+        await self._writer.drain()
+        return await asyncio.wait_for(asyncio.gather(*futuros), self.timeout)
+
+    async def close(self) -> None:
+        """
+        Cierre explícito (idempotente): cancela la lectora y espera a que el transporte cierre.
+        """
+        if not self._cerrado:
+            self._cerrado = True
+            try:
+                if self._lectora is not None:
+                    self._lectora.cancel()
+                    await asyncio.gather(self._lectora, return_exceptions=True)
+                # CAMBIO: una lectora cancelada antes de arrancar no corre su finally.
+                self._fallar_pendientes(ConnectionError("Conexión cerrada con pedidos pendientes."))
+                if self._writer is not None:
+                    self._writer.close()
+                    try:
+                        await self._writer.wait_closed()
+                    except OSError:
+                        pass
+                log.info(f"[ConexionAsincrona.close] Cerrada {self.host}:{self.port}")
+            finally:
+                self._writer = None
+
+    async def __aenter__(self) -> "ConexionAsincrona":
+        return await self.abrir()
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        await self.close()
+        return False
+
+    def __del__(self):
+        if hasattr(self, "_cerrado") and not self._cerrado and getattr(self, "_writer", None) is not None:
+            try:
+                self._writer.transport.close()   # sin loop no se puede 'await': solo el transporte
+                log.warning("[ConexionAsincrona.__del__] Cerré el transporte automáticamente (olvido).")
+            except Exception:
+                pass
+            finally:
+                self._cerrado = True
+
+
+async def abanico(direcciones: Iterable[tuple], mensajes: list, timeout: float = 5.0) -> list:
+    """
+    NUEVO: fan-out. Abre una ConexionAsincrona por (host, port) a la vez y manda 'mensajes'
+    en pipeline por cada una; devuelve la lista de ecos de cada dirección (en el mismo orden).
+    """
+    async def una(host, port):
+        async with ConexionAsincrona(host, port, timeout) as conn:
+            return await conn.pipeline(mensajes)
+    return await asyncio.gather(*(una(h, p) for h, p in direcciones))
+
+
+class ServidorEcoAsincrono:
+    """
+    NUEVO: servidor eco asyncio en localhost (port=0: puerto libre), para pruebas y benchmark.
+
+        async with ServidorEcoAsincrono() as srv:
+            ... ConexionAsincrona(srv.host, srv.port) ...
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host, self.port = host, port
+        self.aceptadas = 0
+        self._srv: asyncio.base_events.Server | None = None
+        self._clientes: dict = {}              # writer -> tarea que lo atiende
+
+    async def _atender(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.aceptadas += 1
+        self._clientes[writer] = asyncio.current_task()
+        writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            while datos := await reader.read(65536):
+                writer.write(datos)
+                await writer.drain()
+        except OSError:
+            pass
+        finally:
+            self._clientes.pop(writer, None)
+            writer.close()
+
+    async def abrir(self) -> "ServidorEcoAsincrono":
+        self._srv = await asyncio.start_server(self._atender, self.host, self.port)
+        self.host, self.port = self._srv.sockets[0].getsockname()[:2]
+        return self
+
+    async def close(self) -> None:
+        if self._srv is not None:
+            self._srv.close()
+            tareas = list(self._clientes.values())
+            for writer in list(self._clientes):
+                writer.close()
+            await asyncio.gather(*tareas, return_exceptions=True)  # que cada atención termine
+            await self._srv.wait_closed()
+            self._srv = None
+
+    async def __aenter__(self) -> "ServidorEcoAsincrono":
+        return await self.abrir()
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        await self.close()
+        return False
+
+
+# -----------------------------------------------------------
+# NUEVO: benchmark de escritura masiva
+#   python "GESTORdeARCHIVOS_constructor y destructor.py" --bench [lineas]
+# -----------------------------------------------------------
+def benchmark(n: int = 2_000_000) -> None:
+    """Solo mide; que cada camino escriba lo mismo que write_line lo comprueba tests/test_gestor_escritura.py."""
+    import tempfile
+    lineas = [f"registro {i:08d};sensor={i % 97};valor={i * 0.5:.1f}" for i in range(n)]
+    casos = [
+        ("write_line en bucle (buffering=1)", dict(), "uno"),
+        ("write_lines (buffering=1)", dict(), "lote"),
+        ("write_lines (buffer 1 MiB)", dict(buffering=1 << 20), "lote"),
+    ]
+    if hasattr(os, "writev"):
+        casos.append(("write_lines writev=True", dict(writev=True), "lote"))
+        casos.append(("write_lines writev=True (bytes)", dict(writev=True), "bytes"))
+    en_bytes = [l.encode("utf-8") for l in lineas]
+    with tempfile.TemporaryDirectory() as tmp:
+        for nombre, opciones, via in casos:
+            m = n // 10 if via == "uno" else n  # el camino viejo es ~10x más lento
+            ruta = Path(tmp) / "salida.txt"
+            t0 = time.perf_counter()
+            with GestorArchivo(ruta, mode="w", **opciones) as g:
+                if via == "uno":
+                    for linea in lineas[:m]:
+                        g.write_line(linea)
+                else:
+                    g.write_lines(en_bytes if via == "bytes" else lineas)
+            dt = time.perf_counter() - t0
+            print(f"{nombre:<36} {m:>9,} líneas  {m / dt:>13,.0f} líneas/s")
+
+
+def benchmark_lector(n: int = 2_000_000) -> None:
+    """
+    python "GESTORdeARCHIVOS_constructor y destructor.py" --bench-lector [lineas]
+    LectorArchivo vs. leer todo con read_text() (lo que hacía la demo).
+    """
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = Path(tmp) / "salida.txt"
+        with GestorArchivo(ruta, mode="w") as g:
+            g.write_lines(f"registro {i:08d};valor={i * 0.5:.1f}" for i in range(n))
+        print(f"{n:,} líneas, {ruta.stat().st_size / 2**20:.1f} MiB")
+
+        def medir(nombre, f):
+            t0 = time.perf_counter(); r = f(); dt = time.perf_counter() - t0
+            print(f"  {nombre:<44} {dt * 1000:10.3f} ms")
+            return r
+
+        medio = n // 2
+        a = medir("read_text().splitlines()[n/2]", lambda: ruta.read_text(encoding="utf-8").splitlines()[medio])
+        b = medir("read_text().splitlines()[-10:]", lambda: ruta.read_text(encoding="utf-8").splitlines()[-10:])
+        with LectorArchivo(ruta) as lec:
+            assert medir("LectorArchivo.linea(10) (índice perezoso)", lambda: lec.linea(10)) == f"registro {10:08d};valor=5.0"
+            assert medir("LectorArchivo.cola(10) (sin índice)", lambda: lec.cola(10)) == b
+            assert medir("LectorArchivo.linea(n/2) (indexa hasta n/2)", lambda: lec.linea(medio)) == a
+            medir("LectorArchivo.linea(n/2) (ya indexada)", lambda: lec.linea(medio))
+            with medir("LectorArchivo.rango_lineas(0, n/2) (sin copia)", lambda: lec.rango_lineas(0, medio)) as v:
+                assert v.nbytes == lec._inicios[medio]
+
+
+def benchmark_rastreo(n: int = 20000) -> None:
+    """
+    python "GESTORdeARCHIVOS_constructor y destructor.py" --bench-rastreo [objetos]
+    Costo de crear+cerrar ConexionSimulada con el rastreo de recursos apagado y encendido.
+    """
+    def ronda():
+        t0 = time.perf_counter()
+        for _ in range(n):
+            ConexionSimulada().close()
+        return (time.perf_counter() - t0) / n * 1e6
+
+    recursos.desactivar()
+    ronda()  # calentamiento
+    apagado = min(ronda() for _ in range(3))
+    recursos.activar()
+    encendido = min(ronda() for _ in range(3))
+    recursos.desactivar()
+    print(f"crear+cerrar ConexionSimulada: apagado {apagado:.2f} µs, encendido {encendido:.2f} µs (con pila)")
+
+
+def benchmark_pool(n: int = 5000, hilos: int = 4) -> None:
+    """
+    python "GESTORdeARCHIVOS_constructor y destructor.py" --bench-pool [pedidos]
+    Pedidos/s contra ServidorEco: conexión nueva por pedido vs. PoolConexiones.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    with ServidorEco() as srv:
+        def sin_pool(_):
+            with ConexionSimulada(srv.host, srv.port, conectar=True) as c:
+                assert c.enviar_ping(b"ping") == b"ping"
+
+        def medir(nombre, pedido, k):
+            antes = srv.aceptadas
+            t0 = time.perf_counter()
+            if k == 1:
+                for i in range(n):
+                    pedido(i)
+            else:
+                with ThreadPoolExecutor(k) as ex:
+                    list(ex.map(pedido, range(n)))
+            dt = time.perf_counter() - t0
+            print(f"  {nombre:<28} {n / dt:>10,.0f} pedidos/s   conexiones nuevas: {srv.aceptadas - antes}")
+
+        for k in (1, hilos):
+            print(f"{n} pedidos, {k} hilo(s):")
+            medir("sin pool", sin_pool, k)
+            with PoolConexiones(srv.host, srv.port, max_tamano=k) as pool:
+                def con_pool(_):
+                    with pool.obtener() as c:
+                        assert c.enviar_ping(b"ping") == b"ping"
+                medir("con PoolConexiones", con_pool, k)
+
+
+def benchmark_async(n: int = 20000, extremos: int = 8) -> None:
+    """
+    python "GESTORdeARCHIVOS_constructor y destructor.py" --bench-async [pedidos]
+    Latencia y pedidos/s contra ServidorEcoAsincrono: uno a la vez, en pipeline y en abanico.
+    """
+    def percentiles(muestras):
+        muestras = sorted(muestras)
+        return " ".join(f"p{p}={muestras[min(len(muestras) - 1, len(muestras) * p // 100)] * 1e6:7.1f}µs"
+                        for p in (50, 99))
+
+    async def principal():
+        async with ServidorEcoAsincrono() as srv:
+            async with ConexionAsincrona(srv.host, srv.port) as conn:
+                lat = []
+                t0 = time.perf_counter()
+                for _ in range(n // 10):
+                    t = time.perf_counter(); await conn.enviar_ping(); lat.append(time.perf_counter() - t)
+                dt = time.perf_counter() - t0
+                print(f"  {'uno a la vez (1 conexión)':<34} {n // 10 / dt:>10,.0f} pedidos/s   {percentiles(lat)}")
+
+                mensajes = [b"ping%06d" % i for i in range(n)]
+                t0 = time.perf_counter()
+                ecos = await conn.pipeline(mensajes)
+                dt = time.perf_counter() - t0
+                assert ecos == mensajes
+                print(f"  {'pipeline (1 conexión)':<34} {n / dt:>10,.0f} pedidos/s")
+
+            servidores = [await ServidorEcoAsincrono().abrir() for _ in range(extremos)]
+            try:
+                por_extremo = mensajes[:n // extremos]
+                t0 = time.perf_counter()
+                resultados = await abanico([(s.host, s.port) for s in servidores], por_extremo)
+                dt = time.perf_counter() - t0
+                assert all(r == por_extremo for r in resultados)
+                print(f"  {f'abanico ({extremos} servidores, pipeline)':<34} {len(por_extremo) * extremos / dt:>10,.0f} pedidos/s")
+            finally:
+                for s in servidores:
+                    await s.close()
+
+    print(f"{n} pedidos contra servidores eco asyncio en localhost:")
+    asyncio.run(principal())
+
+
 # -----------------------------------------------------------
 # ejemplo aplicacion(para ejecutar y observar constructores/destructores)
 # -----------------------------------------------------------
 if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        i = sys.argv.index("--bench")
+        benchmark(int(sys.argv[i + 1]) if len(sys.argv) > i + 1 else 2_000_000)
+        sys.exit(0)
+    if "--bench-async" in sys.argv:
+        i = sys.argv.index("--bench-async")
+        benchmark_async(int(sys.argv[i + 1]) if len(sys.argv) > i + 1 else 20000)
+        sys.exit(0)
+    if "--bench-rastreo" in sys.argv:
+        i = sys.argv.index("--bench-rastreo")
+        benchmark_rastreo(int(sys.argv[i + 1]) if len(sys.argv) > i + 1 else 20000)
+        sys.exit(0)
+    if "--bench-pool" in sys.argv:
+        i = sys.argv.index("--bench-pool")
+        benchmark_pool(int(sys.argv[i + 1]) if len(sys.argv) > i + 1 else 5000)
+        sys.exit(0)
+    if "--bench-lector" in sys.argv:
+        i = sys.argv.index("--bench-lector")
+        benchmark_lector(int(sys.argv[i + 1]) if len(sys.argv) > i + 1 else 2_000_000)
+        sys.exit(0)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     print("\n=== Ejemplo 1: Uso recomendado con 'with' (cierre garantizado) ===")
     salida1 = Path("salida_con_with.txt")
     with GestorArchivo(salida1, mode="w") as f:
@@ -148,6 +1024,12 @@ if __name__ == "__main__":
     print("Contenido (con with):")
     print(salida1.read_text(encoding="utf-8"))
 
+    print("\n=== Ejemplo 1b: Leer con LectorArchivo (mmap, acceso directo, cola) ===")
+    with LectorArchivo(salida1) as lec:
+        print(f"{len(lec)} líneas; la 2da: {lec.linea(1)!r}; cola(2): {lec.cola(2)}")
+        with lec.rango_lineas(0, 2) as vista:  # sin copia; se libera al salir del with
+            print("Bytes de las 2 primeras líneas:", bytes(vista))
+
     print("\n=== Ejemplo 2: Olvidar close() (ver __del__ como respaldo) ===")
     salida2 = Path("salida_olvido.txt")
     f2 = GestorArchivo(salida2, mode="w")
@@ -170,7 +1052,43 @@ if __name__ == "__main__":
     del conn2
     gc.collect()
 
-    print("\n=== Fin de la demostración ===")
+    print("\n=== Ejemplo 4b: Pool de conexiones reutilizables contra un servidor eco local ===")
+    with ServidorEco() as srv, PoolConexiones(srv.host, srv.port, max_tamano=2) as pool:
+        for palabra in (b"uno", b"dos", b"tres"):
+            with pool.obtener() as conn:
+                print("Eco:", conn.enviar_ping(palabra))
+        print(f"Pedidos: 3, conexiones abiertas en el servidor: {srv.aceptadas}, reutilizadas: {pool.reutilizadas}")
+
+    print("\n=== Ejemplo 4c: Conexión asyncio con pipelining (async with) ===")
 
+    async def demo_async():
+        async with ServidorEcoAsincrono() as srv:
+            async with ConexionAsincrona(srv.host, srv.port) as conn:
+                print("Eco:", await conn.enviar_ping(b"hola"))
+                print("Pipeline:", await conn.pipeline([b"a", b"bb", b"ccc"]))
+    asyncio.run(demo_async())
 
+    print("\n=== Ejemplo 5: Rotación por tamaño (200 bytes, se conservan 3 segmentos) ===")
+    salida5 = Path("salida_rotativa.txt")
+    with GestorArchivo(salida5, mode="w", rotacion=PoliticaRotacion(max_bytes=200, conservar=3)) as f5:
+        f5.write_lines(f"Registro {i:03d} del lote de pruebas" for i in range(40))
+    print("Segmentos:", sorted(p.name for p in Path(".").glob(salida5.name + ".*")))
+    historial = list(GestorArchivo.leer_historial(salida5))
+    print(f"Historial legible: {len(historial)} líneas, de '{historial[0]}' a '{historial[-1]}'")
 
+    print("\n=== Ejemplo 6: Rastreo de recursos (quién se olvidó de close) ===")
+    recursos.activar()
+    with GestorArchivo("salida_con_with.txt") as ok:
+        ok.write_line("cerrado con with")
+    olvidado = ConexionSimulada(host="example.net", port=80)
+    del olvidado
+    gc.collect()
+    print(recursos.reporte())
+    try:
+        with recursos.rastrear():      # así se usaría en una prueba
+            GestorArchivo("salida_olvido.txt").write_line("sin close")
+    except recursos.FugaDeRecurso as e:
+        print("La prueba falla como corresponde:", str(e).splitlines()[0])
+    recursos.desactivar()
+
+    print("\n=== Fin de la demostración ===")
@@ -1,16 +1,296 @@
+# CAMBIO: faltaban los imports y el logger que usa la clase (el script no arrancaba).
+from pathlib import Path
+from datetime import datetime
+import atexit
+import csv
+import gc
+import io
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+import weakref
+
+from rotacion import ArchivoRotativo, PoliticaRotacion, leer_lineas  # NUEVO
+import recursos  # NUEVO: rastreo opcional de recursos (apagado = un if por llamada)
+
+log = logging.getLogger("bitacora")
+
+# NUEVO: niveles de durabilidad del commit
+#   "ninguna": las filas quedan en el buffer del archivo (el SO las recibe al llenarse o al cerrar)
+#   "flush":   cada commit pasa las filas al sistema operativo (comportamiento original)
+#   "fsync":   además fuerza al disco (sobrevive a un corte de luz; el más lento)
+DURABILIDADES = ("ninguna", "flush", "fsync")
+
+
+def _escribir_filas(fh, w, filas, durabilidad):
+    w.writerows(filas)
+    if durabilidad != "ninguna":
+        fh.flush()
+        if durabilidad == "fsync":
+            os.fsync(fh.fileno())
+
+
+# NUEVO: modo asíncrono. El hilo escritor NO guarda referencia a la Bitacora (recibe solo la
+# cola y el archivo), así el objeto puede recolectarse y __del__/atexit pueden drenar la cola.
+_FIN = object()    # centinela: vaciar lo que quede y terminar
+_ROTAR = object()  # NUEVO: confirmar lo juntado y rotar antes de la siguiente fila
+_ASINCRONAS = weakref.WeakSet()
+
+
+def _hilo_escritor(cola, fh, w, lote, durabilidad, errores):
+    """Saca de la cola todo lo disponible (hasta 'lote' filas) y lo confirma de una vez."""
+    def confirmar(filas):
+        try:
+            if filas: _escribir_filas(fh, w, filas, durabilidad)
+        except Exception as e:  # se reporta al productor en el siguiente evento / close()
+            errores.append(e)
+
+    while True:
+        item = cola.get()
+        tomados, filas, fin = 1, [], False
+        while True:
+            if item is _FIN:
+                fin = True; break
+            if item is _ROTAR:
+                confirmar(filas); filas = []
+                try: fh.rotar()
+                except Exception as e: errores.append(e)
+            else:
+                filas.append(item)
+                if len(filas) >= lote: break
+            try: item = cola.get_nowait()
+            except queue.Empty: break
+            tomados += 1
+        confirmar(filas)
+        for _ in range(tomados): cola.task_done()
+        if fin: return
+
+
+@atexit.register
+def _cerrar_asincronas():
+    for b in list(_ASINCRONAS):
+        try: b.close()
+        except Exception: pass
+
+
+# NUEVO: índice de consultas sobre el CSV (bitacora.csv -> bitacora.csv.idx.json)
+#   por_nombre: nombre -> offsets (bytes) de sus filas      -> "todas las entradas de Ana"
+#   por_fecha:  fecha  -> tramos [ini, fin) de bytes, cada uno en orden cronológico
+#               (búsqueda binaria dentro del tramo)          -> "eventos entre dos horas"
+#   dentro:     nombre -> "fecha hora" de su ENTRADA sin SALIDA -> ocupación en O(1)
+#   Al abrir se retoma desde el último byte indexado (filas agregadas sin índice se ponen al
+#   día); si el CSV es más corto que lo indexado (lo borraron/rotaron) se reconstruye.
+class IndiceBitacora:
+    FORMATO = 1
+
+    def __init__(self, ruta_csv, encoding="utf-8", antes_de_leer=None):
+        self.ruta = Path(ruta_csv)
+        self.ruta_indice = self.ruta.with_name(self.ruta.name + ".idx.json")
+        self.encoding = encoding
+        self._antes_de_leer = antes_de_leer   # p.ej. WeakMethod(bitacora.flush)
+        self._buf = io.StringIO(); self._csv = csv.writer(self._buf)
+        self._limpiar()
+        self._cargar()
+
+    def _limpiar(self):
+        self.bytes, self.ultima = 0, ""   # ultima: "fecha hora" de la última fila indexada
+        self.por_nombre, self.por_fecha, self.dentro = {}, {}, {}
+
+    def reiniciar(self, bytes_cabecera):
+        """El CSV rotó: se empieza a indexar el segmento nuevo; 'dentro' se conserva."""
+        self.bytes = bytes_cabecera
+        self.por_nombre, self.por_fecha = {}, {}
+
+    def _cargar(self):
+        try:
+            datos = json.loads(self.ruta_indice.read_text(encoding="utf-8"))
+            if datos.get("formato") == self.FORMATO:
+                self.bytes, self.ultima = datos["bytes"], datos["ultima"]
+                self.por_nombre, self.por_fecha, self.dentro = datos["por_nombre"], datos["por_fecha"], datos["dentro"]
+        except (OSError, ValueError, KeyError):
+            self._limpiar()
+        tam = self.ruta.stat().st_size if self.ruta.exists() else 0
+        if self.bytes > tam:
+            log.warning("Índice desfasado de %s: se reconstruye.", self.ruta.name); self._limpiar()
+        if self.bytes < tam:
+            self._indexar_archivo()
+
+    def _indexar_archivo(self):
+        """Indexa las filas completas desde self.bytes hasta el final del CSV."""
+        with open(self.ruta, "rb") as f:
+            f.seek(self.bytes)
+            for linea in f:
+                if not linea.endswith(b"\n"):
+                    break                      # fila a medio escribir: se indexará después
+                if self.bytes == 0:            # cabecera
+                    self.bytes = len(linea); continue
+                fila = next(csv.reader([linea.decode(self.encoding)]), [])
+                self._agregar(fila, len(linea))
+
+    def _agregar(self, fila, largo):
+        off = self.bytes
+        self.bytes += largo
+        if len(fila) != 4:
+            return
+        fecha, hora, nombre, tipo = fila
+        marca = f"{fecha} {hora}"
+        self.por_nombre.setdefault(nombre, []).append(off)
+        tramos = self.por_fecha.setdefault(fecha, [])
+        if tramos and tramos[-1][1] == off and marca >= self.ultima:
+            tramos[-1][1] = self.bytes
+        else:
+            tramos.append([off, self.bytes])   # fecha nueva o reloj que retrocedió
+        self.ultima = marca
+        if tipo == "ENTRADA":
+            self.dentro[nombre] = marca
+        else:
+            self.dentro.pop(nombre, None)
+
+    def agregar(self, fila):
+        """Anota una fila que la Bitacora acaba de agregar (mismo formato que csv.writer)."""
+        self._buf.seek(0); self._buf.truncate()
+        self._csv.writerow(fila)
+        self._agregar(fila, len(self._buf.getvalue().encode(self.encoding)))
+
+    def guardar(self):
+        tmp = self.ruta_indice.with_name(self.ruta_indice.name + ".tmp")
+        tmp.write_text(json.dumps({"formato": self.FORMATO, "bytes": self.bytes, "ultima": self.ultima, "por_nombre": self.por_nombre,
+                                   "por_fecha": self.por_fecha, "dentro": self.dentro}, ensure_ascii=False),
+                       encoding="utf-8")
+        os.replace(tmp, self.ruta_indice)  # nunca queda un índice a medio escribir
+
+    # ---- consultas ----
+    def ocupacion(self):
+        return len(self.dentro)
+
+    def esta_dentro(self, nombre):
+        return nombre.strip() in self.dentro
+
+    def presentes(self):
+        """{nombre: "fecha hora" de su entrada}, ordenado por hora de entrada."""
+        return dict(sorted(self.dentro.items(), key=lambda kv: kv[1]))
+
+    def _leer(self):
+        antes = self._antes_de_leer() if self._antes_de_leer else None
+        if antes:
+            antes()                            # que lo pendiente de la Bitacora llegue al archivo
+        return open(self.ruta, "rb")
+
+    def de_nombre(self, nombre):
+        """Filas (fecha, hora, nombre, tipo) de una persona, en orden."""
+        offsets = self.por_nombre.get(nombre.strip(), [])
+        if not offsets:
+            return []
+        with self._leer() as f:
+            filas = []
+            for off in offsets:
+                f.seek(off)
+                filas.append(self._fila(f.readline()))
+            return filas
+
+    def _fila(self, linea):
+        return tuple(next(csv.reader([linea.decode(self.encoding)])))
+
+    def _buscar(self, f, ini, fin, desde):
+        """Offset (inicio de línea) a partir del cual las filas del tramo son >= desde."""
+        lo, hi = ini, fin
+        while hi - lo > 4096:                  # el resto se recorre de corrido
+            mid = (lo + hi) // 2
+            f.seek(mid); f.readline()          # saltar la línea partida
+            pos = f.tell()
+            if pos >= hi:
+                hi = mid; continue
+            fila = self._fila(f.readline())
+            if f"{fila[0]} {fila[1]}" < desde:
+                lo = pos
+            else:
+                hi = mid
+        return lo
+
+    def entre(self, desde, hasta):
+        """Filas con desde <= "fecha hora" <= hasta (datetime o texto "AAAA-MM-DD HH:MM:SS")."""
+        desde, hasta = (d.strftime("%Y-%m-%d %H:%M:%S") if isinstance(d, datetime) else d for d in (desde, hasta))
+        filas = []
+        with self._leer() as f:
+            for fecha in sorted(fe for fe in self.por_fecha if desde[:10] <= fe <= hasta[:10]):
+                for ini, fin in self.por_fecha[fecha]:
+                    for fila in self._filas(f, self._buscar(f, ini, fin, desde), fin):
+                        marca = f"{fila[0]} {fila[1]}"
+                        if marca > hasta:
+                            break
+                        if marca >= desde:
+                            filas.append(tuple(fila))
+        return filas
+
+    def _filas(self, f, pos, fin, bloque=1 << 18):
+        """Filas entre pos y fin, leídas por bloques (no una lectura por línea)."""
+        f.seek(pos)
+        resto = b""
+        while pos < fin:
+            datos = resto + f.read(min(bloque, fin - pos))
+            pos += len(datos) - len(resto)
+            corte = datos.rfind(b"\n") + 1 if pos < fin else len(datos)
+            datos, resto = datos[:corte], datos[corte:]
+            yield from csv.reader(datos.decode(self.encoding).splitlines())
+
 
 class Bitacora:
-    """Constructor abre/crea CSV; destructor cierra como respaldo; with garantiza cierre."""
+    """Constructor abre/crea CSV; destructor cierra como respaldo; with garantiza cierre.
+    # NUEVO: group commit. Con lote=1 cada evento se confirma al momento (como antes); con
+    #        lote>1 los eventos se acumulan en memoria y se confirman juntos al llegar a 'lote'
+    #        filas o cuando la más antigua lleva 'max_retraso' segundos (se revisa en cada
+    #        evento), y siempre en flush()/close()/__exit__/__del__.
+    # NUEVO: asincrono=True. entrada()/salida() solo encolan (cola acotada de 'capacidad');
+    #        un hilo escritor confirma de una vez todo lo que encuentre en la cola (hasta 'lote'
+    #        filas; con lote=1, hasta 'capacidad'). Si la cola está llena el productor espera
+    #        (contrapresión) hasta 'espera_max' segundos (None = sin límite) y luego TimeoutError.
+    #        close() encola el fin y espera al hilo: todo lo encolado queda escrito.
+    # NUEVO: indexar=True mantiene self.indice (IndiceBitacora) al día con cada evento y lo
+    #        guarda al cerrar.
+    # NUEVO: rotacion=PoliticaRotacion(max_bytes, diaria, conservar). Cada segmento empieza con
+    #        la cabecera; los viejos se comprimen en segundo plano y Bitacora.historial() los lee
+    #        en orden. El índice cubre el segmento activo (la ocupación sigue entre segmentos)."""
     HEAD = ["fecha", "hora", "nombre", "tipo"]  # tipo: ENTRADA | SALIDA
 
-    def __init__(self, ruta="bitacora.csv", encoding="utf-8"):
+    def __init__(self, ruta="bitacora.csv", encoding="utf-8", lote=1, max_retraso=1.0, durabilidad="flush",
+                 asincrono=False, capacidad=10000, espera_max=None, indexar=False, rotacion=None):
+        if durabilidad not in DURABILIDADES:
+            raise ValueError(f"durabilidad debe ser una de {DURABILIDADES}.")
         self.ruta = Path(ruta)
         self._cerrado = False
-        self._fh = open(self.ruta, "a", encoding=encoding, newline="")
+        self.lote, self.max_retraso, self.durabilidad = max(1, lote), max_retraso, durabilidad
+        self._pendientes = []      # filas aún no confirmadas
+        self._desde = 0.0          # monotonic de la fila pendiente más antigua
+        self._marca_cache = (None, None)  # (segundo, (fecha, hora)): caché de strftime
+        self.encoding, self._rotativo = encoding, rotacion is not None
+        if self._rotativo:
+            self._fh = ArchivoRotativo(self.ruta, rotacion, encoding=encoding, newline="",
+                                       cabecera=",".join(self.HEAD) + "\r\n")
+        else:
+            self._fh = open(self.ruta, "a", encoding=encoding, newline="")
         self._w = csv.writer(self._fh)
         if self.ruta.stat().st_size == 0:
             self._w.writerow(self.HEAD); self._fh.flush()
-        log.info(f"Bitácora lista: {self.ruta.resolve()}")
+        self.indice = None
+        if indexar:
+            self.indice = IndiceBitacora(self.ruta, encoding, antes_de_leer=weakref.WeakMethod(self.flush))
+        self._cola, self._hilo, self._errores = None, None, []
+        if asincrono:
+            self.espera_max = espera_max
+            self._lock = threading.Lock()  # mismo orden en la cola, en el índice y en la rotación
+            self._cola = queue.Queue(maxsize=max(1, capacidad))
+            self._hilo = threading.Thread(target=_hilo_escritor, daemon=True, name=f"bitacora-{self.ruta.name}",
+                                          args=(self._cola, self._fh, self._w, self.lote if self.lote > 1 else capacidad,
+                                                durabilidad, self._errores))
+            self._hilo.start()
+            _ASINCRONAS.add(self)
+        if recursos.ACTIVO:
+            recursos.registrar(self, str(self.ruta))
+        log.info("Bitácora lista: %s", self.ruta.resolve())
 
     def entrada(self, nombre: str):
         self._reg(nombre, "ENTRADA")
@@ -18,34 +298,203 @@ class Bitacora:
     def salida(self, nombre: str):
         self._reg(nombre, "SALIDA")
 
+    def _marca(self):
+        """# NUEVO: fecha/hora formateadas una vez por segundo (no dos strftime por evento)."""
+        seg = int(time.time())
+        previo, fecha_hora = self._marca_cache  # una sola tupla: seguro con varios hilos productores
+        if seg != previo:
+            ahora = datetime.fromtimestamp(seg)
+            fecha_hora = (ahora.strftime("%Y-%m-%d"), ahora.strftime("%H:%M:%S"))
+            self._marca_cache = (seg, fecha_hora)
+        return fecha_hora
+
     def _reg(self, nombre: str, tipo: str):
+        if self._cerrado:
+            raise RuntimeError("Bitácora cerrada.")
         nombre = nombre.strip()
         if not nombre or any(c in nombre for c in "\r\n"):
             raise ValueError("Nombre inválido.")
-        ahora = datetime.now()
-        self._w.writerow([ahora.strftime("%Y-%m-%d"),
-                          ahora.strftime("%H:%M:%S"),
-                          nombre, tipo])
-        self._fh.flush()
-        log.info(f"{tipo}: {nombre}")
+        fecha, hora = self._marca()
+        fila = (fecha, hora, nombre, tipo)
+        if self._cola is not None:
+            self._revisar_error()
+            with self._lock:
+                if self._rotativo and self._fh.reservar(self._largo(fila), fecha):
+                    self._cola.put(_ROTAR)   # sin espera_max: es control, no un evento
+                    self._al_rotar()
+                self._encolar(fila)
+                if self.indice is not None:
+                    self.indice.agregar(fila)
+            log.info("%s: %s", tipo, nombre)
+            return
+        if self._rotativo and self._fh.reservar(self._largo(fila), fecha):
+            self.flush(); self._fh.rotar(); self._al_rotar()
+        if not self._pendientes:
+            self._desde = time.monotonic()
+        self._pendientes.append(fila)
+        if self.indice is not None:
+            self.indice.agregar(fila)
+        if len(self._pendientes) >= self.lote or time.monotonic() - self._desde >= self.max_retraso:
+            self.flush()
+        log.info("%s: %s", tipo, nombre)
+
+    def _largo(self, fila):
+        """Bytes de la fila en el CSV (exacto salvo que csv tenga que entrecomillar)."""
+        return len(fila[0]) + len(fila[1]) + len(fila[2].encode(self.encoding)) + len(fila[3]) + 5
+
+    def _al_rotar(self):
+        if self.indice is not None:
+            self.indice.reiniciar(self._fh.inicial)
+
+    @classmethod
+    def historial(cls, ruta="bitacora.csv", encoding="utf-8"):
+        """# NUEVO: filas de todos los segmentos (más viejo primero) y del archivo activo."""
+        for fila in csv.reader(leer_lineas(ruta, encoding)):
+            if fila and fila != cls.HEAD:
+                yield tuple(fila)
+
+    def _encolar(self, fila):
+        try: self._cola.put(fila, timeout=self.espera_max)
+        except queue.Full: raise TimeoutError(f"Cola de la bitácora llena ({self._cola.maxsize} eventos).") from None
+
+    def flush(self):
+        """# NUEVO: confirma las filas pendientes según la durabilidad elegida.
+        (modo asíncrono: espera a que el hilo escritor vacíe la cola)."""
+        if self._cerrado:
+            return
+        if self._cola is not None:
+            self._cola.join(); self._revisar_error(); return
+        if self._pendientes:
+            _escribir_filas(self._fh, self._w, self._pendientes, self.durabilidad)
+            self._pendientes.clear()
+
+    def pendientes(self):
+        """# NUEVO: eventos aún no confirmados (en memoria o en la cola)."""
+        return self._cola.qsize() if self._cola is not None else len(self._pendientes)
+
+    def _revisar_error(self):
+        # CAMBIO: cada error se informa UNA vez (se saca de la lista): tras un fallo pasajero
+        # la bitácora sigue usable; las filas de ese lote se perdieron y se avisa cuántos fallos hubo.
+        if self._errores:
+            errores = self._errores[:]
+            del self._errores[:len(errores)]  # el hilo escritor solo agrega al final
+            extra = f" (y {len(errores) - 1} más)" if len(errores) > 1 else ""
+            raise OSError(f"Falló la escritura en segundo plano: {errores[0]}{extra}") from errores[0]
+
+    def _detener_hilo(self):
+        if self._hilo is not None:
+            self._cola.put(_FIN)   # detrás de todo lo ya encolado
+            self._hilo.join()
+            self._hilo = None
+            _ASINCRONAS.discard(self)
 
     def close(self):
         if not self._cerrado:
-            try: self._fh.close(); log.info("CSV cerrado.")
+            if recursos.ACTIVO:
+                recursos.liberado(self)
+            try:
+                self._detener_hilo(); self.flush(); self._fh.close(); log.info("CSV cerrado.")
+                if self.indice is not None: self.indice.guardar()
             finally: self._cerrado = True
+            self._revisar_error()
 
     def __enter__(self): return self
     def __exit__(self, *_): self.close(); return False
 
     def __del__(self):
         if hasattr(self, "_cerrado") and not self._cerrado:
-            try: self._fh.close(); log.warning("Cierre automático en __del__.")
+            if recursos.ACTIVO:
+                recursos.liberado(self, "__del__")
+            try:
+                self._detener_hilo(); self.flush(); self._fh.close(); log.warning("Cierre automático en __del__.")
+                if self.indice is not None: self.indice.guardar()
             except Exception: pass
             finally: self._cerrado = True
 
 
+# --------- BENCHMARK (NUEVO) ---------
+# python Metodo_Construtor_Destructor_BITACORA-INGRESO.py --bench [eventos]
+def benchmark(n=20000):
+    import tempfile
+    casos = [("por evento (lote=1)", dict(lote=1)),
+             ("lote=100", dict(lote=100)),
+             ("lote=1000", dict(lote=1000)),
+             ("fsync por evento", dict(lote=1, durabilidad="fsync")),
+             ("fsync lote=1000", dict(lote=1000, durabilidad="fsync")),
+             ("asíncrono", dict(asincrono=True)),
+             ("asíncrono fsync", dict(asincrono=True, durabilidad="fsync"))]
+    with tempfile.TemporaryDirectory() as tmp:
+        for nombre, opciones in casos:
+            m = n // 10 if opciones.get("durabilidad") == "fsync" and opciones.get("lote") == 1 else n
+            ruta = Path(tmp) / f"{nombre.replace(' ', '_')}.csv"
+            t0 = time.perf_counter()
+            with Bitacora(ruta, max_retraso=60, **opciones) as b:
+                for i in range(m):
+                    (b.entrada if i % 2 == 0 else b.salida)(f"Persona {i % 50}")
+                t_llamador = time.perf_counter() - t0   # lo que bloquea al código de la puerta
+            dt = time.perf_counter() - t0                # incluye vaciar la cola al cerrar
+            filas = sum(1 for _ in ruta.open(encoding="utf-8")) - 1
+            assert filas == m, (nombre, filas, m)
+            print(f"{nombre:<22} {m:>7} eventos  {m / dt:>12,.0f} eventos/s  "
+                  f"(llamador: {t_llamador / m * 1e6:6.2f} µs/evento)")
+
+
+# python Metodo_Construtor_Destructor_BITACORA-INGRESO.py --bench-indice [eventos]
+def benchmark_indice(n=200000):
+    """Consultas con índice vs. releer todo el CSV (como había que hacerlo antes)."""
+    import tempfile
+
+    def escanear(ruta):
+        with open(ruta, encoding="utf-8", newline="") as f:
+            lector = csv.reader(f); next(lector)
+            yield from lector
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = Path(tmp) / "bitacora.csv"
+        inicio = int(time.time()) - 2 * n       # un evento cada 2 s (varios días de historia)
+        with open(ruta, "w", encoding="utf-8", newline="") as f:
+            w = csv.writer(f); w.writerow(Bitacora.HEAD)
+            for i in range(n):
+                t = datetime.fromtimestamp(inicio + 2 * i)
+                w.writerow((t.strftime("%Y-%m-%d"), t.strftime("%H:%M:%S"), f"Persona {i % 500}",
+                            "ENTRADA" if (i // 500) % 2 == 0 else "SALIDA"))
+        t0 = time.perf_counter(); IndiceBitacora(ruta).guardar(); t_crear = time.perf_counter() - t0
+        with Bitacora(ruta, indexar=True) as b:  # a partir de aquí se actualiza con cada evento
+            b.entrada("Visitante")
+        t0 = time.perf_counter(); idx = IndiceBitacora(ruta); t_abrir = time.perf_counter() - t0
+
+        def medir(nombre, sin, con):
+            t0 = time.perf_counter(); a = sin(); t1 = time.perf_counter(); c = con(); t2 = time.perf_counter()
+            assert a == c, nombre
+            print(f"{nombre:<26} escaneo {(t1 - t0) * 1000:9.2f} ms   índice {(t2 - t1) * 1000:9.3f} ms")
+
+        def ocupacion_escaneo():
+            dentro = set()
+            for _, _, nombre, tipo in escanear(ruta):
+                (dentro.add if tipo == "ENTRADA" else dentro.discard)(nombre)
+            return len(dentro)
+
+        print(f"{n + 1} eventos; crear índice: {t_crear * 1000:.0f} ms, abrir el guardado: {t_abrir * 1000:.1f} ms")
+        medir("ocupación", ocupacion_escaneo, idx.ocupacion)
+        medir("filas de 'Persona 7'", lambda: [tuple(f) for f in escanear(ruta) if f[2] == "Persona 7"],
+              lambda: idx.de_nombre("Persona 7"))
+        medio = datetime.fromtimestamp(inicio + n)
+        desde, hasta = medio.strftime("%Y-%m-%d %H:%M:%S"), (medio.replace(minute=59, second=59)).strftime("%Y-%m-%d %H:%M:%S")
+        medir("eventos de una hora", lambda: [tuple(f) for f in escanear(ruta) if desde <= f"{f[0]} {f[1]}" <= hasta],
+              lambda: idx.entre(desde, hasta))
+
+
 # --------- DEMOSTRACION -EJEMPLO ---------
 if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        i = sys.argv.index("--bench")
+        benchmark(int(sys.argv[i + 1]) if len(sys.argv) > i + 1 else 20000)
+        sys.exit(0)
+    if "--bench-indice" in sys.argv:
+        i = sys.argv.index("--bench-indice")
+        benchmark_indice(int(sys.argv[i + 1]) if len(sys.argv) > i + 1 else 200000)
+        sys.exit(0)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     print("== with (cierre garantizado) ==")
     with Bitacora("bitacora_demo.csv") as b:
         b.entrada("Ana Pérez"); b.entrada("Carlos Ramírez")
@@ -56,3 +505,26 @@ if __name__ == "__main__":
     b2 = Bitacora("bitacora_demo.csv"); b2.entrada("María López")
     del b2; gc.collect()
     print(Path("bitacora_demo.csv").read_text(encoding="utf-8"))
+
+    print("\n== group commit: lote=3 (se confirma cada 3 eventos y al cerrar) ==")
+    with Bitacora("bitacora_demo.csv", lote=3) as b3:
+        for n in ("Luis", "Eva", "Juan", "Rosa"): b3.entrada(n)
+        print("Pendientes antes de cerrar:", len(b3._pendientes))
+
+    print("\n== asíncrono: un hilo escribe, close() vacía la cola ==")
+    with Bitacora("bitacora_demo.csv", asincrono=True, capacidad=100) as b4:
+        for n in ("Pablo", "Lucía", "Pedro"): b4.entrada(n)
+        print("En cola al cerrar:", b4.pendientes())
+    print(Path("bitacora_demo.csv").read_text(encoding="utf-8"))
+
+    print("\n== consultas con índice (bitacora_demo.csv.idx.json) ==")
+    with Bitacora("bitacora_demo.csv", indexar=True) as b5:
+        b5.salida("Luis"); b5.salida("Pablo")
+        print("Dentro ahora:", b5.indice.ocupacion(), list(b5.indice.presentes()))
+        print("Filas de Ana Pérez:", b5.indice.de_nombre("Ana Pérez"))
+
+    print("\n== rotación: segmentos de ~300 bytes, se conservan 2 (gzip en segundo plano) ==")
+    with Bitacora("bitacora_rotativa.csv", rotacion=PoliticaRotacion(max_bytes=300, conservar=2)) as b6:
+        for i in range(20): (b6.entrada if i % 2 == 0 else b6.salida)(f"Visitante {i // 2}")
+    print("Segmentos:", sorted(p.name for p in Path(".").glob("bitacora_rotativa.csv.*")))
+    print("Historial desde el segmento más viejo:", list(Bitacora.historial("bitacora_rotativa.csv"))[:2], "...")
@@ -0,0 +1,179 @@
+# recursos.py  (Semana 07: rastreo de recursos de GestorArchivo, LectorArchivo, ConexionSimulada y Bitacora)
+# Requisito: esas clases cierran en __del__ lo que nadie cerró; a escala eso deja descriptores
+#            abiertos hasta que pasa el recolector. Queremos ver qué queda abierto, cuánto vive
+#            cada recurso y quién se olvidó de close().
+# Decisión: - Apagado por defecto. Las clases solo preguntan "if recursos.ACTIVO:" en __init__,
+#             close() y __del__ (una lectura de atributo: costo despreciable).
+#           - Encendido: registrar() guarda tipo, descripción, hora de creación y la pila de quien
+#             lo creó (solo archivo/línea/función; el código fuente se lee al reportar);
+#             liberado() lo saca del registro y acumula la vida útil por tipo.
+#           - Si lo libera __del__ (y no close()) es una FUGA y se registra en el log con la pila
+#             de creación. El modo decide si las fugas son fallas: con "error", verificar()
+#             (y rastrear() al salir) lanza FugaDeRecurso; con "advertir" solo las reporta.
+#             (Una excepción dentro de __del__ se ignora: por eso se falla después, no ahí.)
+#   Uso en pruebas:
+#       with recursos.rastrear():          # estricto: falla si algo quedó abierto o lo cerró __del__
+#           ...código bajo prueba...
+#   Sin tocar código:  RASTREO_RECURSOS=1 python script.py   (reporte al salir)
+
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Dict, List, NamedTuple
+import atexit
+import gc
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+
+log = logging.getLogger("recursos")
+
+ACTIVO = False
+MODOS = ("advertir", "error")
+
+
+class FugaDeRecurso(AssertionError):
+    """Algún recurso no se cerró con close()/with."""
+
+
+class _Registro(NamedTuple):
+    tipo: str
+    descripcion: str
+    creado: float
+    pila: list   # [(archivo, línea, función)] del más interno al más externo
+
+    def texto_pila(self) -> str:
+        marcos = traceback.StackSummary.from_list([(a, l, f, None) for a, l, f in reversed(self.pila)])
+        return "".join(marcos.format()).rstrip()
+
+
+class _Estado:
+    def __init__(self):
+        self.modo = "advertir"
+        self.profundidad = 8
+        self.vivos: Dict[int, _Registro] = {}
+        self.vidas: Dict[str, list] = {}      # tipo -> [cerrados, suma, máximo, por __del__]
+        self.fugas: List[str] = []
+        self.lock = threading.Lock()
+
+
+_E = _Estado()
+
+
+def activar(modo: str = "advertir", profundidad: int = 8) -> None:
+    """Empieza a rastrear (solo los recursos creados desde ahora)."""
+    global ACTIVO
+    if modo not in MODOS:
+        raise ValueError(f"modo debe ser uno de {MODOS}.")
+    _E.modo, _E.profundidad = modo, profundidad
+    ACTIVO = True
+
+
+def desactivar() -> None:
+    global ACTIVO
+    ACTIVO = False
+
+
+def reiniciar() -> None:
+    with _E.lock:
+        _E.vivos.clear(); _E.vidas.clear(); _E.fugas.clear()
+
+
+def registrar(obj, descripcion: str = "") -> None:
+    # Se salta registrar() y todos los __init__ de obj (una subclase llama a super().__init__).
+    marco, pila = sys._getframe(1), []
+    while marco is not None and marco.f_code.co_name == "__init__" and marco.f_locals.get("self") is obj:
+        marco = marco.f_back
+    while marco is not None and len(pila) < _E.profundidad:
+        pila.append((marco.f_code.co_filename, marco.f_lineno, marco.f_code.co_name))
+        marco = marco.f_back
+    with _E.lock:
+        _E.vivos[id(obj)] = _Registro(type(obj).__name__, descripcion, time.monotonic(), pila)
+
+
+def liberado(obj, via: str = "close") -> None:
+    """via: "close" (bien) o "__del__" (fuga: nadie lo cerró)."""
+    with _E.lock:
+        reg = _E.vivos.pop(id(obj), None)
+        if reg is None:
+            return                     # creado antes de activar, o ya liberado
+        vida = time.monotonic() - reg.creado
+        v = _E.vidas.setdefault(reg.tipo, [0, 0.0, 0.0, 0])
+        v[0] += 1; v[1] += vida; v[2] = max(v[2], vida)
+        if via != "__del__":
+            return
+        v[3] += 1
+        msg = (f"{reg.tipo}({reg.descripcion}) lo cerró __del__ tras {vida:.3f} s; "
+               f"creado en:\n{reg.texto_pila()}")
+        _E.fugas.append(msg)
+    log.warning("Fuga de recurso: %s", msg)
+
+
+def abiertos() -> Dict[str, int]:
+    """Cantidad de recursos vivos por tipo."""
+    cuenta: Dict[str, int] = {}
+    with _E.lock:
+        for reg in _E.vivos.values():
+            cuenta[reg.tipo] = cuenta.get(reg.tipo, 0) + 1
+    return cuenta
+
+
+def fugas() -> List[str]:
+    return list(_E.fugas)
+
+
+def reporte() -> str:
+    ahora = time.monotonic()
+    with _E.lock:
+        vivos, vidas, n_fugas = list(_E.vivos.values()), dict(_E.vidas), len(_E.fugas)
+    lineas = [f"{'tipo':<20}{'abiertos':>9}{'cerrados':>10}{'por __del__':>12}{'vida media':>12}{'vida máx':>11}"]
+    for tipo in sorted({r.tipo for r in vivos} | vidas.keys()):
+        cerrados, suma, maximo, por_del = vidas.get(tipo, [0, 0.0, 0.0, 0])
+        n_vivos = sum(1 for r in vivos if r.tipo == tipo)
+        media = f"{suma / cerrados * 1000:.2f} ms" if cerrados else "-"
+        lineas.append(f"{tipo:<20}{n_vivos:>9}{cerrados:>10}{por_del:>12}{media:>12}{maximo * 1000:>8.2f} ms")
+    for r in sorted(vivos, key=lambda r: r.creado)[:10]:
+        donde = f"{os.path.basename(r.pila[0][0])}:{r.pila[0][1]}" if r.pila else "?"
+        lineas.append(f"  abierto hace {ahora - r.creado:.3f} s: {r.tipo}({r.descripcion}) creado en {donde}")
+    if n_fugas:
+        lineas.append(f"{n_fugas} fuga(s): recursos cerrados por __del__ en vez de close()/with.")
+    return "\n".join(lineas)
+
+
+def verificar(incluir_abiertos: bool = True) -> List[str]:
+    """
+    Problemas encontrados: fugas y, con incluir_abiertos, lo que sigue abierto.
+    En modo "error" lanza FugaDeRecurso si hay alguno; en modo "advertir" los devuelve.
+    """
+    gc.collect()  # que los olvidados pasen por __del__ y queden anotados
+    problemas = fugas()
+    if incluir_abiertos:
+        with _E.lock:
+            problemas += [f"{r.tipo}({r.descripcion}) sigue abierto; creado en:\n{r.texto_pila()}"
+                          for r in _E.vivos.values()]
+    if problemas and _E.modo == "error":
+        raise FugaDeRecurso(f"{len(problemas)} recurso(s) sin cerrar con close():\n\n" + "\n\n".join(problemas))
+    return problemas
+
+
+@contextmanager
+def rastrear(modo: str = "error", incluir_abiertos: bool = True):
+    """Rastrea solo dentro del bloque y verifica al salir (en modo "error", falla si hubo fugas)."""
+    anterior = (ACTIVO, _E.modo)
+    reiniciar()
+    activar(modo)
+    try:
+        yield _E
+        verificar(incluir_abiertos)
+    finally:
+        if anterior[0]:
+            activar(anterior[1])
+        else:
+            desactivar()
+
+
+if os.environ.get("RASTREO_RECURSOS"):
+    activar(os.environ["RASTREO_RECURSOS"] if os.environ["RASTREO_RECURSOS"] in MODOS else "advertir")
+    atexit.register(lambda: print("\n[RASTREO_RECURSOS]\n" + reporte()))
@@ -0,0 +1,237 @@
+# rotacion.py  (Semana 07: lo usan Bitacora y GestorArchivo)
+# Requisito: bitacora.csv y los archivos de GestorArchivo crecen para siempre y cualquier
+#            lector termina recorriendo toda la historia.
+# Decisión: - PoliticaRotacion: tamaño máximo (max_bytes), corte diario y cuántos segmentos
+#             rotados se conservan.
+#           - ArchivoRotativo se comporta como el archivo abierto (write/flush/fileno/close) y
+#             por dentro cambia de handle al rotar: el csv.writer de Bitacora no se entera.
+#           - reservar() solo lleva la cuenta (bytes y fecha del segmento) y dice si toca rotar;
+#             rotar() mueve el archivo. Así Bitacora decide en el hilo productor y el hilo
+#             escritor ejecuta, en el mismo orden que las filas.
+#           - Segmentos: <nombre>.<AAAA-MM-DD de inicio>.<secuencia 6 dígitos>[.gz]. La secuencia
+#             da el orden; un solo hilo de fondo comprime con gzip y después aplica la retención
+#             (en serie, nunca se borra algo que se está comprimiendo).
+#           - leer_lineas(): recorre segmentos (gz o no) y el archivo activo, en orden, en streaming.
+#           - El hilo compresor se apaga con atexit (esperando lo pendiente); una rotación posterior
+#             (p.ej. el vaciado final de Bitacora) comprime en el propio hilo.
+
+from __future__ import annotations
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Iterator, List, Optional
+import atexit
+import gzip
+import logging
+import os
+import re
+import shutil
+import threading
+
+log = logging.getLogger("rotacion")
+
+_COMPRESOR: Optional[ThreadPoolExecutor] = None
+_LOCK = threading.Lock()
+
+
+def _compresor() -> ThreadPoolExecutor:
+    global _COMPRESOR
+    with _LOCK:
+        if _COMPRESOR is None:
+            _COMPRESOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rotacion-gzip")
+        return _COMPRESOR
+
+
+@atexit.register
+def cerrar_compresor() -> None:
+    """Espera las compresiones pendientes y apaga el hilo (idempotente)."""
+    global _COMPRESOR
+    with _LOCK:
+        compresor, _COMPRESOR = _COMPRESOR, None
+    if compresor is not None:
+        compresor.shutdown(wait=True)
+
+
+class PoliticaRotacion:
+    """max_bytes=None: sin límite de tamaño; diaria: segmento nuevo al cambiar de día;
+    conservar: segmentos rotados que se guardan (None = todos); comprimir: gzip en segundo plano."""
+
+    def __init__(self, max_bytes: Optional[int] = None, diaria: bool = False,
+                 conservar: Optional[int] = 7, comprimir: bool = True):
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes debe ser positivo.")
+        if conservar is not None and conservar < 0:
+            raise ValueError("conservar no puede ser negativo.")
+        self.max_bytes, self.diaria, self.conservar, self.comprimir = max_bytes, diaria, conservar, comprimir
+
+    def __repr__(self):
+        return (f"PoliticaRotacion(max_bytes={self.max_bytes}, diaria={self.diaria}, "
+                f"conservar={self.conservar}, comprimir={self.comprimir})")
+
+
+def _patron(ruta: Path):
+    return re.compile(re.escape(ruta.name) + r"\.(\d{4}-\d{2}-\d{2})\.(\d{6})(\.gz)?$")
+
+
+def segmentos(ruta: str | Path) -> List[Path]:
+    """Segmentos rotados de 'ruta', del más viejo al más nuevo (sin el archivo activo)."""
+    ruta = Path(ruta)
+    patron, vistos = _patron(ruta), {}
+    try:
+        nombres = os.listdir(ruta.parent or ".")
+    except FileNotFoundError:
+        return []
+    for n in nombres:
+        m = patron.match(n)
+        if m:
+            clave = int(m.group(2))
+            # Mientras se comprime pueden coexistir "x" y "x.gz": se prefiere el plano (y si
+            # desaparece al abrirlo, leer_lineas prueba con el .gz).
+            if clave not in vistos or not m.group(3):
+                vistos[clave] = ruta.with_name(n)
+    return [vistos[k] for k in sorted(vistos)]
+
+
+def _abrir_segmento(seg: Path, encoding: str):
+    try:
+        if seg.suffix == ".gz":
+            return gzip.open(seg, "rt", encoding=encoding, newline="")
+        return open(seg, "r", encoding=encoding, newline="")
+    except FileNotFoundError:
+        if seg.suffix != ".gz":  # lo acaba de comprimir el hilo de fondo
+            return gzip.open(seg.with_name(seg.name + ".gz"), "rt", encoding=encoding, newline="")
+        raise
+
+
+def leer_lineas(ruta: str | Path, encoding: str = "utf-8", incluir_activo: bool = True) -> Iterator[str]:
+    """Líneas de todos los segmentos y luego del archivo activo, sin cargar nada entero."""
+    ruta = Path(ruta)
+    for seg in segmentos(ruta):
+        try:
+            with _abrir_segmento(seg, encoding) as f:
+                yield from f
+        except FileNotFoundError:
+            log.warning("Segmento %s eliminado durante la lectura (retención).", seg.name)
+    if incluir_activo and ruta.exists():
+        with open(ruta, "r", encoding=encoding, newline="") as f:
+            yield from f
+
+
+def _comprimir(seg: Path) -> None:
+    tmp = seg.with_name(seg.name + ".gz.tmp")
+    try:
+        origen = open(seg, "rb")
+    except FileNotFoundError:
+        return  # con muchas rotaciones seguidas la retención lo borró antes de comprimirlo
+    with origen, gzip.open(tmp, "wb") as destino:
+        shutil.copyfileobj(origen, destino, 1 << 20)
+    os.replace(tmp, seg.with_name(seg.name + ".gz"))
+    os.remove(seg)
+
+
+def _retener(ruta: Path, conservar: Optional[int]) -> None:
+    if conservar is None:
+        return
+    viejos = segmentos(ruta)
+    for seg in viejos[:max(0, len(viejos) - conservar)]:
+        for p in (seg, seg.with_name(seg.name + ".gz")):
+            try:
+                os.remove(p)
+            except FileNotFoundError:
+                pass
+        log.info("Retención: eliminado %s", seg.name)
+
+
+def _trabajo_rotado(seg: Path, ruta: Path, politica: PoliticaRotacion) -> None:
+    if politica.comprimir:
+        _comprimir(seg)
+    _retener(ruta, politica.conservar)
+
+
+class ArchivoRotativo:
+    """Archivo de texto de solo agregar que rota según 'politica'.
+    cabecera: texto que inicia cada segmento (p.ej. la fila de títulos del CSV)."""
+
+    def __init__(self, ruta: str | Path, politica: PoliticaRotacion, mode: str = "a",
+                 encoding: str = "utf-8", buffering: int = -1, newline: Optional[str] = None,
+                 cabecera: str = ""):
+        if mode not in ("a", "w"):
+            raise ValueError("ArchivoRotativo solo admite mode='a' o 'w'.")
+        self.ruta, self.politica = Path(ruta), politica
+        self.encoding, self._buffering, self._newline, self.cabecera = encoding, buffering, newline, cabecera
+        self.inicial = len(cabecera.encode(encoding))
+        self._trabajos: list = []
+        self._fechas_por_rotar = deque()  # fecha de inicio de cada segmento que reservar() mandó cerrar
+        self.fh = self._abrir(mode)
+        st = os.fstat(self.fh.fileno())
+        self._tam = st.st_size
+        self._fecha = (date.today() if self._tam <= self.inicial else date.fromtimestamp(st.st_mtime)).isoformat()
+
+    def _abrir(self, mode: str):
+        fh = open(self.ruta, mode, encoding=self.encoding, buffering=self._buffering, newline=self._newline)
+        if self.cabecera and os.fstat(fh.fileno()).st_size == 0:
+            fh.write(self.cabecera); fh.flush()
+        return fh
+
+    # ---- interfaz de archivo ----
+    def write(self, texto: str) -> int:
+        return self.fh.write(texto)
+
+    def flush(self) -> None:
+        self.fh.flush()
+
+    def fileno(self) -> int:
+        return self.fh.fileno()
+
+    @property
+    def closed(self) -> bool:
+        return self.fh.closed
+
+    # ---- rotación ----
+    def reservar(self, n_bytes: int, fecha: Optional[str] = None) -> bool:
+        """Anota n_bytes por escribir; True si ANTES de escribirlos hay que llamar a rotar()
+        (la cuenta ya corresponde al segmento nuevo)."""
+        p = self.politica
+        if p.diaria and fecha is None:
+            fecha = date.today().isoformat()
+        toca = self._tam > self.inicial and (
+            (p.max_bytes is not None and self._tam + n_bytes > p.max_bytes) or (p.diaria and fecha != self._fecha))
+        if toca:
+            self._fechas_por_rotar.append(self._fecha)
+            self._tam, self._fecha = self.inicial, fecha or date.today().isoformat()
+        elif fecha is not None and self._tam <= self.inicial:
+            self._fecha = fecha  # segmento aún vacío: toma la fecha de su primera fila
+        self._tam += n_bytes
+        return toca
+
+    def rotar(self) -> Optional[Path]:
+        """Cierra el segmento actual, lo renombra y abre uno vacío (con cabecera)."""
+        self.fh.close()
+        previos = segmentos(self.ruta)
+        seq = int(_patron(self.ruta).match(previos[-1].name).group(2)) + 1 if previos else 1
+        fecha = self._fechas_por_rotar.popleft() if self._fechas_por_rotar else self._fecha
+        seg = self.ruta.with_name(f"{self.ruta.name}.{fecha}.{seq:06d}")
+        os.replace(self.ruta, seg)
+        self.fh = self._abrir("a")
+        log.info("Rotado %s -> %s", self.ruta.name, seg.name)
+        self._trabajos = [t for t in self._trabajos if not t.done()]
+        if self.politica.comprimir:
+            try:
+                self._trabajos.append(_compresor().submit(_trabajo_rotado, seg, self.ruta, self.politica))
+            except RuntimeError:  # el intérprete se está cerrando: no se aceptan hilos nuevos
+                _trabajo_rotado(seg, self.ruta, self.politica)
+        else:
+            _retener(self.ruta, self.politica.conservar)
+        return seg
+
+    def esperar(self) -> None:
+        """Espera a que terminen la compresión y retención de lo rotado por este archivo."""
+        for t in self._trabajos:
+            t.result()
+        self._trabajos = []
+
+    def close(self) -> None:
+        if not self.fh.closed:
+            self.fh.close()
+        self.esperar()
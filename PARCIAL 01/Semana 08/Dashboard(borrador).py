@@ -9,6 +9,7 @@ se integra un **Panel de Tareas** para organizar la materia de POO:
 - Marcar como completada
 - Eliminar tarea
 - Persistencia en tareas.json (raíz del proyecto)
+  (CAMBIO: usa el mismo motor de tareas que el Dashboard de la raíz: nucleo_dashboard)
 
 Se mantienen:
 - Ver código de .py dentro de cada subcarpeta
@@ -18,22 +19,28 @@ Cambios marcados con:  # CAMBIO: ... / # NUEVO: ...
 """
 
 import os
+import sys
 import subprocess
 # NUEVO: imports para gestor de tareas
-import json
 from datetime import datetime
 
+# CAMBIO: el almacenamiento de tareas es el motor compartido del repo (nucleo_dashboard/),
+# con escritura atómica, diario por lotes e índices. Se agrega la raíz del repo al path.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from nucleo_dashboard.almacen_tareas import AlmacenTareas, ESTADOS, UNIDADES
+from nucleo_dashboard.visor_codigo import paginar  # NUEVO: visor de código paginado
+
 # ------------- BLOQUE ORIGINAL (con pequeños ajustes) -----------------
 
 def mostrar_codigo(ruta_script):
     # Asegúramos de que la ruta al script es absoluta
     ruta_script_absoluta = os.path.abspath(ruta_script)
+    # CAMBIO: visor paginado con resaltado (nucleo_dashboard.visor_codigo) en vez de imprimir
+    #         y devolver el archivo completo; devuelve True si se pudo mostrar.
     try:
-        with open(ruta_script_absoluta, 'r', encoding='utf-8') as archivo:  # CAMBIO: encoding explícito
-            codigo = archivo.read()
-            print(f"\n--- Código de {ruta_script} ---\n")
-            print(codigo)
-            return codigo
+        print(f"\n--- Código de {ruta_script} ---\n")
+        paginar(ruta_script_absoluta)
+        return True
     except FileNotFoundError:
         print("El archivo no se encontró.")
         return None
@@ -146,8 +153,8 @@ def mostrar_scripts(ruta_sub_carpeta):
                 idx = int(eleccion_script) - 1
                 if 0 <= idx < len(scripts):
                     ruta_script = os.path.join(ruta_sub_carpeta, scripts[idx])
-                    codigo = mostrar_codigo(ruta_script)
-                    if codigo:
+                    mostrado = mostrar_codigo(ruta_script)
+                    if mostrado:
                         ejecutar = input("¿Desea ejecutar el script? (1: Sí, 0: No): ").strip()
                         if ejecutar == '1':
                             ejecutar_codigo(ruta_script)
@@ -166,29 +173,23 @@ def mostrar_scripts(ruta_sub_carpeta):
 # NUEVO: Rutas y catálogos
 RUTA_BASE = os.path.dirname(__file__)
 RUTA_DB = os.path.join(RUTA_BASE, "tareas.json")
-ESTADOS = ["pendiente", "en progreso", "completada"]
-UNIDADES_LIST = ["UNIDAD 1", "UNIDAD 2", "UNIDAD 3", "UNIDAD 4"]  # ajustable
-
-# NUEVO: utilidades de persistencia
-def cargar_tareas():
-    """Carga la lista de tareas desde tareas.json (si no existe, devuelve [])."""
-    if not os.path.exists(RUTA_DB):
-        return []
-    try:
-        with open(RUTA_DB, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        print("Aviso: 'tareas.json' no es válido. Se iniciará una base vacía.")
-        return []
-
-def guardar_tareas(tareas):
-    """Guarda la lista de tareas en tareas.json, con indentación legible."""
-    with open(RUTA_DB, "w", encoding="utf-8") as f:
-        json.dump(tareas, f, ensure_ascii=False, indent=2)
-
-def generar_id(tareas):
-    """Genera un ID incremental sencillo basado en los existentes."""
-    return (max([t["id"] for t in tareas]) + 1) if tareas else 1
+# CAMBIO: mismas unidades que el Dashboard de la raíz (PARCIAL 01/02). Las tareas antiguas
+# con "UNIDAD 1..4" se migran una sola vez al abrir el almacén.
+UNIDADES_LIST = UNIDADES
+
+# CAMBIO: utilidades de persistencia -> un único almacén por sesión
+_almacen = None
+
+def obtener_almacen():
+    """Abre el almacén de tareas la primera vez y lo reutiliza (se recarga solo si cambió en disco)."""
+    global _almacen
+    if _almacen is None:
+        import atexit
+        _almacen = AlmacenTareas(RUTA_DB, lote=32)
+        atexit.register(_almacen.sincronizar)
+    else:
+        _almacen.refrescar()
+    return _almacen
 
 def validar_fecha(fecha):
     """Valida formato YYYY-MM-DD (devuelve True/False)."""
@@ -202,7 +203,6 @@ def validar_fecha(fecha):
 #solicitael (título, unidad, estado, fecha límite, nota) y la guardaen tarjetas.Json
 def crear_tarea():
     """Crea y persiste una nueva tarea."""
-    tareas = cargar_tareas()
     print("\n== Nueva tarea ==")
     titulo = input("Título: ").strip()
     if not titulo:
@@ -210,10 +210,10 @@ def crear_tarea():
         return
 
     print("Unidades disponibles:", ", ".join(UNIDADES_LIST))
-    unidad = input("Unidad (e.g., UNIDAD 1): ").strip().upper()
+    unidad = input("Unidad (e.g., PARCIAL 01): ").strip().upper()
     if unidad not in UNIDADES_LIST:
-        print("Unidad no reconocida. Se asignará 'UNIDAD 1'.")
-        unidad = "UNIDAD 1"
+        print("Unidad no reconocida. Se asignará 'PARCIAL 01'.")
+        unidad = "PARCIAL 01"
 
     print("Estados:", ", ".join(ESTADOS))
     estado = input("Estado [pendiente/en progreso/completada]: ").strip().lower()
@@ -228,40 +228,19 @@ def crear_tarea():
 
     nota = input("Nota (opcional): ").strip()
 
-    nueva = {
-        "id": generar_id(tareas),
-        "titulo": titulo,
-        "unidad": unidad,
-        "estado": estado,
-        "fecha_limite": fecha_limite,
-        "nota": nota
-    }
-    tareas.append(nueva)
-    guardar_tareas(tareas)
+    nueva = obtener_almacen().crear(titulo, unidad, estado, fecha_limite, nota)
     print(f"✔ Tarea creada con id={nueva['id']}")
 
 def listar_tareas(filtro_estado=None, filtro_unidad=None, solo_pendientes_proximas=False):
     """Lista tareas, permitiendo filtrar por estado/unidad y ver próximas (ordenadas) por fechas."""
-    tareas = cargar_tareas()
-    filtradas = tareas
-
-    if filtro_estado:
-        filtradas = [t for t in filtradas if t["estado"] == filtro_estado]
-    if filtro_unidad:
-        filtradas = [t for t in filtradas if t["unidad"] == filtro_unidad]
+    almacen = obtener_almacen()
 
     if solo_pendientes_proximas:
-        hoy = datetime.now().date()
-        proximas = []
-        for t in filtradas:
-            if t["estado"] != "completada" and t.get("fecha_limite"):
-                try:
-                    f = datetime.strptime(t["fecha_limite"], "%Y-%m-%d").date()
-                    if f >= hoy:
-                        proximas.append(t)
-                except ValueError:
-                    pass
-        filtradas = sorted(proximas, key=lambda t: t["fecha_limite"])
+        # CAMBIO: el almacén mantiene las pendientes ordenadas por fecha (heap)
+        filtradas = almacen.proximas(datetime.now().date(), estado=filtro_estado, unidad=filtro_unidad)
+    else:
+        # CAMBIO: los filtros usan los índices por estado/unidad del almacén
+        filtradas = almacen.listar(estado=filtro_estado, unidad=filtro_unidad)
 
     if not filtradas:
         print("\n(No hay tareas para los filtros indicados)")
@@ -274,33 +253,26 @@ def listar_tareas(filtro_estado=None, filtro_unidad=None, solo_pendientes_proxim
 
 def completar_tarea():
     """Marca una tarea como 'completada' por ID."""
-    tareas = cargar_tareas()
     try:
         idt = int(input("ID de la tarea a completar: ").strip())
     except ValueError:
         print("ID inválido.")
         return
-    for t in tareas:
-        if t["id"] == idt:
-            t["estado"] = "completada"
-            guardar_tareas(tareas)
-            print("✔ Tarea marcada como completada.")
-            return
-    print("No se encontró una tarea con ese ID.")
+    if obtener_almacen().completar(idt):
+        print("✔ Tarea marcada como completada.")
+    else:
+        print("No se encontró una tarea con ese ID.")
 
 def eliminar_tarea():
     """Elimina una tarea por ID."""
-    tareas = cargar_tareas()
     try:
         idt = int(input("ID de la tarea a eliminar: ").strip())
     except ValueError:
         print("ID inválido.")
         return
-    nuevas = [t for t in tareas if t["id"] != idt]
-    if len(nuevas) == len(tareas):
+    if not obtener_almacen().eliminar(idt):
         print("No se encontró una tarea con ese ID.")
         return
-    guardar_tareas(nuevas)
     print("🗑 Tarea eliminada.")
 
 # NUEVO: menú del gestor de tareas
@@ -343,6 +315,9 @@ def gestionar_tareas():
         elif op == "7":
             eliminar_tarea()
         elif op == "0":
+            # NUEVO: escribir las operaciones pendientes del lote antes de salir
+            if _almacen is not None:
+                _almacen.sincronizar()
             break
         else:
             print("Opción no válida. Intenta de nuevo.")
@@ -0,0 +1,3 @@
+# nucleo_dashboard/__init__.py
+# Paquete de soporte del Dashboard (raíz del repo): utilidades que el script
+# 'practico Experimental2(Dashoard).py' importa para no crecer sin control.
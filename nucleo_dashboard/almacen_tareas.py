@@ -0,0 +1,517 @@
+# nucleo_dashboard/almacen_tareas.py
+# Requisito: Panel de Tareas sin re-parsear ni reescribir todo tareas.json en cada operación.
+#            Un único motor para los dos Dashboards (raíz y PARCIAL 01/Semana 08).
+# Decisión: Formato con diario (journal), backend por defecto:
+#   - tareas.json          -> instantánea {"formato", "siguiente_id", "seq", "tareas": [...]}
+#   - tareas.json.journal  -> una línea JSON por operación posterior (crear/actualizar/eliminar)
+#   Cada operación añade UNA línea al diario; la instantánea se reescribe solo al compactar.
+#   En memoria se mantienen índices: id -> tarea (dict), estado -> {ids}, unidad -> {ids} (sets).
+#   El contador siguiente_id se persiste (ya no se calcula con max(id) sobre todas las tareas).
+#
+# Nota: La reproducción del diario es idempotente (cada línea lleva "seq" y se ignoran las
+#       ya incluidas en la instantánea), así que un corte durante la compactación no duplica nada.
+#
+# Backends intercambiables (AlmacenTareas(ruta, backend=...)):
+#   - "diario"      -> BackendDiario: instantánea + diario (lo descrito arriba).
+#   - "instantanea" -> BackendInstantanea: solo tareas.json, reescrito de forma atómica
+#                      (tmp + replace) una vez por lote; útil para listas pequeñas.
+# Migración única de esquema: el formato antiguo (lista JSON simple) y las unidades del
+# Dashboard de Semana 08 ("UNIDAD 1..4") se convierten al cargar a "PARCIAL 01/02" en una
+# sola pasada y una sola escritura; la instantánea queda marcada con "esquema": 2.
+#
+# Pendientes próximas: la fecha límite se parsea UNA vez al indexar (Tarea.vence) y las
+# pendientes con fecha viven en un heap (vence, id). Las entradas obsoletas (completadas,
+# eliminadas, fecha cambiada o ya vencidas) se descartan al salir del heap.
+#
+# Caché en proceso: el almacén vive toda la sesión del panel. refrescar() compara la huella
+# (inodo, tamaño, mtime) de tareas.json y del diario y solo recarga si otro proceso los cambió.
+# Escritura diferida (write-behind): las líneas del diario se acumulan en memoria y se escriben
+# juntas al llegar a 'lote' operaciones o con sincronizar(). 'max_retraso' NO es un temporizador:
+# se revisa al registrar la operación siguiente (si lo pendiente ya tiene 'max_retraso'
+# segundos, se escribe todo). Una edición seguida de inactividad queda en memoria hasta la
+# próxima operación o sincronizar(): quien use lote > 1 debe llamar a sincronizar() al
+# terminar (el Dashboard lo hace al salir del panel y con atexit).
+#
+# Concurrencia entre procesos: toda lectura/escritura en disco se hace con un bloqueo
+# consultivo sobre tareas.json.lock (fcntl.flock / msvcrt.locking), que además guarda la
+# revisión (último seq escrito). Escritura optimista: se compara la revisión del disco con la
+# revisión base de este proceso (compare-and-swap); si otro proceso escribió entre medio, se
+# recarga el disco y se re-aplican encima las operaciones pendientes (merge):
+#   - crear: recibe un id nuevo si el suyo ya fue usado (sincronizar() devuelve {viejo: nuevo}),
+#   - actualizar: gana la última escritura; si la tarea fue eliminada por otro, se descarta.
+#   El merge es incremental: se deshacen en memoria las operaciones pendientes (registro de
+#   deshacer) y, si la instantánea no cambió, solo se leen las líneas nuevas del diario.
+
+from __future__ import annotations
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+import heapq
+import json
+import os
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+FORMATO = 2
+ESQUEMA = 2                 # 1 = unidades "UNIDAD n"; 2 = "PARCIAL 0n"
+UMBRAL_COMPACTACION = 1000  # líneas de diario antes de reescribir la instantánea
+CAMPOS = ("titulo", "unidad", "estado", "fecha_limite", "nota")
+ESTADOS = ["pendiente", "en progreso", "completada"]
+UNIDADES = ["PARCIAL 01", "PARCIAL 02"]
+MAPA_UNIDADES = {"UNIDAD 1": "PARCIAL 01", "UNIDAD 2": "PARCIAL 01",
+                 "UNIDAD 3": "PARCIAL 02", "UNIDAD 4": "PARCIAL 02"}
+
+
+def parse_fecha(s: str) -> Optional[date]:
+    try: return datetime.strptime(s, "%Y-%m-%d").date()
+    except (TypeError, ValueError): return None
+
+
+def _bloquear(fh) -> None:
+    if fcntl:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        return
+    fh.seek(0)
+    while True:  # LK_LOCK reintenta ~10 s y luego lanza OSError
+        try:
+            msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1); return
+        except OSError:
+            continue
+
+
+def _desbloquear(fh) -> None:
+    if fcntl:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+    else:
+        fh.seek(0); msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _leer_json(ruta: Path):
+    if not ruta.exists():
+        return []
+    try:
+        with ruta.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, (list, dict)) else []
+    except Exception:
+        print(f"Aviso: {ruta.name} inválido. Se usará base vacía."); return []
+
+
+def _escribir_json_atomico(ruta: Path, data) -> None:
+    tmp = ruta.with_name(ruta.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, ruta)
+
+
+class BackendDiario:
+    """Instantánea + diario: cada lote añade líneas; la instantánea se reescribe al compactar."""
+
+    def __init__(self, ruta: Path, umbral_compactacion: int = UMBRAL_COMPACTACION) -> None:
+        self.ruta = ruta
+        self.ruta_diario = ruta.with_name(ruta.name + ".journal")
+        self.umbral_compactacion = umbral_compactacion
+        self.lineas = 0   # líneas en el diario
+        self.offset = 0   # bytes del diario ya leídos/escritos por este proceso
+
+    def archivos(self) -> Tuple[Path, ...]:
+        return (self.ruta, self.ruta_diario)
+
+    def leer(self) -> Tuple[object, List[dict], bool]:
+        """(instantánea cruda, operaciones del diario, diario_integro)."""
+        self.lineas = self.offset = 0
+        ops, integro = self._leer_diario()
+        return _leer_json(self.ruta), ops, integro
+
+    def leer_nuevas(self, huella_previa, huella) -> Optional[List[dict]]:
+        """Solo las líneas que otros añadieron; None si hace falta recarga completa."""
+        instantanea, diario = huella
+        if instantanea != huella_previa[0] or diario is None or diario[1] < self.offset:
+            return None  # otro proceso compactó
+        ops, integro = self._leer_diario()
+        return ops if integro else None
+
+    def _leer_diario(self) -> Tuple[List[dict], bool]:
+        ops: List[dict] = []
+        if not self.ruta_diario.exists():
+            return ops, True
+        with self.ruta_diario.open("rb") as f:
+            f.seek(self.offset)
+            for linea in f:
+                try:
+                    if not linea.endswith(b"\n"):
+                        raise ValueError("línea incompleta")
+                    ops.append(json.loads(linea))
+                except ValueError:
+                    return ops, False  # línea final truncada por un corte
+                self.lineas += 1
+                self.offset += len(linea)
+        return ops, True
+
+    def escribir(self, ops: List[dict], estado: Callable[[], dict]) -> None:
+        if self.lineas + len(ops) >= self.umbral_compactacion:
+            self.escribir_instantanea(estado())
+            return
+        with self.ruta_diario.open("ab") as f:
+            f.write("".join(json.dumps(op, ensure_ascii=False) + "\n" for op in ops).encode("utf-8"))
+            self.offset = f.tell()
+        self.lineas += len(ops)
+
+    def escribir_instantanea(self, data: dict) -> None:
+        _escribir_json_atomico(self.ruta, data)
+        # Si se corta aquí, el diario se reproduce sin efecto (seq <= instantánea).
+        with self.ruta_diario.open("w", encoding="utf-8"):
+            pass
+        self.lineas = self.offset = 0
+
+
+class BackendInstantanea:
+    """Un único archivo JSON reescrito de forma atómica por lote (sin diario)."""
+
+    def __init__(self, ruta: Path) -> None:
+        self.ruta = ruta
+
+    def archivos(self) -> Tuple[Path, ...]:
+        return (self.ruta,)
+
+    def leer(self) -> Tuple[object, List[dict], bool]:
+        return _leer_json(self.ruta), [], True
+
+    def leer_nuevas(self, huella_previa, huella) -> Optional[List[dict]]:
+        return None
+
+    def escribir(self, ops: List[dict], estado: Callable[[], dict]) -> None:
+        self.escribir_instantanea(estado())
+
+    def escribir_instantanea(self, data: dict) -> None:
+        _escribir_json_atomico(self.ruta, data)
+
+
+class Tarea(dict):
+    """Registro de tarea: se serializa como dict; .vence guarda la fecha ya parseada."""
+    __slots__ = ("vence",)
+
+
+class AlmacenTareas:
+    """Tareas indexadas por id, estado y unidad, persistidas con un backend intercambiable."""
+
+    def __init__(self, ruta: str | Path, backend: str = "diario",
+                 umbral_compactacion: int = UMBRAL_COMPACTACION,
+                 lote: int = 1, max_retraso: float = 2.0) -> None:
+        self.ruta = Path(ruta)
+        self.ruta_lock = self.ruta.with_name(self.ruta.name + ".lock")
+        if backend == "diario":
+            self.backend = BackendDiario(self.ruta, umbral_compactacion)
+        elif backend == "instantanea":
+            self.backend = BackendInstantanea(self.ruta)
+        else:
+            raise ValueError(f"Backend desconocido: {backend!r} (usa 'diario' o 'instantanea').")
+        self.lote = max(1, lote)              # 1 = escritura inmediata
+        self.max_retraso = max_retraso
+        self._pendientes: List[dict] = []     # operaciones aún no escritas en el diario
+        self._deshacer: List[tuple] = []      # inversa de cada pendiente (para el merge)
+        self._pendiente_desde = 0.0
+        self._huella = None
+        self._base = None                      # revisión del disco sobre la que trabajamos
+        self._fh_lock = None                   # archivo de bloqueo mientras se posee
+        self.renumeradas: Dict[int, int] = {}  # id provisional -> id final (merges de la sesión)
+        self._por_id: Dict[int, dict] = {}
+        self._por_estado: Dict[str, Set[int]] = {}
+        self._por_unidad: Dict[str, Set[int]] = {}
+        self._proximas: List[Tuple[date, int]] = []  # heap de pendientes con fecha
+        self.siguiente_id = 1
+        self._seq = 0              # última operación aplicada
+        self.cargar()
+
+    # --- índices ---
+    def _indexar(self, t: dict, heap: bool = True) -> None:
+        if not isinstance(t, Tarea):
+            t = Tarea(t)
+        t.vence = parse_fecha(t.get("fecha_limite") or "")
+        self._por_id[t["id"]] = t
+        self._por_estado.setdefault(t.get("estado", ""), set()).add(t["id"])
+        self._por_unidad.setdefault(t.get("unidad", ""), set()).add(t["id"])
+        if heap and t.vence and t.get("estado") != "completada":
+            heapq.heappush(self._proximas, (t.vence, t["id"]))
+
+    def _desindexar(self, t: dict) -> None:
+        self._por_id.pop(t["id"], None)
+        self._por_estado.get(t.get("estado", ""), set()).discard(t["id"])
+        self._por_unidad.get(t.get("unidad", ""), set()).discard(t["id"])
+
+    def _limpiar_indices(self) -> None:
+        self._por_id.clear(); self._por_estado.clear(); self._por_unidad.clear()
+        self._proximas.clear()
+
+    # --- bloqueo consultivo + revisión (compare-and-swap) ---
+    @contextmanager
+    def _bloqueo(self):
+        if self._fh_lock is not None:  # reentrante dentro del mismo almacén
+            yield; return
+        self.ruta.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.ruta_lock, "a+", encoding="utf-8") as fh:
+            _bloquear(fh)
+            self._fh_lock = fh
+            try:
+                yield
+            finally:
+                self._fh_lock = None
+                _desbloquear(fh)
+
+    def _leer_revision(self) -> Optional[int]:
+        self._fh_lock.seek(0)
+        txt = self._fh_lock.read().strip()
+        return int(txt) if txt.isdigit() else None
+
+    def _confirmar(self) -> None:
+        """Tras escribir: publica la revisión y la toma como base propia."""
+        if self._leer_revision() != self._seq:
+            self._fh_lock.seek(0); self._fh_lock.truncate()
+            self._fh_lock.write(str(self._seq)); self._fh_lock.flush()
+        self._base = self._seq
+        self._huella = self._huella_actual()  # nuestros propios cambios no invalidan
+
+    def _rebasar(self) -> Dict[int, int]:
+        """Si el disco avanzó desde nuestra base, lo recarga y re-aplica lo pendiente encima."""
+        huella = self._huella_actual()
+        if self._leer_revision() == self._base and huella == self._huella:
+            return {}
+        ops = self._pendientes
+        self._deshacer_pendientes()
+        nuevas = self.backend.leer_nuevas(self._huella, huella)
+        if nuevas is None:
+            self._cargar()  # otro proceso compactó (o backend sin diario): recarga completa
+        else:
+            self._reproducir(nuevas)  # solo lo que escribieron otros
+        renumeradas: Dict[int, int] = {}
+        for op in ops:
+            op = dict(op)
+            if op["op"] == "crear":
+                t = dict(op["tarea"])
+                if t["id"] != self.siguiente_id:
+                    renumeradas[t["id"]] = self.siguiente_id
+                    t["id"] = self.siguiente_id
+                op["tarea"] = t
+            else:
+                op["id"] = renumeradas.get(op["id"], op["id"])
+                if op["id"] not in self._por_id:
+                    continue  # eliminada por otro proceso
+            self._registrar(op, sincronizar=False)
+        return renumeradas
+
+    def _deshacer_pendientes(self) -> None:
+        """Devuelve la memoria al último estado confirmado en disco."""
+        for inversa in reversed(self._deshacer):
+            tipo = inversa[0]
+            if tipo == "crear":
+                _, i, siguiente = inversa
+                t = self._por_id.get(i)
+                if t: self._desindexar(t)
+                self.siguiente_id = siguiente
+            elif tipo == "actualizar":
+                _, i, campos = inversa
+                t = self._por_id[i]
+                self._desindexar(t); t.update(campos); self._indexar(t)
+            else:
+                self._indexar(Tarea(inversa[1]))
+        self._pendientes, self._deshacer = [], []
+        self._seq = self._base
+
+    # --- carga: instantánea + reproducción del diario ---
+    def cargar(self) -> None:
+        """Lee el estado del disco descartando lo que no se haya sincronizado."""
+        with self._bloqueo():
+            self._pendientes.clear(); self._deshacer.clear()
+            self._cargar()
+            self._confirmar()
+
+    def _cargar(self) -> None:
+        self._limpiar_indices()
+        self.siguiente_id, self._seq = 1, 0
+        data, ops, integro = self.backend.leer()
+        if isinstance(data, list):  # formato antiguo: lista simple de tareas
+            tareas, meta = data, {}
+        else:
+            tareas, meta = data.get("tareas", []), data
+        self.siguiente_id = int(meta.get("siguiente_id", 1))
+        self._seq = int(meta.get("seq", 0))
+        migrar = bool(tareas) and int(meta.get("esquema", 1)) < ESQUEMA
+        for t in tareas:
+            try:
+                t["id"] = int(t.get("id"))
+            except (TypeError, ValueError):
+                continue
+            if migrar:
+                t["unidad"] = MAPA_UNIDADES.get(t.get("unidad", ""), t.get("unidad", ""))
+            self._indexar(t, heap=False)
+            self.siguiente_id = max(self.siguiente_id, t["id"] + 1)
+        # heapify O(n) en vez de n inserciones
+        self._proximas = [(t.vence, i) for i, t in self._por_id.items()
+                          if t.vence and t.get("estado") != "completada"]
+        heapq.heapify(self._proximas)
+        self._reproducir(ops)
+        if migrar or not integro:
+            # Migración única o diario con línea truncada por un corte: una sola escritura
+            # de la instantánea deja el disco en el esquema actual y sin basura.
+            self.backend.escribir_instantanea(self._estado())
+
+    def _reproducir(self, ops: List[dict]) -> None:
+        for op in ops:
+            if op.get("seq", 0) > self._seq:
+                self._aplicar(op)
+
+    def _estado(self) -> dict:
+        return {"formato": FORMATO, "esquema": ESQUEMA, "siguiente_id": self.siguiente_id,
+                "seq": self._seq, "tareas": list(self._por_id.values())}
+
+    # --- invalidación por cambios en disco ---
+    def _huella_actual(self):
+        h = []
+        for r in self.backend.archivos():
+            try:
+                st = os.stat(r); h.append((st.st_ino, st.st_size, st.st_mtime_ns))
+            except FileNotFoundError:
+                h.append(None)
+        return tuple(h)
+
+    def refrescar(self) -> bool:
+        """Recarga solo si otro proceso modificó los archivos (solo stat, sin lecturas)."""
+        if self._huella_actual() == self._huella:
+            return False
+        if self._pendientes:
+            self.sincronizar()  # merge con lo que escribió el otro proceso
+        else:
+            self.cargar()
+        return True
+
+    def _aplicar(self, op: dict) -> None:
+        self._seq = op["seq"]
+        tipo = op["op"]
+        if tipo == "crear":
+            t = Tarea(op["tarea"])
+            previa = self._por_id.get(t["id"])
+            if previa: self._desindexar(previa)
+            self._indexar(t)
+            self.siguiente_id = max(self.siguiente_id, t["id"] + 1)
+        elif tipo == "actualizar":
+            t = self._por_id.get(op["id"])
+            if t:
+                vence, completada = t.vence, t.get("estado") == "completada"
+                self._desindexar(t); t.update(op["campos"])
+                # CAMBIO: solo se empuja al heap si cambió la fecha o si la tarea dejó de estar
+                # completada (su entrada pudo descartarse); pendiente <-> en progreso no duplica.
+                self._indexar(t, heap=parse_fecha(t.get("fecha_limite") or "") != vence
+                              or (completada and t.get("estado") != "completada"))
+        elif tipo == "eliminar":
+            t = self._por_id.get(op["id"])
+            if t: self._desindexar(t)
+
+    # --- escritura: una línea por operación (diferida en lotes) ---
+    def _registrar(self, op: dict, sincronizar: bool = True) -> None:
+        if op["op"] == "crear":
+            inversa = ("crear", op["tarea"]["id"], self.siguiente_id)
+        elif op["op"] == "actualizar":
+            t = self._por_id[op["id"]]
+            inversa = ("actualizar", op["id"], {k: t.get(k) for k in op["campos"]})
+        else:
+            inversa = ("eliminar", dict(self._por_id[op["id"]]))
+        op["seq"] = self._seq + 1
+        self._aplicar(op)
+        if not self._pendientes:
+            self._pendiente_desde = time.monotonic()
+        self._pendientes.append(op)
+        self._deshacer.append(inversa)
+        # Sin temporizador: el plazo solo se mira aquí, al registrar (ver cabecera).
+        if sincronizar and (len(self._pendientes) >= self.lote
+                or time.monotonic() - self._pendiente_desde >= self.max_retraso):
+            self.sincronizar()
+
+    def sincronizar(self) -> Dict[int, int]:
+        """
+        Escribe de una vez las operaciones pendientes (o compacta si toca).
+        Devuelve {id_provisional: id_final} de las tareas renumeradas en un merge.
+        """
+        if not self._pendientes:
+            return {}
+        with self._bloqueo():
+            renumeradas = self._rebasar()
+            if self._pendientes:
+                self.backend.escribir(self._pendientes, self._estado)
+                self._pendientes.clear(); self._deshacer.clear()
+            self._confirmar()
+        self.renumeradas.update(renumeradas)
+        return renumeradas
+
+    def compactar(self) -> Dict[int, int]:
+        """Reescribe la instantánea (atómica: tmp + replace) y vacía el diario."""
+        with self._bloqueo():
+            renumeradas = self._rebasar()
+            self.backend.escribir_instantanea(self._estado())
+            self._pendientes.clear(); self._deshacer.clear()  # ya incluidas en la instantánea
+            self._confirmar()
+        self.renumeradas.update(renumeradas)
+        return renumeradas
+
+    # --- API ---
+    def crear(self, titulo: str, unidad: str, estado: str, fecha_limite: str = "", nota: str = "") -> dict:
+        t = {"id": self.siguiente_id, "titulo": titulo, "unidad": unidad, "estado": estado,
+             "fecha_limite": fecha_limite, "nota": nota}
+        self._registrar({"op": "crear", "tarea": t})
+        return self._por_id[t["id"]]
+
+    def obtener(self, id_tarea: int) -> Optional[dict]:
+        return self._por_id.get(id_tarea)
+
+    def actualizar(self, id_tarea: int, **campos) -> bool:
+        if id_tarea not in self._por_id:
+            return False
+        campos = {k: v for k, v in campos.items() if k in CAMPOS}
+        self._registrar({"op": "actualizar", "id": id_tarea, "campos": campos})
+        return True
+
+    def completar(self, id_tarea: int) -> bool:
+        return self.actualizar(id_tarea, estado="completada")
+
+    def eliminar(self, id_tarea: int) -> bool:
+        if id_tarea not in self._por_id:
+            return False
+        self._registrar({"op": "eliminar", "id": id_tarea})
+        return True
+
+    def listar(self, estado: Optional[str] = None, unidad: Optional[str] = None) -> List[dict]:
+        """Tareas ordenadas por id; los filtros usan los índices secundarios."""
+        ids: Optional[Set[int]] = None
+        if estado is not None:
+            ids = self._por_estado.get(estado, set())
+        if unidad is not None:
+            u = self._por_unidad.get(unidad, set())
+            ids = u if ids is None else ids & u
+        if ids is None:
+            return sorted(self._por_id.values(), key=lambda t: t["id"])
+        return [self._por_id[i] for i in sorted(ids)]
+
+    def proximas(self, hoy: date, limite: Optional[int] = None, estado: Optional[str] = None,
+                 unidad: Optional[str] = None) -> List[dict]:
+        """Pendientes con fecha >= hoy, ordenadas por vencimiento: O(k log n) para las k primeras."""
+        heap, vistas, validas, res = self._proximas, set(), [], []
+        while heap and (limite is None or len(res) < limite):
+            vence, i = heapq.heappop(heap)
+            t = self._por_id.get(i)
+            if (t is None or i in vistas or t.vence != vence or t.get("estado") == "completada"
+                    or vence < hoy):
+                continue  # obsoleta o ya vencida ('hoy' solo avanza): se descarta del heap
+            vistas.add(i); validas.append((vence, i))
+            if (estado is None or t.get("estado") == estado) and (unidad is None or t.get("unidad") == unidad):
+                res.append(t)
+        for e in validas:  # devolver las válidas al heap
+            heapq.heappush(heap, e)
+        return res
+
+    def __len__(self) -> int:
+        return len(self._por_id)
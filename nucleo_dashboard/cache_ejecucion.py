@@ -0,0 +1,171 @@
+# nucleo_dashboard/cache_ejecucion.py
+# Requisito: No volver a lanzar un intérprete para un script determinista que no cambió
+#            (p.ej. NominaEmpleados.py o EJEMPLO-TREN.py desde el Dashboard).
+# Decisión: Caché en disco, una entrada JSON por ejecución, con clave =
+#           sha256(código fuente + versión del intérprete + fixture de stdin).
+#           Desalojo LRU acotado por tamaño total; el mtime de cada entrada marca su último uso.
+#
+# CAMBIO: - Solo se guardan corridas limpias (returncode 0): un fallo, un Ctrl+C o un script
+#           que murió no se repiten desde la caché como si fueran válidos.
+#         - La clave incluye stdin, pero casi nadie pasa 'entrada': un script que lee stdin
+#           (input(), sys.stdin, fileinput) sin fixture depende del teclado y no se cachea.
+#         - La caché es opcional por script: solo se cachea un script marcado con la línea
+#           "# dashboard: determinista". Los demás (bitácoras, gestores que escriben archivos,
+#           salidas con datetime.now()) siempre se ejecutan, así sus efectos no se saltan.
+#         - La clave incluye también los módulos vecinos que el script importa (import x /
+#           from x import y que resuelven a x.py en su carpeta, recursivamente): editar
+#           rotacion.py invalida a quien lo importa.
+
+from __future__ import annotations
+from pathlib import Path
+import ast
+import hashlib
+import json
+import os
+import re
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+from nucleo_dashboard.pool_interpretes import ejecutar_subproceso
+
+MAX_BYTES_DEFECTO = 8 * 1024 * 1024  # 8 MiB para todas las salidas cacheadas
+_LECTURAS_STDIN = (b"input(", b"sys.stdin", b"fileinput")
+
+
+_MARCA_DETERMINISTA = re.compile(rb"^#\s*dashboard:\s*determinista\b", re.MULTILINE)
+
+
+def lee_stdin(fuente: bytes) -> bool:
+    """Heurística: el script lee de stdin (input(), sys.stdin o fileinput)."""
+    return any(p in fuente for p in _LECTURAS_STDIN)
+
+
+def es_determinista(fuente: bytes) -> bool:
+    """El script se declaró cacheable con una línea "# dashboard: determinista"."""
+    return _MARCA_DETERMINISTA.search(fuente) is not None
+
+
+def modulos_vecinos(ruta: str) -> List[str]:
+    """
+    Rutas de los .py de la carpeta del script que este importa, directa o indirectamente
+    (import x, from x import y con x.py junto al script). Ordenadas, sin el propio script.
+    """
+    carpeta = os.path.dirname(os.path.abspath(ruta))
+    vistos: set = set()
+    pendientes = [os.path.abspath(ruta)]
+    while pendientes:
+        actual = pendientes.pop()
+        try:
+            with open(actual, "rb") as f:
+                arbol = ast.parse(f.read())
+        except (OSError, SyntaxError, ValueError):
+            continue
+        for nodo in ast.walk(arbol):
+            if isinstance(nodo, ast.Import):
+                nombres = [a.name for a in nodo.names]
+            elif isinstance(nodo, ast.ImportFrom) and nodo.level == 0 and nodo.module:
+                nombres = [nodo.module]
+            else:
+                continue
+            for nombre in nombres:
+                vecino = os.path.join(carpeta, nombre.split(".")[0] + ".py")
+                if vecino not in vistos and os.path.isfile(vecino):
+                    vistos.add(vecino)
+                    pendientes.append(vecino)
+    vistos.discard(os.path.abspath(ruta))
+    return sorted(vistos)
+
+
+class CacheEjecucion:
+    """Guarda stdout/stderr/returncode de ejecuciones previas, indexadas por hash."""
+
+    def __init__(self, directorio: str | Path, max_bytes: int = MAX_BYTES_DEFECTO) -> None:
+        self.directorio = Path(directorio)
+        self.max_bytes = max_bytes
+
+    # --- clave: fuente + módulos vecinos + intérprete + stdin ---
+    @staticmethod
+    def clave(fuente: bytes, entrada: str, vecinos: Tuple[bytes, ...] = ()) -> str:
+        h = hashlib.sha256()
+        h.update(fuente)
+        for codigo in vecinos:
+            h.update(b"\0" + hashlib.sha256(codigo).digest())
+        h.update(b"\0" + sys.version.encode() + b"\0" + sys.executable.encode())
+        h.update(b"\0" + entrada.encode("utf-8"))
+        return h.hexdigest()
+
+    def _ruta(self, clave: str) -> Path:
+        return self.directorio / f"{clave}.json"
+
+    def obtener(self, clave: str) -> Optional[Dict]:
+        ruta = self._ruta(clave)
+        try:
+            with ruta.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        try:
+            os.utime(ruta)  # LRU: tocar la entrada = usada recientemente
+        except OSError:
+            pass
+        return data
+
+    def guardar(self, clave: str, resultado: Dict) -> None:
+        self.directorio.mkdir(parents=True, exist_ok=True)
+        tmp = self._ruta(clave).with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False)
+        tmp.replace(self._ruta(clave))  # escritura atómica
+        self.desalojar()
+
+    def desalojar(self) -> None:
+        """Borra las entradas menos usadas hasta quedar bajo max_bytes."""
+        try:
+            entradas = [(e.stat().st_mtime, e.stat().st_size, e.path)
+                        for e in os.scandir(self.directorio) if e.name.endswith(".json")]
+        except FileNotFoundError:
+            return
+        total = sum(tam for _, tam, _ in entradas)
+        for _, tam, ruta in sorted(entradas):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(ruta); total -= tam
+            except OSError:
+                pass
+
+    def limpiar(self) -> None:
+        if not self.directorio.is_dir():
+            return
+        for e in os.scandir(self.directorio):
+            if e.name.endswith(".json"):
+                os.remove(e.path)
+
+
+def ejecutar_con_cache(ruta: str, cache: CacheEjecucion, entrada: str = "",
+                       forzar: bool = False,
+                       ejecutor: Callable[[str, str], Dict] = ejecutar_subproceso) -> Tuple[Dict, bool]:
+    """
+    Ejecuta 'ruta' con 'entrada' como stdin y devuelve (resultado, desde_cache).
+    resultado = {"stdout", "stderr", "returncode", "duracion"}.
+    forzar=True ignora la entrada cacheada (pero guarda la nueva).
+    ejecutor: cómo correr el script en un fallo de caché (subprocess o PoolInterpretes.ejecutar).
+    Solo se cachean corridas con returncode 0 de scripts marcados como deterministas, y
+    nunca un script que lee stdin sin 'entrada'; el resto se ejecuta siempre.
+    """
+    with open(ruta, "rb") as f:
+        fuente = f.read()
+    if not es_determinista(fuente) or (not entrada and lee_stdin(fuente)):
+        return ejecutor(ruta, entrada), False
+    vecinos = []
+    for modulo in modulos_vecinos(ruta):
+        with open(modulo, "rb") as f:
+            vecinos.append(os.path.basename(modulo).encode() + b"\0" + f.read())
+    clave = cache.clave(fuente, entrada, tuple(vecinos))
+    if not forzar:
+        previo = cache.obtener(clave)
+        if previo is not None:
+            return previo, True
+    resultado = ejecutor(ruta, entrada)
+    if resultado.get("returncode") == 0:
+        cache.guardar(clave, resultado)
+    return resultado, False
@@ -0,0 +1,187 @@
+# nucleo_dashboard/creacion_lote.py
+# Requisito: Crear de una vez una "Semana NN" con varias carpetas y archivos, en vez de una
+#            ida y vuelta por seleccionar_carpeta para cada elemento.
+# Decisión: Manifiesto JSON (o YAML si PyYAML está instalado) con carpetas, archivos y plantillas:
+#   {
+#     "base": "PARCIAL 02/Semana 17",
+#     "variables": {"semana": "17"},
+#     "plantillas": {"script": "# $nombre - Semana $semana\n"},
+#     "carpetas": ["modelos", "servicios"],
+#     "archivos": [{"ruta": "main.py", "plantilla": "script"},
+#                  {"ruta": "README.md", "contenido": "# Semana $semana\n"}]
+#   }
+#   - planificar(): valida TODO una sola vez (dentro del repo, sin duplicados, sin pisar
+#     archivos existentes, plantillas y variables definidas) y no toca el disco.
+#   - aplicar(): crea las carpetas (padres primero) y escribe los archivos con un ThreadPool.
+#   Las plantillas (y las rutas) usan string.Template ($variable) para no chocar con las llaves
+#   de Python.
+#   Variables automáticas: $nombre (archivo sin ruta), $ruta (relativa a la raíz), $fecha.
+#   python -m nucleo_dashboard.creacion_lote <manifiesto> [--aplicar]   (sin --aplicar: simulación)
+
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from string import Template
+from typing import Callable, Dict, List, NamedTuple, Tuple
+import json
+import os
+import sys
+
+
+class Plan(NamedTuple):
+    carpetas: List[str]               # rutas absolutas, ordenadas (padres primero)
+    archivos: List[Tuple[str, str]]   # (ruta absoluta, contenido)
+    errores: List[str]
+
+
+def cargar_manifiesto(ruta: str) -> Dict:
+    with open(ruta, "r", encoding="utf-8") as f:
+        if ruta.lower().endswith((".yml", ".yaml")):
+            try:
+                import yaml  # opcional
+            except ImportError:
+                raise ValueError("Para manifiestos YAML instala PyYAML (pip install pyyaml) o usa JSON.")
+            datos = yaml.safe_load(f)
+        else:
+            datos = json.load(f)
+    if not isinstance(datos, dict):
+        raise ValueError("El manifiesto debe ser un objeto con 'carpetas' y/o 'archivos'.")
+    return datos
+
+
+def planificar(manifiesto: Dict, raiz: str, dentro_repo: Callable[[str], bool]) -> Plan:
+    """Resuelve y valida todas las rutas del manifiesto; no crea nada."""
+    errores: List[str] = []
+
+    def campo(clave: str, tipo, defecto, descripcion: str):
+        # CAMBIO: un tipo incorrecto es un error del plan, no una excepción a mitad de camino.
+        valor = manifiesto.get(clave, defecto)
+        if not isinstance(valor, tipo):
+            errores.append(f"{clave}: debe ser {descripcion}, no {type(valor).__name__}."); return defecto
+        return valor
+
+    plantillas = campo("plantillas", dict, {}, "un objeto {nombre: texto}")
+    for nombre, texto in plantillas.items():
+        if not isinstance(texto, str):
+            errores.append(f"plantillas[{nombre!r}]: debe ser texto.")
+    variables = {"fecha": date.today().isoformat(),
+                 **campo("variables", dict, {}, "un objeto {variable: valor}")}
+
+    def sustituir(texto: str, donde: str, valores: Dict = variables):
+        try:
+            return Template(texto).substitute(valores)
+        except (KeyError, ValueError) as e:
+            errores.append(f"{donde}: variable sin valor ({e})."); return None
+
+    def resolver(rel: str, donde: str):
+        if not isinstance(rel, str) or not rel.strip() or os.path.isabs(rel):
+            errores.append(f"{donde}: ruta inválida {rel!r} (debe ser relativa a 'base')."); return None
+        rel = sustituir(rel, donde)
+        if rel is None:
+            return None
+        ruta = os.path.normpath(os.path.join(base, rel))
+        if not dentro_repo(ruta):
+            errores.append(f"{donde}: {rel} queda fuera del repositorio."); return None
+        return ruta
+
+    base = os.path.normpath(os.path.join(raiz, sustituir(campo("base", str, "", "texto"), "base") or ""))
+    carpetas = set()
+    if not dentro_repo(base):
+        errores.append(f"base: {manifiesto.get('base')!r} queda fuera del repositorio.")
+    else:
+        carpetas.add(base)
+    for i, rel in enumerate(campo("carpetas", list, [], "una lista de rutas")):
+        ruta = resolver(rel, f"carpetas[{i}]")
+        if ruta:
+            carpetas.add(ruta)
+
+    archivos: Dict[str, str] = {}
+    for i, item in enumerate(campo("archivos", list, [], "una lista")):
+        donde = f"archivos[{i}]"
+        if isinstance(item, str):
+            item = {"ruta": item}
+        elif not isinstance(item, dict):
+            errores.append(f"{donde}: debe ser una ruta o un objeto con 'ruta'."); continue
+        ruta = resolver(item.get("ruta"), donde)
+        if not ruta:
+            continue
+        if ruta in archivos:
+            errores.append(f"{donde}: {os.path.relpath(ruta, raiz)} está repetido."); continue
+        if os.path.exists(ruta):
+            errores.append(f"{donde}: {os.path.relpath(ruta, raiz)} ya existe."); continue
+        if "plantilla" in item:
+            if not isinstance(item["plantilla"], str) or item["plantilla"] not in plantillas:
+                errores.append(f"{donde}: plantilla {item['plantilla']!r} no definida."); continue
+            texto = plantillas[item["plantilla"]]
+        else:
+            texto = item.get("contenido", "")
+        if not isinstance(texto, str):
+            if "plantilla" not in item:  # (una plantilla no textual ya se anotó arriba)
+                errores.append(f"{donde}: 'contenido' debe ser texto.")
+            continue
+        if not isinstance(item.get("variables", {}), dict):
+            errores.append(f"{donde}: 'variables' debe ser un objeto."); continue
+        vars_archivo = {**variables, "nombre": os.path.basename(ruta),
+                        "ruta": os.path.relpath(ruta, raiz).replace(os.sep, "/"),
+                        **item.get("variables", {})}
+        contenido = sustituir(texto, donde, vars_archivo)
+        if contenido is None:
+            continue
+        archivos[ruta] = contenido
+        carpetas.add(os.path.dirname(ruta))
+
+    for c in carpetas:
+        if os.path.exists(c) and not os.path.isdir(c):
+            errores.append(f"{os.path.relpath(c, raiz)} existe y no es una carpeta.")
+    conflictos = carpetas & archivos.keys()
+    errores += [f"{os.path.relpath(c, raiz)} aparece como carpeta y como archivo." for c in sorted(conflictos)]
+    orden = sorted(carpetas, key=lambda c: (c.count(os.sep), c))
+    return Plan(orden, sorted(archivos.items()), errores)
+
+
+def _escribir(ruta: str, contenido: str) -> None:
+    with open(ruta, "x", encoding="utf-8") as f:  # "x": nunca pisar algo creado entretanto
+        f.write(contenido)
+
+
+def aplicar(plan: Plan, hilos: int = 8) -> Dict:
+    """Crea carpetas y archivos del plan; devuelve {'carpetas', 'archivos', 'errores'}."""
+    if plan.errores:
+        raise ValueError("El plan tiene errores; corrígelos antes de aplicar.")
+    nuevas = 0
+    for c in plan.carpetas:
+        if not os.path.isdir(c):
+            os.makedirs(c, exist_ok=True); nuevas += 1
+    errores, escritos = [], 0
+    with ThreadPoolExecutor(max_workers=max(1, hilos)) as pool:
+        futuros = [(ruta, pool.submit(_escribir, ruta, contenido)) for ruta, contenido in plan.archivos]
+        for ruta, fut in futuros:
+            try:
+                fut.result(); escritos += 1
+            except OSError as e:
+                errores.append(f"{ruta}: {e}")
+    return {"carpetas": nuevas, "archivos": escritos, "errores": errores}
+
+
+def resumen(plan: Plan, raiz: str) -> str:
+    lineas = [f"{len(plan.carpetas)} carpeta(s), {len(plan.archivos)} archivo(s):"]
+    lineas += [f"  [D] {os.path.relpath(c, raiz)}" + ("" if not os.path.isdir(c) else "  (ya existe)")
+               for c in plan.carpetas]
+    lineas += [f"  [F] {os.path.relpath(r, raiz)}  ({len(t.encode('utf-8'))} bytes)" for r, t in plan.archivos]
+    if plan.errores:
+        lineas.append("\nErrores:")
+        lineas += [f"  - {e}" for e in plan.errores]
+    return "\n".join(lineas)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit("Uso: python -m nucleo_dashboard.creacion_lote <manifiesto.json|yaml> [--aplicar]")
+    raiz = os.path.realpath(os.getcwd())
+    prefijo = raiz.rstrip(os.sep) + os.sep
+    plan = planificar(cargar_manifiesto(sys.argv[1]), raiz,
+                      lambda p: os.path.realpath(p) == raiz or os.path.realpath(p).startswith(prefijo))
+    print(resumen(plan, raiz))
+    if "--aplicar" in sys.argv and not plan.errores:
+        print(aplicar(plan))
+    sys.exit(1 if plan.errores else 0)
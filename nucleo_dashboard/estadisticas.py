@@ -0,0 +1,180 @@
+# nucleo_dashboard/estadisticas.py
+# Requisito: Vista de estadísticas del repo en el Dashboard: archivos, líneas, archivos más
+#            grandes y clases/funciones por carpeta 'Semana' de PARCIAL 01 / PARCIAL 02.
+# Decisión: - Los .py se analizan con ast en un ProcessPoolExecutor (un archivo por tarea,
+#             en bloques); el resto de archivos solo cuenta bytes y líneas.
+#           - Caché por archivo en .cache_dashboard/estadisticas.json con clave (mtime, tamaño):
+#             una segunda pasada solo re-analiza lo que cambió.
+#           - El resultado incluye los tiempos del recorrido, del análisis y total.
+#           - Los procesos del pool arrancan con "forkserver" (o "spawn"), nunca con fork: la TUI
+#             llama a escanear() desde un hilo con asyncio y el vigilante vivos, y bifurcar un
+#             proceso con hilos no es seguro (mismo motivo que _ejecutar_fondo del Dashboard).
+#   python -m nucleo_dashboard.estadisticas [raiz]
+
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+import ast
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+CARPETAS = ("PARCIAL 01", "PARCIAL 02")
+MIN_PARA_POOL = 8  # con menos archivos pendientes, arrancar procesos cuesta más que analizarlos
+
+
+def analizar_archivo(ruta: str) -> Dict:
+    """Bytes, líneas y (si es .py) clases y funciones. Se ejecuta en los procesos del pool."""
+    with open(ruta, "rb") as f:
+        datos = f.read()
+    info = {"bytes": len(datos), "lineas": datos.count(b"\n") + (1 if datos and not datos.endswith(b"\n") else 0),
+            "clases": 0, "funciones": 0}
+    if ruta.endswith(".py"):
+        try:
+            arbol = ast.parse(datos, filename=ruta)
+        except (SyntaxError, ValueError) as e:
+            info["error"] = f"{type(e).__name__}: {e}"
+            return info
+        for nodo in ast.walk(arbol):
+            if isinstance(nodo, ast.ClassDef):
+                info["clases"] += 1
+            elif isinstance(nodo, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                info["funciones"] += 1
+    return info
+
+
+def _contexto_pool():
+    metodos = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in metodos else "spawn")
+
+
+def _grupo(rel: str) -> str:
+    """'PARCIAL 01/Semana 03/x/y.py' -> 'PARCIAL 01/Semana 03'; sueltos -> 'PARCIAL 01/(raíz)'."""
+    partes = rel.replace(os.sep, "/").split("/")
+    return "/".join(partes[:2]) if len(partes) > 2 else f"{partes[0]}/(raíz)"
+
+
+def _recorrer(raiz: str, carpetas: Iterable[str]) -> List[Tuple[str, os.stat_result]]:
+    archivos = []
+    pendientes = [os.path.join(raiz, c) for c in carpetas if os.path.isdir(os.path.join(raiz, c))]
+    while pendientes:
+        carpeta = pendientes.pop()
+        try:
+            entradas = list(os.scandir(carpeta))
+        except OSError:
+            continue
+        for e in entradas:
+            if e.name.startswith(".") or e.name == "__pycache__":
+                continue
+            if e.is_dir(follow_symlinks=False):
+                pendientes.append(e.path)
+            elif e.is_file(follow_symlinks=False):
+                archivos.append((e.path, e.stat()))
+    return archivos
+
+
+class EstadisticasRepo:
+    """Escáner con caché por archivo; escanear() devuelve el resumen listo para mostrar."""
+
+    def __init__(self, raiz: str, ruta_cache: Optional[str] = None,
+                 carpetas: Iterable[str] = CARPETAS, procesos: Optional[int] = None) -> None:
+        self.raiz = raiz
+        self.carpetas = tuple(carpetas)
+        self.procesos = procesos
+        self.ruta_cache = ruta_cache
+        self._cache: Dict[str, Dict] = {}
+        if ruta_cache:
+            try:
+                with open(ruta_cache, "r", encoding="utf-8") as f:
+                    self._cache = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._cache = {}
+
+    def _guardar_cache(self) -> None:
+        if not self.ruta_cache:
+            return
+        os.makedirs(os.path.dirname(self.ruta_cache), exist_ok=True)
+        tmp = self.ruta_cache + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._cache, f, ensure_ascii=False)
+        os.replace(tmp, self.ruta_cache)
+
+    def escanear(self) -> Dict:
+        t0 = time.perf_counter()
+        archivos = _recorrer(self.raiz, self.carpetas)
+        t_recorrido = time.perf_counter() - t0
+
+        vigentes, pendientes = {}, []
+        for ruta, st in archivos:
+            rel = os.path.relpath(ruta, self.raiz)
+            previo = self._cache.get(rel)
+            if previo and previo["mtime"] == st.st_mtime_ns and previo["tam"] == st.st_size:
+                vigentes[rel] = previo
+            else:
+                pendientes.append((rel, ruta, st))
+
+        t1 = time.perf_counter()
+        rutas = [ruta for _, ruta, _ in pendientes]
+        if len(rutas) >= MIN_PARA_POOL:
+            with ProcessPoolExecutor(self.procesos, mp_context=_contexto_pool()) as pool:
+                infos = list(pool.map(analizar_archivo, rutas, chunksize=max(1, len(rutas) // 32)))
+        else:
+            infos = [analizar_archivo(r) for r in rutas]
+        t_analisis = time.perf_counter() - t1
+
+        for (rel, _, st), info in zip(pendientes, infos):
+            info.update(mtime=st.st_mtime_ns, tam=st.st_size)
+            vigentes[rel] = info
+        cambio = bool(pendientes) or len(vigentes) != len(self._cache)
+        self._cache = vigentes  # lo borrado del disco sale de la caché
+        if cambio:
+            self._guardar_cache()
+
+        grupos: Dict[str, Dict] = {}
+        for rel, info in vigentes.items():
+            g = grupos.setdefault(_grupo(rel), {"archivos": 0, "py": 0, "lineas": 0, "bytes": 0,
+                                                "clases": 0, "funciones": 0})
+            g["archivos"] += 1; g["lineas"] += info["lineas"]; g["bytes"] += info["bytes"]
+            g["clases"] += info["clases"]; g["funciones"] += info["funciones"]
+            g["py"] += rel.endswith(".py")
+        mayores = sorted(vigentes.items(), key=lambda kv: (-kv[1]["lineas"], kv[0]))[:10]
+        return {
+            "grupos": dict(sorted(grupos.items())),
+            "mayores": [(rel, info["lineas"], info["bytes"]) for rel, info in mayores],
+            "errores": sorted((rel, info["error"]) for rel, info in vigentes.items() if "error" in info),
+            "total_archivos": len(vigentes),
+            "analizados": len(pendientes),
+            "desde_cache": len(vigentes) - len(pendientes),
+            "tiempos": {"recorrido": t_recorrido, "analisis": t_analisis,
+                        "total": time.perf_counter() - t0},
+        }
+
+
+def formatear(res: Dict) -> str:
+    lineas = [f"{'Carpeta':<45} {'Arch':>5} {'.py':>4} {'Líneas':>7} {'Clases':>6} {'Func.':>6}"]
+    tot = {"archivos": 0, "py": 0, "lineas": 0, "clases": 0, "funciones": 0}
+    for nombre, g in res["grupos"].items():
+        lineas.append(f"{nombre[:45]:<45} {g['archivos']:>5} {g['py']:>4} {g['lineas']:>7} "
+                      f"{g['clases']:>6} {g['funciones']:>6}")
+        for k in tot:
+            tot[k] += g[k]
+    lineas.append(f"{'TOTAL':<45} {tot['archivos']:>5} {tot['py']:>4} {tot['lineas']:>7} "
+                  f"{tot['clases']:>6} {tot['funciones']:>6}")
+    lineas.append("\nArchivos más grandes (líneas):")
+    for rel, n, b in res["mayores"]:
+        lineas.append(f"  {n:>6}  {b / 1024:7.1f} KiB  {rel}")
+    if res["errores"]:
+        lineas.append("\nNo se pudieron analizar:")
+        lineas += [f"  {rel}: {err}" for rel, err in res["errores"]]
+    t = res["tiempos"]
+    lineas.append(f"\nEscaneo: {res['total_archivos']} archivos ({res['analizados']} analizados, "
+                  f"{res['desde_cache']} desde caché) | recorrido {t['recorrido'] * 1000:.1f} ms, "
+                  f"análisis {t['analisis'] * 1000:.1f} ms, total {t['total'] * 1000:.1f} ms")
+    return "\n".join(lineas)
+
+
+if __name__ == "__main__":
+    raiz = os.path.abspath(sys.argv[1] if len(sys.argv) > 1 else ".")
+    print(formatear(EstadisticasRepo(raiz, os.path.join(raiz, ".cache_dashboard", "estadisticas.json")).escanear()))
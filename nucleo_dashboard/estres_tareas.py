@@ -0,0 +1,85 @@
+# nucleo_dashboard/estres_tareas.py
+# Requisito: Comprobar que varios procesos pueden crear y completar tareas sobre el MISMO
+#            tareas.json sin perder actualizaciones (bloqueo + compare-and-swap + merge).
+# Decisión: Prueba de estrés ejecutable a mano (y también desde pytest:
+#           tests/test_almacen_concurrencia.py llama a estres() con ambos backends):
+#   python -m nucleo_dashboard.estres_tareas [procesos] [tareas_por_proceso] [backend]
+#   Cada proceso crea sus tareas ("p<k>-<j>") en lotes diferidos y completa las de j par;
+#   al final se recarga el archivo y se verifica que no falte ni sobre nada.
+
+from __future__ import annotations
+from multiprocessing import Process
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+
+from nucleo_dashboard.almacen_tareas import AlmacenTareas
+
+
+def _trabajador(ruta: str, k: int, n: int, umbral: int, backend: str) -> None:
+    rnd = random.Random(k)
+    alm = AlmacenTareas(ruta, backend=backend, umbral_compactacion=umbral,
+                        lote=rnd.randint(1, 8), max_retraso=0.05)
+    ids = {}
+    for j in range(n):
+        ids[j] = alm.crear(f"p{k}-{j}", "PARCIAL 01", "pendiente", "2030-01-01")["id"]
+        if j % 2 == 1:
+            alm.completar(alm.renumeradas.get(ids[j - 1], ids[j - 1]))
+        if rnd.random() < 0.2:
+            alm.refrescar()
+        if rnd.random() < 0.3:
+            alm.sincronizar()
+    if n % 2 == 1:  # la última tarea par no tiene sucesora que la complete
+        alm.completar(alm.renumeradas.get(ids[n - 1], ids[n - 1]))
+    alm.sincronizar()
+
+
+def verificar(ruta: str, procesos: int, n: int, backend: str = "diario") -> list:
+    alm = AlmacenTareas(ruta, backend=backend)
+    errores = []
+    por_titulo = {}
+    for t in alm.listar():
+        if t["titulo"] in por_titulo:
+            errores.append(f"duplicada: {t['titulo']}")
+        por_titulo[t["titulo"]] = t
+    ids = [t["id"] for t in alm.listar()]
+    if len(ids) != len(set(ids)):
+        errores.append("ids repetidos")
+    for k in range(procesos):
+        for j in range(n):
+            t = por_titulo.get(f"p{k}-{j}")
+            if t is None:
+                errores.append(f"perdida: p{k}-{j}")
+            elif j % 2 == 0 and t["estado"] != "completada":
+                errores.append(f"completado perdido: p{k}-{j}")
+            elif j % 2 == 1 and t["estado"] != "pendiente":
+                errores.append(f"estado inesperado: p{k}-{j}")
+    return errores
+
+
+def estres(procesos: int = 8, n: int = 200, umbral: int = 150, backend: str = "diario") -> bool:
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = str(Path(tmp) / "tareas.json")
+        t0 = time.perf_counter()
+        ps = [Process(target=_trabajador, args=(ruta, k, n, umbral, backend)) for k in range(procesos)]
+        for p in ps: p.start()
+        for p in ps: p.join()
+        dur = time.perf_counter() - t0
+        errores = verificar(ruta, procesos, n, backend)
+    fallos = [p.exitcode for p in ps if p.exitcode]
+    print(f"[{backend}] {procesos} procesos x {n} tareas: {dur:.2f}s, "
+          f"{'OK' if not errores and not fallos else f'{len(errores)} errores'}")
+    for e in errores[:20]:
+        print("  -", e)
+    if fallos:
+        print("  - procesos con error:", fallos)
+    return not errores and not fallos
+
+
+if __name__ == "__main__":
+    procesos = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    backend = sys.argv[3] if len(sys.argv) > 3 else "diario"
+    sys.exit(0 if estres(procesos, n, backend=backend) else 1)
@@ -0,0 +1,184 @@
+# nucleo_dashboard/fixtures_stdin.py
+# Requisito: Casi todos los scripts del repo se manejan con input(); queremos grabar una sesión
+#            interactiva una vez (desde el Dashboard) y reproducirla a toda velocidad para
+#            pruebas de regresión sin teclado y pruebas de carga.
+# Decisión: - grabar(): corre el script en un intérprete hijo con la terminal real y un
+#             builtins.input envuelto que anota cada respuesta; stdout pasa por un "tee" que
+#             guarda lo que se imprimió (incluidos los prompts). Al terminar (también con
+#             Ctrl+C) se escribe el fixture JSON en fixtures/.
+#           - reproducir(): manda las respuestas como stdin (sin pausas) con cualquier
+#             ejecutor del Dashboard (pool de intérpretes o subprocess) y compara la salida.
+#           - Carga: bucle=(a, b) repite las entradas[a:b] N veces dentro de UNA ejecución
+#             (p.ej. el ciclo "agregar estudiante" de un menú) y mide operaciones/segundo.
+#   python -m nucleo_dashboard.fixtures_stdin grabar <script.py> [nombre]
+#   python -m nucleo_dashboard.fixtures_stdin reproducir <fixture.json> [--repetir N] [--bucle A:B]
+#
+# Nota: si el script escribe archivos (inventarios, bitácoras), reproducirlo también los modifica.
+
+from __future__ import annotations
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+import difflib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+FORMATO = 1
+CARPETA = "fixtures"
+
+# Se ejecuta en el hijo: python -c _ARRANQUE <destino.json> <script.py>
+_ARRANQUE = r'''
+import builtins, io, json, os, runpy, sys
+destino, ruta = sys.argv[1], sys.argv[2]
+entradas, salida = [], []
+
+class _Tee:
+    """Copia todo lo impreso; sin fileno() para que input() escriba el prompt por aquí."""
+    def __init__(self, real): self.real = real
+    def write(self, s): salida.append(s); return self.real.write(s)
+    def flush(self): self.real.flush()
+    def fileno(self): raise io.UnsupportedOperation("fileno")
+    def isatty(self): return False
+    def __getattr__(self, n): return getattr(self.real, n)
+
+_input = builtins.input
+def _grabar(prompt=""):
+    try:
+        linea = _input(prompt)
+    except EOFError:
+        entradas.append(None); raise
+    entradas.append(linea)
+    return linea
+
+sys.stdout = _Tee(sys.stdout)
+builtins.input = _grabar
+sys.argv = [ruta]
+sys.path[0] = os.path.dirname(ruta)
+codigo = 0
+try:
+    runpy.run_path(ruta, run_name="__main__")
+except SystemExit as e:
+    codigo = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+except KeyboardInterrupt:
+    codigo = 130
+except BaseException:
+    import traceback; traceback.print_exc(); codigo = 1
+finally:
+    sys.stdout.flush()
+    with open(destino, "w", encoding="utf-8") as f:
+        json.dump({"entradas": entradas, "salida": "".join(salida), "returncode": codigo}, f, ensure_ascii=False)
+'''
+
+
+def ruta_fixture(raiz: str, script: str, nombre: str = "base") -> str:
+    """fixtures/<ruta del script con '/' -> '__'>.<nombre>.json (en la raíz del repo)."""
+    rel = os.path.relpath(os.path.abspath(script), raiz).replace(os.sep, "__")
+    return os.path.join(raiz, CARPETA, f"{rel}.{nombre}.json")
+
+
+def listar_fixtures(raiz: str, script: str) -> List[str]:
+    prefijo = os.path.basename(ruta_fixture(raiz, script, ""))  # "<rel>..json" sin nombre
+    prefijo = prefijo[:-len(".json")]
+    try:
+        return sorted(os.path.join(raiz, CARPETA, n) for n in os.listdir(os.path.join(raiz, CARPETA))
+                      if n.startswith(prefijo) and n.endswith(".json"))
+    except FileNotFoundError:
+        return []
+
+
+def cargar(ruta: str) -> Dict:
+    with open(ruta, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def grabar(script: str, raiz: str, nombre: str = "base") -> Tuple[str, Dict]:
+    """Sesión interactiva real (hereda la terminal); devuelve (ruta_del_fixture, fixture)."""
+    script = os.path.abspath(script)
+    fd, tmp = tempfile.mkstemp(suffix=".json"); os.close(fd)
+    try:
+        subprocess.run([sys.executable, "-c", _ARRANQUE, tmp, script], cwd=os.path.dirname(script))
+        with open(tmp, "r", encoding="utf-8") as f:
+            datos = json.load(f)
+    finally:
+        os.remove(tmp)
+    fixture = {"formato": FORMATO, "script": os.path.relpath(script, raiz).replace(os.sep, "/"),
+               "nombre": nombre, "creado": datetime.now().isoformat(timespec="seconds"), **datos}
+    destino = ruta_fixture(raiz, script, nombre)
+    os.makedirs(os.path.dirname(destino), exist_ok=True)
+    with open(destino, "w", encoding="utf-8") as f:
+        json.dump(fixture, f, ensure_ascii=False, indent=2)
+    return destino, fixture
+
+
+def expandir(entradas: List[Optional[str]], repeticiones: int = 1,
+             bucle: Optional[Tuple[int, int]] = None) -> List[str]:
+    """Entradas listas para stdin; con bucle=(a, b) repite entradas[a:b] 'repeticiones' veces."""
+    lineas = [e for e in entradas if e is not None]  # None = EOF grabado: basta con cerrar stdin
+    if bucle is not None:
+        a, b = bucle
+        return lineas[:a] + lineas[a:b] * repeticiones + lineas[b:]
+    return lineas
+
+
+def reproducir(fixture: Dict, raiz: str, ejecutor: Callable[[str, str], Dict],
+               repeticiones: int = 1, bucle: Optional[Tuple[int, int]] = None) -> Dict:
+    """
+    Reproduce el fixture con 'ejecutor(ruta, entrada)' (PoolInterpretes.ejecutar o
+    ejecutar_subproceso). Sin bucle/repeticiones compara stdout y returncode con lo grabado.
+    """
+    script = os.path.join(raiz, *fixture["script"].split("/"))
+    lineas = expandir(fixture["entradas"], repeticiones, bucle)
+    entrada = "".join(l + "\n" for l in lineas)
+    t0 = time.perf_counter()
+    res = ejecutor(script, entrada)
+    dur = time.perf_counter() - t0
+    informe = {"resultado": res, "operaciones": len(lineas), "duracion": dur,
+               "ops_por_s": len(lineas) / dur if dur > 0 else float("inf")}
+    if bucle is None and repeticiones == 1:
+        diff = list(difflib.unified_diff(fixture["salida"].splitlines(), res["stdout"].splitlines(),
+                                         "grabado", "ahora", lineterm="", n=1))
+        informe["coincide"] = not diff and res["returncode"] == fixture["returncode"]
+        informe["diff"] = diff
+    return informe
+
+
+def resumen(informe: Dict, max_diff: int = 40) -> str:
+    r = informe["resultado"]
+    lineas = [f"{informe['operaciones']} entradas en {informe['duracion'] * 1000:.1f} ms "
+              f"({informe['ops_por_s']:,.0f} ops/s), código {r['returncode']}"]
+    if "coincide" in informe:
+        if informe["coincide"]:
+            lineas.append("✔ La salida coincide con la grabación.")
+        else:
+            lineas.append("✘ La salida cambió respecto a la grabación:")
+            lineas += informe["diff"][:max_diff]
+            if len(informe["diff"]) > max_diff:
+                lineas.append(f"... ({len(informe['diff']) - max_diff} líneas más)")
+    if r["stderr"]:
+        lineas.append("[stderr]: " + r["stderr"].strip().splitlines()[-1])
+    return "\n".join(lineas)
+
+
+if __name__ == "__main__":
+    from nucleo_dashboard.pool_interpretes import PoolInterpretes, ejecutar_subproceso
+    args = sys.argv[1:]
+    raiz = os.getcwd()
+    if len(args) >= 2 and args[0] == "grabar":
+        destino, fx = grabar(args[1], raiz, args[2] if len(args) > 2 else "base")
+        print(f"\nFixture guardado: {os.path.relpath(destino, raiz)} ({len(fx['entradas'])} entradas)")
+    elif len(args) >= 2 and args[0] == "reproducir":
+        fx = cargar(args[1])
+        n = int(args[args.index("--repetir") + 1]) if "--repetir" in args else 1
+        bucle = tuple(int(x) for x in args[args.index("--bucle") + 1].split(":")) if "--bucle" in args else None
+        if PoolInterpretes.disponible():
+            with PoolInterpretes(tamano=1) as pool:
+                informe = reproducir(fx, raiz, pool.ejecutar, n, bucle)
+        else:
+            informe = reproducir(fx, raiz, ejecutar_subproceso, n, bucle)
+        print(resumen(informe))
+        sys.exit(0 if informe.get("coincide", True) else 1)
+    else:
+        sys.exit("Uso: python -m nucleo_dashboard.fixtures_stdin grabar <script.py> [nombre] | reproducir <fixture.json> [--repetir N] [--bucle A:B]")
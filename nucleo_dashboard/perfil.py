@@ -0,0 +1,74 @@
+# nucleo_dashboard/perfil.py
+# Requisito: Medir (y reportar) cuántas llamadas al sistema de archivos hace el Dashboard
+#            al navegar, para comprobar que las optimizaciones realmente las reducen.
+# Decisión: ContadorSyscalls envuelve temporalmente os.stat/lstat/readlink/scandir/listdir
+#           (las que usan os.path.realpath, isdir, scandir...) y cuenta cada llamada.
+#           Solo se activa con el interruptor --perfil del Dashboard; sin él no hay coste.
+
+from __future__ import annotations
+from collections import Counter
+from typing import Callable, Iterable
+import os
+import time
+
+FUNCIONES = ("stat", "lstat", "readlink", "scandir", "listdir")
+
+
+class ContadorSyscalls:
+    """Cuenta llamadas a funciones de os mientras está activo (también como 'with')."""
+
+    def __init__(self) -> None:
+        self.conteo: Counter = Counter()
+        self._originales = {}
+
+    def activar(self) -> None:
+        if self._originales:
+            return
+        for nombre in FUNCIONES:
+            original = getattr(os, nombre, None)
+            if original is None:
+                continue
+            self._originales[nombre] = original
+            setattr(os, nombre, self._envolver(nombre, original))
+
+    def _envolver(self, nombre: str, original: Callable) -> Callable:
+        conteo = self.conteo
+        def envuelta(*args, **kwargs):
+            conteo[nombre] += 1
+            return original(*args, **kwargs)
+        return envuelta
+
+    def desactivar(self) -> None:
+        for nombre, original in self._originales.items():
+            setattr(os, nombre, original)
+        self._originales.clear()
+
+    def total(self) -> int:
+        return sum(self.conteo.values())
+
+    def resumen(self) -> str:
+        partes = ", ".join(f"{k}={v}" for k, v in sorted(self.conteo.items()))
+        return f"{self.total()} llamadas ({partes or 'ninguna'})"
+
+    def __enter__(self) -> "ContadorSyscalls":
+        self.activar()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.desactivar()
+        return False
+
+
+def comparar(nombre: str, rutas: Iterable[str], anterior: Callable[[str], object],
+             nuevo: Callable[[str], object]) -> str:
+    """Ejecuta ambas versiones sobre las mismas rutas y reporta syscalls y tiempo de cada una."""
+    rutas = list(rutas)
+    filas = []
+    for etiqueta, fn in (("antes", anterior), ("ahora", nuevo)):
+        with ContadorSyscalls() as c:
+            t0 = time.perf_counter()
+            for r in rutas:
+                fn(r)
+            dt = time.perf_counter() - t0
+        filas.append(f"  {etiqueta}: {c.total():6d} syscalls, {dt * 1000:8.2f} ms")
+    return f"{nombre} ({len(rutas)} comprobaciones)\n" + "\n".join(filas)
@@ -0,0 +1,232 @@
+# nucleo_dashboard/pool_interpretes.py
+# Requisito: Ejecutar scripts del repo sin pagar el arranque del intérprete en cada corrida.
+# Decisión: Pool de procesos pre-bifurcados (os.fork) desde un proceso ya "calentado"
+#           (módulos frecuentes importados). Cada trabajador atiende UN script y muere:
+#             - __main__ nuevo (runpy.run_path con run_name="__main__"),
+#             - cwd = carpeta del script, sys.path[0] = carpeta del script,
+#             - stdin = fixture de texto, stdout/stderr capturados en memoria.
+#           Tras cada trabajo se bifurca un reemplazo para que el siguiente ya esté listo.
+#           CAMBIO: el padre bifurca UNA sola vez, al construir el pool, un "cigoto": proceso
+#           dedicado que importa la precarga, congela el gc (gc.freeze) y bifurca a los
+#           trabajadores cuando el padre se los pide. Las tuberías de cada trabajador llegan
+#           al padre por un socket Unix (SCM_RIGHTS). Así:
+#             - el padre no vuelve a hacer fork (puede tener hilos después de crear el pool),
+#             - el gc.freeze no deja objetos del padre en la generación permanente.
+#           Hay que construir el pool ANTES de arrancar hilos en el padre.
+#
+# Nota: os.fork solo existe en POSIX; en Windows PoolInterpretes.disponible() es False
+#       y el Dashboard sigue usando subprocess.
+
+from __future__ import annotations
+from collections import deque
+from typing import Deque, Dict, Iterable, NamedTuple
+import gc
+import importlib
+import io
+import json
+import os
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import time
+
+# Módulos que usan los scripts del curso; se importan una vez y los hijos los heredan.
+MODULOS_PRECARGA = ("abc", "csv", "dataclasses", "datetime", "gc", "json", "logging",
+                    "math", "pathlib", "random", "socket", "typing", "runpy", "traceback")
+
+
+_PID = struct.Struct("i")
+
+
+class _Trabajador(NamedTuple):
+    pid: int         # hijo del cigoto: lo recoge el cigoto, no el padre
+    w_trabajo: int   # padre -> hijo: JSON del trabajo
+    r_resultado: int  # hijo -> padre: JSON del resultado
+
+
+def _leer_todo(fd: int) -> bytes:
+    partes = []
+    while True:
+        b = os.read(fd, 65536)
+        if not b:
+            return b"".join(partes)
+        partes.append(b)
+
+
+def _escribir_todo(fd: int, datos: bytes) -> None:
+    vista = memoryview(datos)
+    while vista:
+        n = os.write(fd, vista)
+        vista = vista[n:]
+
+
+def _correr_aislado(ruta: str, entrada: str) -> Dict:
+    """Se ejecuta en el hijo: corre el script como si fuera 'python ruta'."""
+    import runpy, traceback
+    carpeta = os.path.dirname(os.path.abspath(ruta))
+    out, err = io.StringIO(), io.StringIO()
+    sys.stdin, sys.stdout, sys.stderr = io.StringIO(entrada), out, err
+    sys.argv = [ruta]
+    sys.path[0:1] = [carpeta]
+    codigo = 0
+    try:
+        os.chdir(carpeta)
+        runpy.run_path(ruta, run_name="__main__")
+    except SystemExit as e:
+        codigo = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        if e.code is not None and not isinstance(e.code, int):
+            print(e.code, file=err)
+    except BaseException:
+        traceback.print_exc(file=err)
+        codigo = 1
+    gc.collect()  # que los __del__ del script escriban antes de recoger la salida
+    return {"stdout": out.getvalue(), "stderr": err.getvalue(), "returncode": codigo}
+
+
+def _cigoto(canal: socket.socket, precarga: Iterable[str]) -> None:
+    """Se ejecuta en el proceso cigoto: precarga, congela el gc y bifurca trabajadores a pedido."""
+    for nombre in precarga:
+        try:
+            importlib.import_module(nombre)
+        except ImportError:
+            pass
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)  # el kernel recoge a los trabajadores terminados
+    signal.signal(signal.SIGINT, signal.SIG_IGN)   # Ctrl+C es para el Dashboard, no para el pool
+    gc.freeze()  # el gc de los trabajadores no recorre (ni copia por COW) lo heredado
+    while canal.recv(1):
+        r_trabajo, w_trabajo = os.pipe()
+        r_resultado, w_resultado = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # --- trabajador: espera un trabajo, lo corre y termina ---
+            estado = 0
+            try:
+                canal.close(); os.close(w_trabajo); os.close(r_resultado)
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)  # el script puede usar subprocess
+                signal.signal(signal.SIGINT, signal.default_int_handler)
+                datos = _leer_todo(r_trabajo)
+                if datos:  # vacío = el pool se cerró sin asignarle trabajo
+                    trabajo = json.loads(datos)
+                    res = _correr_aislado(trabajo["ruta"], trabajo["entrada"])
+                    _escribir_todo(w_resultado, json.dumps(res).encode("utf-8"))
+            except BaseException:
+                estado = 1
+            finally:
+                os._exit(estado)
+        os.close(r_trabajo); os.close(w_resultado)
+        socket.send_fds(canal, [_PID.pack(pid)], [w_trabajo, r_resultado])
+        os.close(w_trabajo); os.close(r_resultado)
+    try:  # pool cerrado: esperar a que terminen los trabajadores (no dejarlos huérfanos)
+        while True:
+            os.wait()
+    except ChildProcessError:
+        pass
+
+
+class PoolInterpretes:
+    """Pool de intérpretes pre-bifurcados; uso: with PoolInterpretes() as pool: pool.ejecutar(ruta)."""
+
+    def __init__(self, tamano: int = 2, precarga: Iterable[str] = MODULOS_PRECARGA) -> None:
+        if not self.disponible():
+            raise RuntimeError("PoolInterpretes requiere os.fork (POSIX).")
+        self.tamano = max(1, tamano)
+        self._libres: Deque[_Trabajador] = deque()
+        self._cerrado = False
+        self._canal, canal_cigoto = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        sys.stdout.flush(); sys.stderr.flush()  # no duplicar buffers pendientes en el hijo
+        self._cigoto = os.fork()
+        if self._cigoto == 0:
+            estado = 0
+            try:
+                self._canal.close()
+                _cigoto(canal_cigoto, tuple(precarga))
+            except BaseException:
+                estado = 1
+            finally:
+                os._exit(estado)
+        canal_cigoto.close()
+        for _ in range(self.tamano):
+            self._libres.append(self._bifurcar())
+
+    @staticmethod
+    def disponible() -> bool:
+        return hasattr(os, "fork") and hasattr(socket, "send_fds")
+
+    def _bifurcar(self) -> _Trabajador:
+        """Pide un trabajador nuevo al cigoto (el padre no hace fork)."""
+        self._canal.sendall(b"+")
+        datos, fds, _, _ = socket.recv_fds(self._canal, _PID.size, 2)
+        if len(datos) != _PID.size or len(fds) != 2:
+            for fd in fds:
+                os.close(fd)
+            raise RuntimeError("El proceso cigoto del pool terminó inesperadamente.")
+        return _Trabajador(_PID.unpack(datos)[0], fds[0], fds[1])
+
+    def ejecutar(self, ruta: str, entrada: str = "") -> Dict:
+        """Corre 'ruta' en un trabajador caliente; devuelve stdout/stderr/returncode/duracion."""
+        if self._cerrado:
+            raise RuntimeError("Pool cerrado.")
+        t0 = time.perf_counter()
+        t = self._libres.popleft() if self._libres else self._bifurcar()
+        try:
+            _escribir_todo(t.w_trabajo, json.dumps({"ruta": os.path.abspath(ruta), "entrada": entrada}).encode("utf-8"))
+            os.close(t.w_trabajo)
+            datos = _leer_todo(t.r_resultado)
+        finally:
+            os.close(t.r_resultado)
+        if datos:
+            res = json.loads(datos)
+        else:
+            res = {"stdout": "", "stderr": "El trabajador terminó sin resultado.\n", "returncode": 1}
+        res["duracion"] = round(time.perf_counter() - t0, 4)
+        self._libres.append(self._bifurcar())  # reponer: el siguiente ya estará caliente
+        return res
+
+    def close(self) -> None:
+        """Cierra los trabajadores ociosos (idempotente)."""
+        if self._cerrado:
+            return
+        self._cerrado = True
+        while self._libres:
+            t = self._libres.popleft()
+            for fd in (t.w_trabajo, t.r_resultado):  # sin trabajo: el trabajador termina solo
+                try: os.close(fd)
+                except OSError: pass
+        self._canal.close()  # EOF: el cigoto termina
+        try: os.waitpid(self._cigoto, 0)
+        except ChildProcessError: pass
+
+    def __enter__(self) -> "PoolInterpretes":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+
+def ejecutar_subproceso(ruta: str, entrada: str = "") -> Dict:
+    """Ejecutor de referencia: un intérprete nuevo por corrida (mismo formato que el pool)."""
+    t0 = time.perf_counter()
+    ruta = os.path.abspath(ruta)
+    res = subprocess.run([sys.executable, ruta], input=entrada, text=True,
+                         capture_output=True, cwd=os.path.dirname(ruta) or None)
+    return {"stdout": res.stdout, "stderr": res.stderr, "returncode": res.returncode,
+            "duracion": round(time.perf_counter() - t0, 4)}
+
+
+# --- Comparativa rápida: python -m nucleo_dashboard.pool_interpretes <script.py> [repeticiones] ---
+if __name__ == "__main__":
+    ruta = os.path.abspath(sys.argv[1])
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    t0 = time.perf_counter()
+    for _ in range(n):
+        ejecutar_subproceso(ruta)
+    t_sub = (time.perf_counter() - t0) / n
+    with PoolInterpretes() as pool:
+        t0 = time.perf_counter()
+        for _ in range(n):
+            pool.ejecutar(ruta)
+        t_pool = (time.perf_counter() - t0) / n
+    print(f"subprocess: {t_sub * 1000:.1f} ms/corrida | pool: {t_pool * 1000:.1f} ms/corrida "
+          f"({t_sub / t_pool:.1f}x)")
@@ -0,0 +1,298 @@
+# nucleo_dashboard/tui.py
+# Requisito: Un núcleo de interfaz de terminal que no se bloquee en input(): las teclas llegan
+#            como eventos, solo se redibuja lo que cambió y hay tareas en segundo plano
+#            (indexar, ejecutar scripts, vigilar archivos) que avanzan mientras se navega.
+# Decisión: - Terminal: modo cbreak (termios) + pantalla alternativa; stdin se lee con
+#             loop.add_reader y cada tecla se publica en la cola de eventos.
+#           - Pantalla: guarda el último cuadro y escribe SOLO las líneas distintas
+#             (posicionando el cursor), así un cambio en la barra de estado no repinta la lista.
+#           - Aplicacion: una pila de Vistas + asyncio.Queue de eventos. lanzar() corre funciones
+#             bloqueantes en un ThreadPool y avisa al terminar; publicar() es seguro desde hilos.
+#           Solo POSIX con terminal real (Terminal.disponible()); si no, el Dashboard usa su
+#           modo clásico con input().
+
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+import asyncio
+import codecs
+import os
+import re
+import shutil
+import sys
+import time
+
+ESC = "\033"
+INVERSO, RESET = f"{ESC}[7m", f"{ESC}[0m"
+_ANSI = re.compile(r"\033\[[0-9;?]*[A-Za-z]")
+GIRO = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+
+SECUENCIAS = {
+    f"{ESC}[A": "arriba", f"{ESC}[B": "abajo", f"{ESC}[C": "derecha", f"{ESC}[D": "izquierda",
+    f"{ESC}OA": "arriba", f"{ESC}OB": "abajo", f"{ESC}OC": "derecha", f"{ESC}OD": "izquierda",
+    f"{ESC}[5~": "repag", f"{ESC}[6~": "avpag", f"{ESC}[H": "inicio", f"{ESC}[F": "fin",
+    f"{ESC}[1~": "inicio", f"{ESC}[4~": "fin",
+}
+
+
+def teclas(texto: str) -> List[str]:
+    """Convierte lo leído de stdin en nombres de tecla ('arriba', 'enter', 'a', ...)."""
+    res, i = [], 0
+    while i < len(texto):
+        c = texto[i]
+        if c == ESC:
+            for seq, nombre in SECUENCIAS.items():
+                if texto.startswith(seq, i):
+                    res.append(nombre); i += len(seq); break
+            else:
+                res.append("esc"); i += 1
+            continue
+        res.append("enter" if c in "\r\n" else "borrar" if c in "\x7f\x08" else c)
+        i += 1
+    return res
+
+
+def recortar(linea: str, ancho: int) -> str:
+    """Corta 'linea' a 'ancho' columnas visibles sin romper las secuencias ANSI."""
+    if len(linea) <= ancho:
+        return linea
+    partes, visibles, pos, con_color = [], 0, 0, False
+    for m in _ANSI.finditer(linea):
+        texto = linea[pos:m.start()]
+        if visibles + len(texto) >= ancho:
+            partes.append(texto[:ancho - visibles]); visibles = ancho
+            break
+        partes.append(texto); visibles += len(texto)
+        partes.append(m.group()); con_color = True
+        pos = m.end()
+    else:
+        partes.append(linea[pos:pos + ancho - visibles])
+    return "".join(partes) + (RESET if con_color else "")
+
+
+class Pantalla:
+    """Dibuja cuadros completos pero solo escribe las líneas que cambiaron."""
+
+    def __init__(self, escribir: Callable[[str], None]) -> None:
+        self._escribir = escribir
+        self._previas: List[str] = []
+        self.lineas_escritas = 0  # estadística: cuántas líneas se repintaron en total
+
+    def invalidar(self) -> None:
+        self._previas = []
+        self._escribir(f"{ESC}[H{ESC}[2J")
+
+    def dibujar(self, lineas: List[str]) -> int:
+        cambios = []
+        for i, l in enumerate(lineas):
+            if i >= len(self._previas) or self._previas[i] != l:
+                cambios.append(f"{ESC}[{i + 1};1H{l}{ESC}[K")
+        for i in range(len(lineas), len(self._previas)):
+            cambios.append(f"{ESC}[{i + 1};1H{ESC}[K")
+        if cambios:
+            self._escribir("".join(cambios))
+        self._previas = list(lineas)
+        self.lineas_escritas += len(cambios)
+        return len(cambios)
+
+
+class Terminal:
+    """Modo cbreak + pantalla alternativa; publica teclas y cambios de tamaño como eventos."""
+
+    def __init__(self, entrada=None, salida=None) -> None:
+        self.entrada = entrada or sys.stdin
+        self.salida = salida or sys.stdout
+        self._fd = self.entrada.fileno()
+        self._atributos = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._decodificador = codecs.getincrementaldecoder("utf-8")("replace")
+
+    @staticmethod
+    def disponible() -> bool:
+        try:
+            import termios, tty  # noqa: F401  (solo POSIX)
+        except ImportError:
+            return False
+        return sys.stdin.isatty() and sys.stdout.isatty()
+
+    def tamano(self) -> Tuple[int, int]:
+        t = shutil.get_terminal_size()
+        return t.lines, t.columns
+
+    def escribir(self, texto: str) -> None:
+        self.salida.write(texto); self.salida.flush()
+
+    def abrir(self, loop: asyncio.AbstractEventLoop, publicar: Callable[[tuple], None]) -> None:
+        import signal, termios, tty
+        self._loop = loop
+        self._atributos = termios.tcgetattr(self._fd)
+        tty.setcbreak(self._fd)
+        self.escribir(f"{ESC}[?1049h{ESC}[?25l")  # pantalla alternativa + ocultar cursor
+
+        def leer():
+            try:
+                datos = os.read(self._fd, 1024)
+            except OSError:
+                datos = b""
+            if not datos:
+                publicar(("tecla", "fin_entrada")); return
+            for k in teclas(self._decodificador.decode(datos)):
+                publicar(("tecla", k))
+
+        loop.add_reader(self._fd, leer)
+        try:
+            loop.add_signal_handler(signal.SIGWINCH, lambda: publicar(("redimensionar",)))
+        except (ValueError, RuntimeError, AttributeError):
+            pass
+
+    def cerrar(self) -> None:
+        import signal, termios
+        if self._loop is not None:
+            self._loop.remove_reader(self._fd)
+            try: self._loop.remove_signal_handler(signal.SIGWINCH)
+            except (ValueError, RuntimeError, AttributeError): pass
+        if self._atributos is not None:
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._atributos)
+        self.escribir(f"{ESC}[?25h{ESC}[?1049l")
+
+
+class Vista:
+    """Una pantalla de la TUI. Las subclases implementan cuerpo() y tecla()."""
+    titulo = ""
+    ayuda = "q) Volver"
+
+    def cuerpo(self, app: "Aplicacion", alto: int, ancho: int) -> List[str]:
+        return []
+
+    def tecla(self, app: "Aplicacion", k: str) -> None:
+        if k in ("q", "esc"):
+            app.cerrar()
+
+    def evento(self, app: "Aplicacion", ev: tuple) -> None:
+        """Eventos que no son teclas (archivos, tareas...). Por defecto basta con redibujar."""
+
+
+class Aplicacion:
+    """Bucle de eventos de la TUI: pila de vistas, cola de eventos y tareas en segundo plano."""
+
+    def __init__(self, vista: Vista, terminal: Optional[Terminal] = None, hilos: int = 4) -> None:
+        self.pila: List[Vista] = [vista]
+        self.terminal = terminal or Terminal()
+        self.pantalla = Pantalla(self.terminal.escribir)
+        self.cola: "asyncio.Queue[tuple]" = asyncio.Queue()
+        self.tareas: Dict[str, float] = {}  # nombre -> inicio
+        self._ejecutor = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="tui")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ticker: Optional[asyncio.Task] = None
+        self._mensaje: Tuple[str, float] = ("", 0.0)
+        self._giro = 0
+
+    # --- API para las vistas ---
+    def abrir(self, vista: Vista) -> None:
+        self.pila.append(vista)
+
+    def cerrar(self) -> None:
+        self.pila.pop()
+
+    def salir(self) -> None:
+        self.pila.clear()
+
+    def mensaje(self, texto: str, segundos: float = 3.0) -> None:
+        self._mensaje = (texto, time.monotonic() + segundos)
+        self._asegurar_ticker()
+
+    def publicar(self, ev: tuple) -> None:
+        """Encola un evento; se puede llamar desde cualquier hilo."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self.cola.put_nowait, ev)
+
+    def lanzar(self, nombre: str, fn: Callable, *args,
+               al_terminar: Optional[Callable[[object], None]] = None) -> bool:
+        """Corre fn(*args) en segundo plano; al_terminar(resultado) se llama en el bucle.
+        Devuelve False si ya hay una tarea con ese nombre en curso."""
+        if nombre in self.tareas:
+            return False
+        self.tareas[nombre] = time.monotonic()
+        fut = self._loop.run_in_executor(self._ejecutor, fn, *args)
+        fut.add_done_callback(lambda f: self.cola.put_nowait(("tarea", nombre, f, al_terminar)))
+        self._asegurar_ticker()
+        return True
+
+    # --- internos ---
+    def _asegurar_ticker(self) -> None:
+        if self._loop is not None and (self._ticker is None or self._ticker.done()):
+            self._ticker = self._loop.create_task(self._latir())
+
+    async def _latir(self) -> None:
+        """Mientras haya tareas o un mensaje visible, anima la barra de estado (solo esa línea)."""
+        while self.tareas or time.monotonic() < self._mensaje[1]:
+            await asyncio.sleep(0.1)
+            self.cola.put_nowait(("tick",))
+        self.cola.put_nowait(("tick",))  # un último cuadro para borrar el mensaje vencido
+
+    def _estado(self, ancho: int) -> str:
+        vista = self.pila[-1]
+        derecha = ""
+        if self.tareas:
+            g = GIRO[self._giro % len(GIRO)]
+            derecha = " · ".join(f"{g} {n} {time.monotonic() - t0:.1f}s" for n, t0 in self.tareas.items())
+        if time.monotonic() < self._mensaje[1]:
+            derecha = self._mensaje[0] + ("   " + derecha if derecha else "")
+        hueco = max(1, ancho - len(vista.ayuda) - len(derecha))
+        return INVERSO + recortar(vista.ayuda + " " * hueco + derecha, ancho) + RESET
+
+    def _cuadro(self) -> List[str]:
+        alto, ancho = self.terminal.tamano()
+        vista = self.pila[-1]
+        cuerpo = vista.cuerpo(self, alto - 2, ancho)[:alto - 2]
+        cuerpo += [""] * (alto - 2 - len(cuerpo))
+        titulo = INVERSO + recortar(f" {vista.titulo}".ljust(ancho), ancho) + RESET
+        return [titulo] + [recortar(l, ancho) for l in cuerpo] + [self._estado(ancho)]
+
+    def _despachar(self, ev: tuple) -> None:
+        tipo = ev[0]
+        if tipo == "tecla":
+            if ev[1] == "fin_entrada":
+                self.salir()
+            elif self.pila:
+                self.pila[-1].tecla(self, ev[1])
+        elif tipo == "tick":
+            self._giro += 1
+        elif tipo == "redimensionar":
+            self.pantalla.invalidar()
+        elif tipo == "tarea":
+            _, nombre, fut, al_terminar = ev
+            self.tareas.pop(nombre, None)
+            try:
+                resultado = fut.result()
+            except Exception as e:
+                self.mensaje(f"✘ {nombre}: {e}", 6); return
+            if al_terminar is not None:
+                al_terminar(resultado)
+        if self.pila and tipo not in ("tecla", "tick", "redimensionar"):
+            self.pila[-1].evento(self, ev)
+
+    async def correr(self, al_iniciar: Optional[Callable[["Aplicacion"], None]] = None) -> None:
+        """Bucle principal; al_iniciar(app) sirve para lanzar tareas de fondo desde el arranque."""
+        self._loop = asyncio.get_running_loop()
+        self.terminal.abrir(self._loop, self.publicar)
+        try:
+            if al_iniciar is not None:
+                al_iniciar(self)
+            self.pantalla.invalidar()
+            self.pantalla.dibujar(self._cuadro())
+            while self.pila:
+                eventos = [await self.cola.get()]
+                while not self.cola.empty():  # agrupar ráfagas: un solo redibujado
+                    eventos.append(self.cola.get_nowait())
+                for ev in eventos:
+                    if self.pila:
+                        self._despachar(ev)
+                if self.pila:
+                    self.pantalla.dibujar(self._cuadro())
+        finally:
+            if self._ticker is not None:
+                self._ticker.cancel()
+            self._ejecutor.shutdown(wait=False, cancel_futures=True)
+            self.terminal.cerrar()
+            self._loop = None  # publicar() desde otros hilos deja de encolar
@@ -0,0 +1,307 @@
+# nucleo_dashboard/vigilante.py
+# Requisito: Que el Dashboard se entere de los cambios en disco (archivos creados por otro
+#            proceso, tareas.json modificado) sin volver a escanear en cada redibujado.
+# Decisión: - Vigilante: hilo en segundo plano que vigila carpetas y publica Eventos a los
+#             suscriptores. En Linux usa inotify (vía ctypes, solo biblioteca estándar);
+#             en otros sistemas, o si inotify no está disponible, compara instantáneas de
+#             cada carpeta vigilada cada 'intervalo' segundos (sondeo).
+#           - ListadosVigilados: caché de listados (carpetas/archivos) por carpeta que se
+#             mantiene al día aplicando los eventos; el navegador lee de aquí sin scandir.
+#             Los eventos que llegan MIENTRAS se escanea una carpeta se guardan y se re-aplican
+#             sobre el listado recién guardado (crear/borrar son idempotentes); si se pierden
+#             eventos (desbordado) durante el escaneo, se vuelve a escanear.
+#   python -m nucleo_dashboard.vigilante [carpeta]   (imprime los eventos; Ctrl+C para salir)
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+
+class Evento(NamedTuple):
+    carpeta: Optional[str]  # None = se perdieron eventos: invalidar todo
+    nombre: str
+    tipo: str               # "creado" | "borrado" | "modificado" | "desbordado"
+    es_dir: bool
+
+
+# --- inotify (Linux) ---
+IN_MODIFY, IN_ATTRIB, IN_CLOSE_WRITE = 0x2, 0x4, 0x8
+IN_MOVED_FROM, IN_MOVED_TO, IN_CREATE, IN_DELETE = 0x40, 0x80, 0x100, 0x200
+IN_DELETE_SELF, IN_MOVE_SELF, IN_Q_OVERFLOW, IN_IGNORED = 0x400, 0x800, 0x4000, 0x8000
+IN_ISDIR = 0x40000000
+MASCARA = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+           | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+_CABECERA = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def _libc_inotify():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes, ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1; libc.inotify_add_watch; libc.inotify_rm_watch
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class Vigilante:
+    """Vigila carpetas en un hilo; uso: v = Vigilante(); v.suscribir(fn); v.vigilar(ruta); v.iniciar()."""
+
+    def __init__(self, intervalo: float = 0.5, backend: Optional[str] = None) -> None:
+        self.intervalo = intervalo
+        self._suscriptores: List[Callable[[Evento], None]] = []
+        self._lock = threading.Lock()
+        self._hilo: Optional[threading.Thread] = None
+        self._parar = threading.Event()
+        self._libc = _libc_inotify() if backend in (None, "inotify") else None
+        self._fd = -1
+        if self._libc is not None:
+            self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if self._fd < 0:
+                self._libc = None
+        if backend == "inotify" and self._libc is None:
+            raise OSError("inotify no disponible en este sistema.")
+        self.backend = "inotify" if self._libc is not None else "sondeo"
+        self._wd: Dict[int, str] = {}          # inotify: descriptor -> carpeta
+        self._carpetas: Dict[str, object] = {}  # carpeta -> wd (inotify) o instantánea (sondeo)
+        self._despertar_r, self._despertar_w = os.pipe()
+
+    # --- API ---
+    def suscribir(self, fn: Callable[[Evento], None]) -> None:
+        self._suscriptores.append(fn)
+
+    def vigilar(self, carpeta: str) -> bool:
+        """Empieza a vigilar 'carpeta'; True si no estaba vigilada ya."""
+        carpeta = os.path.abspath(carpeta)
+        with self._lock:
+            if carpeta in self._carpetas:
+                return False
+            if self.backend == "inotify":
+                wd = self._libc.inotify_add_watch(self._fd, os.fsencode(carpeta), MASCARA)
+                if wd < 0:
+                    return False
+                self._wd[wd] = carpeta
+                self._carpetas[carpeta] = wd
+            else:
+                self._carpetas[carpeta] = self._instantanea(carpeta)
+            return True
+
+    def dejar(self, carpeta: str) -> None:
+        carpeta = os.path.abspath(carpeta)
+        with self._lock:
+            dato = self._carpetas.pop(carpeta, None)
+            if self.backend == "inotify" and dato is not None:
+                self._wd.pop(dato, None)
+                self._libc.inotify_rm_watch(self._fd, dato)
+
+    def vigiladas(self) -> List[str]:
+        with self._lock:
+            return list(self._carpetas)
+
+    def iniciar(self) -> "Vigilante":
+        if self._hilo is None:
+            destino = self._bucle_inotify if self.backend == "inotify" else self._bucle_sondeo
+            self._hilo = threading.Thread(target=destino, name="vigilante", daemon=True)
+            self._hilo.start()
+        return self
+
+    def detener(self) -> None:
+        """Detiene el hilo y libera los descriptores (idempotente)."""
+        if self._parar.is_set():
+            return
+        self._parar.set()
+        try: os.write(self._despertar_w, b"x")
+        except OSError: pass
+        if self._hilo is not None:
+            self._hilo.join(timeout=2)
+        for fd in (self._fd, self._despertar_r, self._despertar_w):
+            if fd >= 0:
+                try: os.close(fd)
+                except OSError: pass
+        self._fd = -1
+
+    def __enter__(self) -> "Vigilante":
+        return self.iniciar()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.detener()
+        return False
+
+    # --- internos ---
+    def _publicar(self, ev: Evento) -> None:
+        for fn in list(self._suscriptores):
+            try:
+                fn(ev)
+            except Exception:
+                pass  # un suscriptor con error no debe matar el hilo
+
+    def _bucle_inotify(self) -> None:
+        while not self._parar.is_set():
+            try:
+                listos, _, _ = select.select([self._fd, self._despertar_r], [], [])
+            except (OSError, ValueError):
+                return
+            if self._despertar_r in listos:
+                return
+            try:
+                datos = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            except OSError:
+                return
+            pos = 0
+            while pos + _CABECERA.size <= len(datos):
+                wd, mask, _, largo = _CABECERA.unpack_from(datos, pos)
+                nombre = os.fsdecode(datos[pos + _CABECERA.size:pos + _CABECERA.size + largo].rstrip(b"\0"))
+                pos += _CABECERA.size + largo
+                if mask & IN_Q_OVERFLOW:
+                    self._publicar(Evento(None, "", "desbordado", False)); continue
+                with self._lock:
+                    carpeta = self._wd.get(wd)
+                    if mask & IN_IGNORED and carpeta is not None:  # la carpeta ya no existe
+                        self._wd.pop(wd, None); self._carpetas.pop(carpeta, None)
+                if carpeta is None or mask & IN_IGNORED:
+                    continue
+                es_dir = bool(mask & IN_ISDIR)
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self._publicar(Evento(carpeta, nombre, "creado", es_dir))
+                elif mask & (IN_DELETE | IN_MOVED_FROM):
+                    self._publicar(Evento(carpeta, nombre, "borrado", es_dir))
+                elif mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                    self._publicar(Evento(carpeta, "", "borrado", True))
+                elif nombre:
+                    self._publicar(Evento(carpeta, nombre, "modificado", es_dir))
+
+    @staticmethod
+    def _instantanea(carpeta: str) -> Optional[Dict[str, Tuple[bool, int, int]]]:
+        foto = {}
+        try:
+            with os.scandir(carpeta) as it:
+                for e in it:
+                    try:
+                        st = e.stat()
+                    except OSError:
+                        continue  # se borró mientras se listaba
+                    foto[e.name] = (e.is_dir(), st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+        return foto
+
+    def _bucle_sondeo(self) -> None:
+        while not self._parar.wait(self.intervalo):
+            with self._lock:
+                carpetas = list(self._carpetas.items())
+            for carpeta, antes in carpetas:
+                ahora = self._instantanea(carpeta)
+                if ahora == antes:
+                    continue
+                with self._lock:
+                    if carpeta not in self._carpetas:
+                        continue
+                    self._carpetas[carpeta] = ahora
+                if ahora is None:
+                    self._publicar(Evento(carpeta, "", "borrado", True)); continue
+                antes = antes or {}
+                for nombre in ahora.keys() - antes.keys():
+                    self._publicar(Evento(carpeta, nombre, "creado", ahora[nombre][0]))
+                for nombre in antes.keys() - ahora.keys():
+                    self._publicar(Evento(carpeta, nombre, "borrado", antes[nombre][0]))
+                for nombre in ahora.keys() & antes.keys():
+                    if ahora[nombre] != antes[nombre]:
+                        self._publicar(Evento(carpeta, nombre, "modificado", ahora[nombre][0]))
+
+
+class ListadosVigilados:
+    """Listados (carpetas, archivos) por carpeta, actualizados por eventos en vez de re-escanear."""
+
+    def __init__(self, vigilante: Vigilante, max_carpetas: int = 64) -> None:
+        self.vigilante = vigilante
+        self.max_carpetas = max_carpetas
+        self._lock = threading.Lock()
+        self._listados: "OrderedDict[str, Tuple[Set[str], Set[str]]]" = OrderedDict()
+        self.cambios: Dict[str, int] = {}  # carpeta -> nº de eventos aplicados (para avisar en la vista)
+        self._propias: Set[str] = set()    # carpetas que vigila por este caché (las suelta al desalojar)
+        self._escaneando: Dict[str, Optional[List[Evento]]] = {}  # eventos durante el scandir (None = desbordó)
+        vigilante.suscribir(self._aplicar)
+
+    def listar(self, carpeta: str) -> Tuple[List[str], List[str]]:
+        """(carpetas, archivos) ordenados; solo hace scandir la primera vez (o tras desbordar)."""
+        carpeta = os.path.abspath(carpeta)
+        with self._lock:
+            listado = self._listados.get(carpeta)
+            if listado is not None:
+                self._listados.move_to_end(carpeta)
+                return sorted(listado[0]), sorted(listado[1])
+        with self._lock:
+            self._escaneando[carpeta] = []  # CAMBIO: desde ya, _aplicar anota aquí lo que llegue
+        if self.vigilante.vigilar(carpeta):  # antes del scandir: no perder cambios intermedios
+            self._propias.add(carpeta)
+        while True:
+            try:
+                dirs, files = set(), set()
+                with os.scandir(carpeta) as it:  # FileNotFoundError la maneja quien llama
+                    for e in it:
+                        if e.is_dir(): dirs.add(e.name)
+                        elif e.is_file(): files.add(e.name)
+            except BaseException:
+                with self._lock:
+                    self._escaneando.pop(carpeta, None)
+                raise
+            with self._lock:
+                durante = self._escaneando.pop(carpeta)
+                if durante is None:  # se perdieron eventos durante el escaneo: otra vez
+                    self._escaneando[carpeta] = []; continue
+                self._listados[carpeta] = (dirs, files)
+                for ev in durante:
+                    self._aplicar_a(ev, (dirs, files))
+                while len(self._listados) > self.max_carpetas:
+                    vieja, _ = self._listados.popitem(last=False)
+                    if vieja in self._propias:
+                        self._propias.discard(vieja); self.vigilante.dejar(vieja)
+                return sorted(dirs), sorted(files)
+
+    def _aplicar(self, ev: Evento) -> None:
+        with self._lock:
+            if ev.carpeta is None:  # desbordado: todo se relista al próximo uso
+                self._listados.clear()
+                for carpeta in self._escaneando:
+                    self._escaneando[carpeta] = None
+                return
+            durante = self._escaneando.get(ev.carpeta)
+            if durante is not None:
+                durante.append(ev)  # se re-aplica cuando termine el scandir
+            listado = self._listados.get(ev.carpeta)
+            if listado is not None:
+                self._aplicar_a(ev, listado)
+
+    def _aplicar_a(self, ev: Evento, listado: Tuple[Set[str], Set[str]]) -> None:
+        """Aplica un evento a un listado (con self._lock tomado)."""
+        if not ev.nombre:  # la propia carpeta desapareció
+            self._listados.pop(ev.carpeta, None)
+        elif ev.tipo == "creado":
+            (listado[0] if ev.es_dir else listado[1]).add(ev.nombre)
+        elif ev.tipo == "borrado":
+            listado[0].discard(ev.nombre); listado[1].discard(ev.nombre)
+        else:
+            return
+        self.cambios[ev.carpeta] = self.cambios.get(ev.carpeta, 0) + 1
+
+
+if __name__ == "__main__":
+    carpeta = sys.argv[1] if len(sys.argv) > 1 else "."
+    with Vigilante() as v:
+        v.suscribir(lambda ev: print(f"{time.strftime('%H:%M:%S')} {ev.tipo:<10} {ev.carpeta} :: {ev.nombre}"))
+        v.vigilar(carpeta)
+        print(f"Vigilando {os.path.abspath(carpeta)} ({v.backend}). Ctrl+C para salir.")
+        try:
+            while True: time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,195 @@
+# nucleo_dashboard/visor_codigo.py
+# Requisito: Ver código en el Dashboard sin inundar la terminal ni releer el archivo cada vez,
+#            con resaltado de sintaxis, y que abrir un archivo de 50k líneas sea instantáneo.
+# Decisión: - DocumentoCodigo lee el archivo una vez y resalta de forma PEREZOSA: el tokenizador
+#             de Python (tokenize.generate_tokens) avanza solo hasta la última línea pedida,
+#             así la primera pantalla no depende del tamaño del archivo.
+#           - CacheRender guarda documentos por (ruta, mtime, tamaño): volver a abrir un archivo
+#             sin cambios reutiliza lo ya leído y coloreado (LRU de pocos documentos).
+#           - paginar() muestra una pantalla a la vez; si la salida no es una terminal o el
+#             archivo cabe en pantalla, imprime todo sin preguntar (como hace 'less').
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import builtins
+import keyword
+import os
+import shutil
+import sys
+import token
+import tokenize
+
+# Colores ANSI por categoría de token
+RESET = "\033[0m"
+COLORES = {
+    "keyword": "\033[35m",   # magenta
+    "builtin": "\033[36m",   # cian
+    "definicion": "\033[1;34m",  # azul negrita: nombre tras def/class
+    "string": "\033[32m",    # verde
+    "numero": "\033[33m",    # amarillo
+    "comentario": "\033[90m",  # gris
+    "decorador": "\033[33m",
+    "num_linea": "\033[2m",
+}
+_BUILTINS = frozenset(n for n in dir(builtins) if not n.startswith("_"))
+_SOFT = frozenset(getattr(keyword, "softkwlist", ()))
+
+Span = Tuple[int, int, str]  # (columna_inicio, columna_fin, color)
+
+
+def _categoria(tipo: int, texto: str, previo: str) -> Optional[str]:
+    if tipo == token.NAME:
+        if previo in ("def", "class"):
+            return "definicion"
+        if keyword.iskeyword(texto) or texto in _SOFT:
+            return "keyword"
+        if texto in _BUILTINS:
+            return "builtin"
+        return None
+    if tipo == token.STRING:
+        return "string"
+    if tipo == token.NUMBER:
+        return "numero"
+    if tipo == token.COMMENT:
+        return "comentario"
+    if tipo == token.OP and texto == "@":
+        return "decorador"
+    return None
+
+
+class DocumentoCodigo:
+    """Líneas de un archivo + resaltado calculado bajo demanda (línea i -> texto con ANSI)."""
+
+    def __init__(self, ruta: str, color: bool = True) -> None:
+        with open(ruta, "r", encoding="utf-8") as f:
+            self.lineas: List[str] = f.read().splitlines()
+        self.ruta = ruta
+        self.color = color
+        self._render: List[str] = []             # líneas ya renderizadas (prefijo del archivo)
+        self._spans: Dict[int, List[Span]] = {}  # fila (0-based) -> spans aún sin renderizar
+        self._tokens: Optional[Iterator] = None
+        self._fila_tokens = 0                    # filas < esta ya tienen todos sus tokens
+        self._previo = ""                        # último token significativo (para def/class)
+        if color and ruta.endswith((".py", ".pyw")):
+            fuente = iter([l + "\n" for l in self.lineas])
+            self._tokens = tokenize.generate_tokens(lambda: next(fuente, ""))
+
+    def __len__(self) -> int:
+        return len(self.lineas)
+
+    def _avanzar_tokens(self, fila: int) -> None:
+        """Consume tokens hasta que todos los que tocan 'fila' (0-based) estén registrados."""
+        while self._tokens is not None and self._fila_tokens <= fila:
+            try:
+                tok = next(self._tokens)
+            except StopIteration:
+                self._tokens = None
+            except (tokenize.TokenError, SyntaxError):
+                self._tokens = None  # código inválido: el resto queda sin color
+            else:
+                (f0, c0), (f1, c1) = tok.start, tok.end
+                # los tokens salen en orden de inicio: las filas anteriores a f0 ya están completas
+                self._fila_tokens = max(self._fila_tokens, f0 - 1)
+                cat = _categoria(tok.type, tok.string, self._previo)
+                if tok.type not in (token.NL, token.NEWLINE, token.INDENT, token.DEDENT):
+                    self._previo = tok.string
+                if cat is None:
+                    continue
+                for f in range(f0 - 1, f1):  # un string triple puede abarcar varias filas
+                    ini = c0 if f == f0 - 1 else 0
+                    fin = c1 if f == f1 - 1 else len(self.lineas[f]) if f < len(self.lineas) else 0
+                    self._spans.setdefault(f, []).append((ini, fin, COLORES[cat]))
+        if self._tokens is None:
+            self._fila_tokens = len(self.lineas)
+
+    def _colorear(self, fila: int) -> str:
+        texto = self.lineas[fila]
+        spans = self._spans.pop(fila, None)
+        if not spans:
+            return texto
+        partes, pos = [], 0
+        for ini, fin, color in sorted(spans):
+            if ini < pos:
+                continue
+            partes.append(texto[pos:ini]); partes.append(color + texto[ini:fin] + RESET)
+            pos = fin
+        partes.append(texto[pos:])
+        return "".join(partes)
+
+    def linea(self, fila: int) -> str:
+        """Devuelve la línea 'fila' (0-based) ya resaltada; renderiza solo lo que falte."""
+        if fila >= len(self._render):
+            if self.color:
+                self._avanzar_tokens(fila)
+            for f in range(len(self._render), fila + 1):
+                self._render.append(self._colorear(f) if self.color else self.lineas[f])
+        return self._render[fila]
+
+    def pantalla(self, inicio: int, alto: int) -> List[str]:
+        """Líneas [inicio, inicio+alto) con número de línea."""
+        fin = min(len(self.lineas), inicio + alto)
+        ancho = len(str(len(self.lineas)))
+        pre, post = (COLORES["num_linea"], RESET) if self.color else ("", "")
+        return [f"{pre}{i + 1:>{ancho}}{post} │ {self.linea(i)}" for i in range(inicio, fin)]
+
+
+class CacheRender:
+    """LRU de DocumentoCodigo por (ruta, mtime, tamaño, color)."""
+
+    def __init__(self, max_documentos: int = 16) -> None:
+        self.max_documentos = max_documentos
+        self._docs: "OrderedDict[tuple, DocumentoCodigo]" = OrderedDict()
+
+    def obtener(self, ruta: str, color: bool = True) -> DocumentoCodigo:
+        ruta = os.path.abspath(ruta)
+        st = os.stat(ruta)
+        clave = (ruta, st.st_mtime_ns, st.st_size, color)
+        doc = self._docs.get(clave)
+        if doc is None:
+            doc = DocumentoCodigo(ruta, color)
+            self._docs[clave] = doc
+            if len(self._docs) > self.max_documentos:
+                self._docs.popitem(last=False)
+        self._docs.move_to_end(clave)
+        return doc
+
+
+CACHE = CacheRender()
+
+
+def paginar(ruta: str, alto: Optional[int] = None, color: Optional[bool] = None,
+            cache: CacheRender = CACHE, leer: Callable[[str], str] = input) -> None:
+    """
+    Muestra 'ruta' por pantallas: Enter/n = siguiente, p = anterior, g <n> = ir a la línea n,
+    q = salir. Puede lanzar OSError / UnicodeDecodeError (los maneja quien llama).
+    """
+    terminal = sys.stdout.isatty()
+    doc = cache.obtener(ruta, terminal if color is None else color)
+    if alto is None:
+        alto = max(5, shutil.get_terminal_size().lines - 3)
+    if not terminal or len(doc) <= alto:
+        for l in doc.pantalla(0, len(doc)):
+            print(l)
+        return
+    inicio = 0
+    while True:
+        for l in doc.pantalla(inicio, alto):
+            print(l)
+        fin = min(len(doc), inicio + alto)
+        try:
+            op = leer(f"-- líneas {inicio + 1}-{fin} de {len(doc)} -- [Enter] sig · p ant · g <n> ir · q salir: ").strip().lower()
+        except EOFError:
+            return
+        if op == "q":
+            return
+        if op == "p":
+            inicio = max(0, inicio - alto)
+        elif op.startswith("g"):
+            n = op[1:].strip()
+            if n.isdigit():
+                inicio = min(max(0, int(n) - 1), max(0, len(doc) - alto))
+        elif fin >= len(doc):
+            return
+        else:
+            inicio = fin
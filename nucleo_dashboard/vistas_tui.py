@@ -0,0 +1,318 @@
+# nucleo_dashboard/vistas_tui.py
+# Requisito: Las pantallas del Dashboard (menú, navegador, código, tareas, estadísticas) sobre
+#            el núcleo asíncrono de tui.py, sin pausas: ejecutar un script o indexar el repo
+#            ocurre en segundo plano mientras se sigue navegando.
+# Decisión: El Dashboard arma un Contexto con lo que ya tiene (raíz, dentro_repo, listados
+#           vigilados, almacén, ejecutor con caché, escáner de estadísticas) y las vistas solo
+#           usan eso; los eventos del vigilante llegan como ("fs", evento) y provocan un
+#           redibujado parcial de la vista activa.
+
+from __future__ import annotations
+from datetime import date
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+import asyncio
+import os
+
+from nucleo_dashboard.tui import Aplicacion, INVERSO, RESET, Vista
+
+
+class Contexto(NamedTuple):
+    raiz: str
+    dentro_repo: Callable[..., bool]
+    listar: Callable[[str], Tuple[List[str], List[str]]]  # carpeta -> (carpetas, archivos)
+    vigilante: object                                     # nucleo_dashboard.vigilante.Vigilante
+    almacen: Callable[[], object]                         # -> AlmacenTareas
+    ejecutar: Callable[[str, bool], Tuple[Dict, bool]]    # (ruta, forzar) -> (resultado, desde_caché)
+    estadisticas: Callable[[], Dict]                      # escaneo (bloqueante) del repo
+
+
+class Estado:
+    """Resultados compartidos entre vistas (salidas de scripts, última indexación)."""
+
+    def __init__(self) -> None:
+        self.salidas: Dict[str, Tuple[Dict, bool]] = {}
+        self.stats: Optional[Dict] = None
+
+
+# ---------- piezas comunes ----------
+
+class VistaLista(Vista):
+    """Lista con cursor y desplazamiento; las subclases dan elementos() y elegir()."""
+    _sel = 0
+    _arriba = 0
+
+    def elementos(self, app: Aplicacion) -> List[Tuple[str, object]]:
+        return []
+
+    def elegir(self, app: Aplicacion, dato: object) -> None:
+        pass
+
+    def encabezado(self, app: Aplicacion) -> List[str]:
+        return []
+
+    def seleccionado(self, app: Aplicacion):
+        items = self.elementos(app)
+        return items[self._sel][1] if 0 <= self._sel < len(items) else None
+
+    def cuerpo(self, app, alto, ancho):
+        cab = self.encabezado(app)
+        items = self.elementos(app)
+        visibles = max(1, alto - len(cab))
+        self._sel = max(0, min(self._sel, len(items) - 1))
+        if self._sel < self._arriba:
+            self._arriba = self._sel
+        elif self._sel >= self._arriba + visibles:
+            self._arriba = self._sel - visibles + 1
+        filas = []
+        for i, (texto, _) in enumerate(items[self._arriba:self._arriba + visibles], self._arriba):
+            filas.append(f"{INVERSO}> {texto}{RESET}" if i == self._sel else f"  {texto}")
+        return cab + (filas or ["  (vacío)"])
+
+    def tecla(self, app, k):
+        n = len(self.elementos(app))
+        salto = max(1, app.terminal.tamano()[0] - 4)
+        if k in ("arriba", "k"): self._sel = max(0, self._sel - 1)
+        elif k in ("abajo", "j"): self._sel = min(n - 1, self._sel + 1)
+        elif k == "repag": self._sel = max(0, self._sel - salto)
+        elif k == "avpag": self._sel = min(n - 1, self._sel + salto)
+        elif k == "inicio": self._sel = 0
+        elif k == "fin": self._sel = n - 1
+        elif k in ("enter", "derecha"):
+            dato = self.seleccionado(app)
+            if dato is not None: self.elegir(app, dato)
+        else:
+            super().tecla(app, k)
+
+
+class VistaTexto(Vista):
+    """Texto desplazable (código, salida de un script, estadísticas)."""
+    _arriba = 0
+
+    def lineas(self, app: Aplicacion) -> List[str]:
+        return []
+
+    def cuerpo(self, app, alto, ancho):
+        lineas = self.lineas(app)
+        self._arriba = max(0, min(self._arriba, len(lineas) - alto))
+        return lineas[self._arriba:self._arriba + alto]
+
+    def tecla(self, app, k):
+        alto = app.terminal.tamano()[0] - 2
+        if k in ("abajo", "j"): self._arriba += 1
+        elif k in ("arriba", "k"): self._arriba -= 1
+        elif k in ("avpag", " "): self._arriba += alto
+        elif k == "repag": self._arriba -= alto
+        elif k == "inicio": self._arriba = 0
+        elif k == "fin": self._arriba = 10 ** 9
+        else:
+            super().tecla(app, k); return
+        self._arriba = max(0, self._arriba)
+
+
+def lanzar_script(app: Aplicacion, ctx: Contexto, estado: Estado, ruta: str, forzar: bool = False) -> None:
+    nombre = os.path.basename(ruta)
+
+    def listo(res):
+        estado.salidas[ruta] = res
+        r, desde_cache = res
+        origen = "caché" if desde_cache else f"{r['duracion']}s"
+        marca = "✔" if r["returncode"] == 0 else "✘"
+        app.mensaje(f"{marca} {nombre} ({origen}) — o) ver salida", 6)
+
+    if not app.lanzar(f"ejecutar {nombre}", ctx.ejecutar, ruta, forzar, al_terminar=listo):
+        app.mensaje(f"{nombre} ya se está ejecutando.")
+
+
+# ---------- vistas ----------
+
+class VistaSalida(VistaTexto):
+    ayuda = "↑↓/PgUp/PgDn) Desplazar  q) Volver"
+
+    def __init__(self, ruta: str, resultado: Tuple[Dict, bool]) -> None:
+        r, desde_cache = resultado
+        self.titulo = f"Salida de {os.path.basename(ruta)} · código {r['returncode']} · " + \
+                      ("desde caché" if desde_cache else f"{r['duracion']}s")
+        self._lineas = r["stdout"].splitlines()
+        if r["stderr"]:
+            self._lineas += ["", "[stderr]:"] + r["stderr"].splitlines()
+
+    def lineas(self, app):
+        return self._lineas
+
+
+class VistaCodigo(VistaTexto):
+    ayuda = "↑↓/PgUp/PgDn) Desplazar  x) Ejecutar  f) Forzar  o) Salida  q) Volver"
+
+    def __init__(self, ctx: Contexto, estado: Estado, ruta: str) -> None:
+        from nucleo_dashboard.visor_codigo import CACHE
+        self.ctx, self.estado, self.ruta = ctx, estado, ruta
+        self.titulo = os.path.relpath(ruta, ctx.raiz)
+        self._doc = CACHE.obtener(ruta, color=True)
+
+    def cuerpo(self, app, alto, ancho):
+        # el documento resalta perezosamente: solo las líneas de esta pantalla
+        self._arriba = max(0, min(self._arriba, len(self._doc) - alto))
+        return self._doc.pantalla(self._arriba, alto)
+
+    def tecla(self, app, k):
+        if k in ("x", "f") and self.ruta.endswith(".py"):
+            lanzar_script(app, self.ctx, self.estado, self.ruta, forzar=(k == "f"))
+        elif k == "o" and self.ruta in self.estado.salidas:
+            app.abrir(VistaSalida(self.ruta, self.estado.salidas[self.ruta]))
+        else:
+            super().tecla(app, k)
+
+
+class VistaNavegador(VistaLista):
+    ayuda = "Enter) Abrir  ←/u) Subir  x) Ejecutar .py  o) Salida  q) Volver"
+
+    def __init__(self, ctx: Contexto, estado: Estado, carpeta: str) -> None:
+        self.ctx, self.estado = ctx, estado
+        self.carpeta = os.path.realpath(carpeta)
+
+    @property
+    def titulo(self):
+        return f"Explorador · {os.path.relpath(self.carpeta, self.ctx.raiz)}"
+
+    def elementos(self, app):
+        try:
+            dirs, files = self.ctx.listar(self.carpeta)  # caché vigilado: sin scandir al redibujar
+        except FileNotFoundError:
+            return []
+        marca = lambda f: "  ✔" if os.path.join(self.carpeta, f) in self.estado.salidas else ""
+        return [(f"[D] {d}", ("dir", d)) for d in dirs] + \
+               [(f"[F] {f}{marca(f)}", ("file", f)) for f in files]
+
+    def elegir(self, app, dato):
+        tipo, nombre = dato
+        ruta = os.path.join(self.carpeta, nombre)
+        if tipo == "dir":
+            ruta = os.path.realpath(ruta) if os.path.islink(ruta) else ruta
+            if self.ctx.dentro_repo(ruta, resuelta=True):
+                self.carpeta, self._sel, self._arriba = ruta, 0, 0
+            else:
+                app.mensaje("Ruta fuera del repo.")
+            return
+        try:
+            app.abrir(VistaCodigo(self.ctx, self.estado, ruta))
+        except UnicodeDecodeError:
+            app.mensaje("No parece texto legible (no UTF-8).")
+        except OSError as e:
+            app.mensaje(f"Error al leer: {e}")
+
+    def tecla(self, app, k):
+        dato = self.seleccionado(app)
+        ruta = os.path.join(self.carpeta, dato[1]) if dato else None
+        if k in ("u", "izquierda", "borrar"):
+            padre = os.path.dirname(self.carpeta)
+            if self.ctx.dentro_repo(padre, resuelta=True):
+                hija = os.path.basename(self.carpeta)
+                self.carpeta, self._arriba = padre, 0
+                dirs, _ = self.ctx.listar(padre)
+                self._sel = dirs.index(hija) if hija in dirs else 0
+            else:
+                app.mensaje("Estás en la raíz.")
+        elif k in ("x", "f") and dato and dato[0] == "file" and ruta.endswith(".py"):
+            lanzar_script(app, self.ctx, self.estado, ruta, forzar=(k == "f"))
+        elif k == "o" and ruta in self.estado.salidas:
+            app.abrir(VistaSalida(ruta, self.estado.salidas[ruta]))
+        else:
+            super().tecla(app, k)
+
+    def evento(self, app, ev):
+        if ev[0] == "fs" and ev[1].carpeta is not None and not os.path.isdir(self.carpeta):
+            self.carpeta = self.ctx.raiz  # la carpeta actual se borró
+
+
+class VistaTareas(VistaLista):
+    titulo = "Panel de Tareas"
+    ayuda = "c) Completar  d) Eliminar  p) Próximas/Todas  q) Volver"
+    proximas = False
+
+    def __init__(self, ctx: Contexto) -> None:
+        self.ctx = ctx
+
+    def encabezado(self, app):
+        return [f"  {'Pendientes próximas' if self.proximas else 'Todas las tareas'}", ""]
+
+    def elementos(self, app):
+        alm = self.ctx.almacen()  # refresca solo si el vigilante vio cambios en tareas.json
+        data = alm.proximas(date.today()) if self.proximas else alm.listar()
+        return [(f"[{int(t['id']):03}] {t['titulo']} | {t['unidad']} | {t['estado']} | "
+                 f"vence: {t.get('fecha_limite') or '—'}", t["id"]) for t in data]
+
+    def tecla(self, app, k):
+        i = self.seleccionado(app)
+        if k == "c" and i is not None:
+            app.mensaje("✔ Marcada como completada." if self.ctx.almacen().completar(i) else "No existe ese ID.")
+        elif k == "d" and i is not None:
+            app.mensaje("🗑 Eliminada." if self.ctx.almacen().eliminar(i) else "No existe ese ID.")
+        elif k == "p":
+            self.proximas, self._sel = not self.proximas, 0
+        else:
+            super().tecla(app, k)
+
+
+class VistaEstadisticas(VistaTexto):
+    titulo = "Estadísticas del repositorio"
+    ayuda = "r) Re-escanear  ↑↓) Desplazar  q) Volver"
+
+    def __init__(self, ctx: Contexto, estado: Estado) -> None:
+        self.ctx, self.estado = ctx, estado
+
+    def lineas(self, app):
+        if self.estado.stats is None:
+            return ["", "  Indexando el repositorio en segundo plano…"]
+        from nucleo_dashboard.estadisticas import formatear
+        return formatear(self.estado.stats).splitlines()
+
+    def tecla(self, app, k):
+        if k == "r":
+            indexar(app, self.ctx, self.estado)
+        else:
+            super().tecla(app, k)
+
+
+def indexar(app: Aplicacion, ctx: Contexto, estado: Estado) -> None:
+    def listo(res):
+        estado.stats = res
+        app.mensaje(f"Índice listo: {res['total_archivos']} archivos ({res['analizados']} analizados)")
+    app.lanzar("indexando", ctx.estadisticas, al_terminar=listo)
+
+
+class MenuPrincipal(VistaLista):
+    titulo = "DASHBOARD POO – Repositorio (TUI)"
+    ayuda = "↑↓/j/k) Mover  Enter) Abrir  q) Salir"
+
+    def __init__(self, ctx: Contexto) -> None:
+        self.ctx, self.estado = ctx, Estado()
+
+    def encabezado(self, app):
+        return [f"  Raíz: {self.ctx.raiz}", ""]
+
+    def elementos(self, app):
+        items = [(f"Navegar {p}", ("nav", p)) for p in ("PARCIAL 01", "PARCIAL 02")
+                 if os.path.isdir(os.path.join(self.ctx.raiz, p))]
+        return items + [("Panel de Tareas", ("tareas",)), ("Estadísticas del repo", ("stats",)),
+                        ("Salir", ("salir",))]
+
+    def elegir(self, app, dato):
+        if dato[0] == "nav":
+            app.abrir(VistaNavegador(self.ctx, self.estado, os.path.join(self.ctx.raiz, dato[1])))
+        elif dato[0] == "tareas":
+            app.abrir(VistaTareas(self.ctx))
+        elif dato[0] == "stats":
+            if self.estado.stats is None and "indexando" not in app.tareas:
+                indexar(app, self.ctx, self.estado)
+            app.abrir(VistaEstadisticas(self.ctx, self.estado))
+        else:
+            app.salir()
+
+
+def ejecutar_tui(ctx: Contexto) -> None:
+    """Arranca la TUI: indexa en segundo plano y reenvía los eventos del vigilante a la cola."""
+    menu = MenuPrincipal(ctx)
+    app = Aplicacion(menu)
+
+    ctx.vigilante.suscribir(lambda ev: app.publicar(("fs", ev)))
+    asyncio.run(app.correr(al_iniciar=lambda a: indexar(a, ctx, menu.estado)))
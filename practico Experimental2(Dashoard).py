@@ -5,20 +5,33 @@ Menú:
   1) Navegar PARCIAL 01 (abrir carpetas y archivos; .py se ven/ejecutan)
   2) Navegar PARCIAL 02
   3) Gestor: crear carpeta/archivo + Panel de Tareas
+  4) Estadísticas del repositorio
   0) Salir
 
 # CAMBIO: Ya no se usa UNIDAD 1/2. Se trabaja con PARCIAL 01/02.
 # NUEVO: Detección de raíz del repo, navegador simple, gestor de tareas con JSON en la raíz.
+# CAMBIO: Arranque rápido. Solo os/sys/time se importan al inicio; subprocess, datetime y
+#         nucleo_dashboard se importan dentro de la función que los usa, y la raíz se detecta
+#         al primer uso. --arranque mide el tiempo hasta el primer menú (estilo -X importtime).
 """
 
-import os, sys, json, subprocess
-from datetime import datetime
+import os, sys, time
+_T0 = time.perf_counter()  # NUEVO: referencia para el reporte de arranque
 
 # ============= UTILIDADES BÁSICAS =============
 
+_VT_LISTO = False
+
 def limpiar():
-    """Limpia la consola (Windows/Linux/macOS)."""
-    os.system("cls" if os.name == "nt" else "clear")
+    """Limpia la consola (Windows/Linux/macOS).
+    # CAMBIO: secuencias ANSI en el mismo proceso en vez de lanzar 'clear'/'cls' en cada redibujado.
+    #         Si la salida no es una terminal (tubería/archivo) no se escribe nada."""
+    global _VT_LISTO
+    if not sys.stdout.isatty(): return
+    if os.name == "nt" and not _VT_LISTO:
+        os.system("")  # una sola vez: activa el modo VT de la consola de Windows
+        _VT_LISTO = True
+    sys.stdout.write("\033[H\033[2J\033[3J"); sys.stdout.flush()
 
 def pausar(msg="Presiona Enter para continuar..."):
     """Pausa para leer resultados en consola."""
@@ -29,6 +42,9 @@ def pausar(msg="Presiona Enter para continuar..."):
 # NUEVO: Detecta la raíz subiendo hasta encontrar carpetas 'PARCIAL 01' o 'PARCIAL 02'.
 
 def contiene_parciales(path):
+    """# CAMBIO: primero 1-2 stat directos; solo si fallan se lista la carpeta (mayúsc./minúsc.)."""
+    if os.path.isdir(os.path.join(path, "PARCIAL 01")) or os.path.isdir(os.path.join(path, "PARCIAL 02")):
+        return True
     try:
         d = {e.name.upper() for e in os.scandir(path) if e.is_dir()}
         return ("PARCIAL 01" in d) or ("PARCIAL 02" in d)
@@ -45,43 +61,134 @@ def detectar_raiz():
             return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
         cur = padre
 
-RAIZ = detectar_raiz()
-PARCIAL_01 = os.path.join(RAIZ, "PARCIAL 01")
-PARCIAL_02 = os.path.join(RAIZ, "PARCIAL 02")
-TAREAS_JSON = os.path.join(RAIZ, "tareas.json")
+# CAMBIO: la raíz se resuelve (realpath) UNA vez; dentro_repo compara contra este prefijo.
+# CAMBIO: ...y solo cuando se necesita por primera vez (no al importar el módulo).
+_RAIZ = None  # (raiz, raiz_normalizada, prefijo)
+
+def _raiz():
+    global _RAIZ
+    if _RAIZ is None:
+        r = os.path.realpath(detectar_raiz())
+        n = os.path.normcase(r)
+        _RAIZ = (r, n, n if n.endswith(os.sep) else n + os.sep)
+    return _RAIZ
+
+def raiz():
+    return _raiz()[0]
+
+def ruta_raiz(*partes):
+    """# NUEVO: rutas fijas del repo: ruta_raiz("PARCIAL 01"), ruta_raiz("tareas.json")..."""
+    return os.path.join(raiz(), *partes)
+
+CACHE_DIR = ".cache_dashboard"  # NUEVO: cachés locales en la raíz (ignoradas por git)
 
-def dentro_repo(path):
-    """# NUEVO: Seguridad. Asegura que 'path' está dentro del repo para no salirnos."""
+def dentro_repo(path, resuelta=False):
+    """# NUEVO: Seguridad. Asegura que 'path' está dentro del repo para no salirnos.
+    # CAMBIO: resuelta=True indica que 'path' ya es un realpath (p.ej. el padre de la carpeta
+    #         actual): entonces la comprobación es solo comparar prefijos, sin syscalls."""
     try:
-        return os.path.commonpath([os.path.realpath(path), os.path.realpath(RAIZ)]) == os.path.realpath(RAIZ)
+        _, norm, prefijo = _raiz()
+        p = os.path.normcase(path if resuelta else os.path.realpath(path))
+        return p == norm or p.startswith(prefijo)
     except Exception:
         return False
 
+def resolver_hija(carpeta, nombre):
+    """# NUEVO: carpeta ya resuelta + nombre listado -> ruta resuelta (realpath solo si es symlink)."""
+    ruta = os.path.join(carpeta, nombre)
+    return os.path.realpath(ruta) if os.path.islink(ruta) else ruta
+
 # ============= APERTURA / EJECUCIÓN =============
 
 def mostrar_codigo(ruta):
-    """Imprime el contenido de un archivo de texto (UTF-8)."""
+    """Imprime el contenido de un archivo de texto (UTF-8).
+    # CAMBIO: visor paginado con resaltado; lo leído/coloreado se cachea por (ruta, mtime)
+    #         y solo se renderizan las líneas de la pantalla visible."""
     try:
-        with open(ruta, "r", encoding="utf-8") as f:
-            print("\n--- Código ---\n")
-            print(f.read())
+        from nucleo_dashboard.visor_codigo import paginar
+        print("\n--- Código ---\n")
+        paginar(ruta)
     except UnicodeDecodeError:
         print("No parece texto legible (no UTF-8).")
     except Exception as e:
         print(f"Error al leer: {e}")
 
-def ejecutar_py(ruta):
-    """# CAMBIO: Ejecución inline (más seguro y portátil)."""
+_CACHE_EJECUCION = None
+
+def cache_ejecucion():
+    global _CACHE_EJECUCION
+    if _CACHE_EJECUCION is None:
+        from nucleo_dashboard.cache_ejecucion import CacheEjecucion
+        _CACHE_EJECUCION = CacheEjecucion(ruta_raiz(CACHE_DIR, "ejecuciones"))
+    return _CACHE_EJECUCION
+
+def es_interactivo(ruta):
+    """# NUEVO: Un script que lee stdin (input(), sys.stdin...) depende del teclado: no se cachea."""
+    from nucleo_dashboard.cache_ejecucion import lee_stdin
+    try:
+        with open(ruta, "rb") as f: return lee_stdin(f.read())
+    except OSError: return True
+
+_POOL = None
+
+def ejecutor_scripts():
+    """# NUEVO: Pool de intérpretes calientes (en Windows, subprocess).
+    # CAMBIO: el pool hace fork al crearse: solo se crea si todavía no hay otros hilos
+    #         (vigilante() lo crea antes de arrancar el suyo); si no, subprocess."""
+    global _POOL
+    from nucleo_dashboard.pool_interpretes import PoolInterpretes, ejecutar_subproceso
+    if not PoolInterpretes.disponible(): return ejecutar_subproceso
+    if _POOL is None:
+        import threading
+        if threading.active_count() > 1: return ejecutar_subproceso
+        import atexit
+        _POOL = PoolInterpretes(tamano=2); atexit.register(_POOL.close)
+    return _POOL.ejecutar
+
+def ejecutar_py(ruta, forzar=False):
+    """# CAMBIO: Ejecución inline (más seguro y portátil).
+    # NUEVO: Scripts no interactivos pasan por la caché de resultados (forzar=True re-ejecuta)
+    #        y, si no hay acierto, por el pool de intérpretes calientes.
+    # CAMBIO: solo se cachean los marcados "# dashboard: determinista"; los demás se ejecutan
+    #         siempre (sus archivos y fechas no se saltan)."""
     try:
         print("\n--- Ejecución ---\n")
-        res = subprocess.run([sys.executable, ruta], text=True, capture_output=True, cwd=os.path.dirname(ruta))
-        print(res.stdout)
-        if res.stderr: print("\n[stderr]:\n", res.stderr)
+        if es_interactivo(ruta):
+            import subprocess
+            res = subprocess.run([sys.executable, ruta], text=True, capture_output=True, cwd=os.path.dirname(ruta))
+            print(res.stdout)
+            if res.stderr: print("\n[stderr]:\n", res.stderr)
+            return
+        from nucleo_dashboard.cache_ejecucion import ejecutar_con_cache
+        r, desde_cache = ejecutar_con_cache(ruta, cache_ejecucion(), forzar=forzar, ejecutor=ejecutor_scripts())
+        print(r["stdout"])
+        if r["stderr"]: print("\n[stderr]:\n", r["stderr"])
+        print(f"[{'caché' if desde_cache else 'ejecutado'} · {r['duracion']}s]")
     except Exception as e:
         print(f"Error al ejecutar: {e}")
 
+def grabar_fixture(ruta):
+    """# NUEVO: sesión interactiva normal; las respuestas a input() quedan en fixtures/*.json."""
+    from nucleo_dashboard.fixtures_stdin import grabar
+    nombre = input("Nombre de la grabación (Enter = base): ").strip() or "base"
+    if any(c in nombre for c in "/\\"): print("Nombre inválido."); return
+    print("\n--- Grabando (usa el script con normalidad) ---\n")
+    destino, fx = grabar(ruta, raiz(), nombre)
+    print(f"\n✔ {len(fx['entradas'])} entradas guardadas en {os.path.relpath(destino, raiz())}")
+
+def reproducir_fixture(ruta):
+    """# NUEVO: reproduce una grabación a toda velocidad (pool de intérpretes) y compara la salida."""
+    from nucleo_dashboard.fixtures_stdin import cargar, listar_fixtures, reproducir, resumen
+    fixtures = listar_fixtures(raiz(), ruta)
+    if not fixtures: print("No hay grabaciones para este script (usa 'g')."); return
+    for i, f in enumerate(fixtures, 1): print(f"  {i}) {os.path.basename(f)}")
+    op = input("Grabación (Enter = 1): ").strip() or "1"
+    if not (op.isdigit() and 1 <= int(op) <= len(fixtures)): print("Índice inválido."); return
+    print(resumen(reproducir(cargar(fixtures[int(op) - 1]), raiz(), ejecutor_scripts())))
+
 def abrir_sistema(ruta):
     """Abre con la app predeterminada del sistema (no obligatorio, pero útil)."""
+    import subprocess
     try:
         if os.name == "nt": os.startfile(ruta)                                      # type: ignore[attr-defined]
         elif sys.platform == "darwin": subprocess.Popen(["open", ruta])
@@ -92,22 +199,47 @@ def abrir_sistema(ruta):
 # ============= NAVEGADOR SIMPLE =============
 # NUEVO: Lista carpetas/archivos, entra a carpetas, abre/ejecuta archivos .py.
 
+# NUEVO: un vigilante en segundo plano (inotify o sondeo) mantiene al día los listados ya vistos
+#        y avisa cuando cambian tareas.json/diario; redibujar no vuelve a escanear.
+_VIGILANTE = None
+_LISTADOS = None
+_TAREAS_CAMBIADAS = True
+
+def _al_cambiar_raiz(ev):
+    global _TAREAS_CAMBIADAS
+    if ev.carpeta is None or (ev.carpeta == raiz() and ev.nombre.startswith("tareas.json")):
+        _TAREAS_CAMBIADAS = True
+
+def vigilante(con_pool=True):
+    """# NUEVO: se crea al primer uso; vigila la raíz (tareas) y cada carpeta listada.
+    # CAMBIO: con_pool crea antes el pool de intérpretes: su fork debe ocurrir sin hilos."""
+    global _VIGILANTE, _LISTADOS
+    if _VIGILANTE is None:
+        if con_pool: ejecutor_scripts()
+        import atexit
+        from nucleo_dashboard.vigilante import Vigilante, ListadosVigilados
+        _VIGILANTE = Vigilante()
+        _LISTADOS = ListadosVigilados(_VIGILANTE)
+        _VIGILANTE.suscribir(_al_cambiar_raiz)
+        _VIGILANTE.vigilar(raiz())
+        _VIGILANTE.iniciar(); atexit.register(_VIGILANTE.detener)
+    return _VIGILANTE
+
 def listar_contenido(ruta):
+    """# CAMBIO: lee del caché de listados vigilado; solo hace scandir la primera vez por carpeta."""
+    vigilante()
     try:
-        items = list(os.scandir(ruta))
+        return _LISTADOS.listar(ruta)
     except FileNotFoundError:
         print("Ruta inexistente."); return [], []
-    dirs = sorted([e.name for e in items if e.is_dir()])
-    files = sorted([e.name for e in items if e.is_file()])
-    return dirs, files
 
 def navegar(carpeta, titulo):
-    actual = os.path.abspath(carpeta)
-    if not (os.path.isdir(actual) and dentro_repo(actual)):
+    actual = os.path.realpath(carpeta)  # CAMBIO: se resuelve una vez; luego todo es por prefijo
+    if not (os.path.isdir(actual) and dentro_repo(actual, resuelta=True)):
         print("Carpeta inválida."); pausar(); return
     while True:
         limpiar()
-        print(f"{titulo}\nRuta: {os.path.relpath(actual, RAIZ)}\n")
+        print(f"{titulo}\nRuta: {os.path.relpath(actual, raiz())}\n")
         dirs, files = listar_contenido(actual)
         idx = {}
         print("Carpetas:")
@@ -119,12 +251,13 @@ def navegar(carpeta, titulo):
         if not files: print("  (ninguno)")
         for j, f in enumerate(files, 1):
             print(f"  {base+j:02d}) [F] {f}"); idx[base+j] = ("file", f)
-        print("\n0) Volver   U) Subir   A <n>) Abrir con app del sistema")
+        print("\n0) Volver   U) Subir   A <n>) Abrir con app del sistema   R/Enter) Refrescar")
         op = input("Opción/índice: ").strip()
         if op == "0": break
+        if op in ("", "R", "r"): continue  # NUEVO: el listado ya está al día; solo redibujar
         if op.upper() == "U":
             padre = os.path.dirname(actual)
-            if dentro_repo(padre): actual = padre
+            if dentro_repo(padre, resuelta=True): actual = padre
             else: print("Estás en la raíz."); pausar()
             continue
         if op.upper().startswith("A"):
@@ -139,11 +272,18 @@ def navegar(carpeta, titulo):
             n = int(op)
             if n not in idx: print("Índice inválido."); pausar(); continue
             tipo, nombre = idx[n]; ruta = os.path.join(actual, nombre)
-            if tipo == "dir": actual = ruta; continue
+            if tipo == "dir":
+                ruta = resolver_hija(actual, nombre)
+                if dentro_repo(ruta, resuelta=True): actual = ruta
+                else: print("Ruta fuera del repo."); pausar()
+                continue
             ext = os.path.splitext(nombre)[1].lower()
             if ext == ".py":
                 mostrar_codigo(ruta)
-                if input("¿Ejecutar? (s/n): ").lower() == "s": ejecutar_py(ruta)
+                op_ej = input("¿Ejecutar? (s/n, f=forzar sin caché, g=grabar entradas, r=reproducir grabación): ").lower()
+                if op_ej in ("s", "f"): ejecutar_py(ruta, forzar=(op_ej == "f"))
+                elif op_ej == "g": grabar_fixture(ruta)
+                elif op_ej == "r": reproducir_fixture(ruta)
                 pausar()
             else:
                 # Ver texto rápido o abrir con la app del sistema
@@ -157,11 +297,11 @@ def navegar(carpeta, titulo):
 # NUEVO: Crear carpetas/archivos en cualquier punto del repo con un selector simple.
 
 def seleccionar_carpeta(base):
-    cur = os.path.abspath(base)
+    cur = os.path.realpath(base)
     while True:
         limpiar()
         print("Selector de carpeta")
-        print("Actual:", os.path.relpath(cur, RAIZ))
+        print("Actual:", os.path.relpath(cur, raiz()))
         dirs, _ = listar_contenido(cur)
         for i, d in enumerate(dirs, 1): print(f"  {i:02d}) {d}")
         print("\n0) Cancelar   U) Subir   E) Elegir esta")
@@ -169,33 +309,36 @@ def seleccionar_carpeta(base):
         if op == "0": return None
         if op == "U":
             padre = os.path.dirname(cur)
-            if dentro_repo(padre): cur = padre
+            if dentro_repo(padre, resuelta=True): cur = padre
             else: print("Ya estás en la raíz."); pausar()
             continue
         if op == "E": return cur
         if op.isdigit():
             n = int(op)
-            if 1 <= n <= len(dirs): cur = os.path.join(cur, dirs[n-1])
+            if 1 <= n <= len(dirs):
+                hija = resolver_hija(cur, dirs[n-1])
+                if dentro_repo(hija, resuelta=True): cur = hija
+                else: print("Ruta fuera del repo."); pausar()
             else: print("Índice inválido."); pausar()
             continue
         print("Opción no válida."); pausar()
 
 def crear_carpeta():
     print("\n== Crear carpeta ==")
-    destino = seleccionar_carpeta(RAIZ)
+    destino = seleccionar_carpeta(raiz())
     if not destino: print("Cancelado."); return
     nombre = input("Nombre de la nueva carpeta: ").strip()
     if not nombre: print("Nombre obligatorio."); return
     ruta = os.path.join(destino, nombre)
     if not dentro_repo(ruta): print("Ruta fuera del repo."); return
     try:
-        os.makedirs(ruta, exist_ok=False); print("✔ Carpeta creada:", os.path.relpath(ruta, RAIZ))
+        os.makedirs(ruta, exist_ok=False); print("✔ Carpeta creada:", os.path.relpath(ruta, raiz()))
     except FileExistsError: print("Ya existe.")
     except Exception as e: print("Error:", e)
 
 def crear_archivo():
     print("\n== Crear archivo ==")
-    destino = seleccionar_carpeta(RAIZ)
+    destino = seleccionar_carpeta(raiz())
     if not destino: print("Cancelado."); return
     nombre = input("Nombre (con extensión): ").strip()
     if not nombre or any(c in nombre for c in "/\\"): print("Nombre inválido."); return
@@ -206,43 +349,68 @@ def crear_archivo():
     try:
         with open(ruta, "w", encoding="utf-8") as f:
             if contenido: f.write(contenido)
-        print("✔ Archivo creado:", os.path.relpath(ruta, RAIZ))
+        print("✔ Archivo creado:", os.path.relpath(ruta, raiz()))
     except Exception as e: print("Error:", e)
 
+def crear_lote():
+    """# NUEVO: crea carpetas/archivos desde un manifiesto JSON/YAML (valida todo antes de escribir).
+    # Ejemplo: nucleo_dashboard/manifiesto_semana.json"""
+    from nucleo_dashboard import creacion_lote
+    print("\n== Crear en lote ==")
+    ruta = input("Manifiesto (ruta relativa a la raíz o absoluta): ").strip().strip('"')
+    if not ruta: print("Cancelado."); return
+    ruta = ruta if os.path.isabs(ruta) else ruta_raiz(ruta)
+    try:
+        plan = creacion_lote.planificar(creacion_lote.cargar_manifiesto(ruta), raiz(), dentro_repo)
+    except (OSError, ValueError) as e:  # json.JSONDecodeError es ValueError
+        print("No se pudo leer el manifiesto:", e); return
+    print(creacion_lote.resumen(plan, raiz()))
+    if plan.errores: print("\nNo se creó nada."); return
+    if input("\n¿Crear todo? (s/n): ").strip().lower() != "s": print("Cancelado."); return
+    r = creacion_lote.aplicar(plan)
+    print(f"✔ {r['carpetas']} carpeta(s) y {r['archivos']} archivo(s) creados.")
+    for e in r["errores"]: print("  Error:", e)
+
 # ============= PANEL DE TAREAS =============
 # Requisitos:
 # - Crear (título, unidad, estado, fecha límite YYYY-MM-DD, nota)
 # - Listar (todas / por estado / por unidad / pendientes próximas)
 # - Completar (por ID)
 # - Eliminar (por ID)
-# - Persistencia en tareas.json (RAÍZ del repo)
-
-ESTADOS = ["pendiente", "en progreso", "completada"]
-UNIDADES = ["PARCIAL 01", "PARCIAL 02"]  # CAMBIO: unidades = parciales
-
-def cargar_tareas():
-    if not os.path.exists(TAREAS_JSON): return []
-    try:
-        with open(TAREAS_JSON, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data if isinstance(data, list) else []
-    except Exception:
-        print("Aviso: tareas.json inválido. Se usará base vacía."); return []
-
-def guardar_tareas(tareas):
-    tmp = TAREAS_JSON + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(tareas, f, ensure_ascii=False, indent=2)
-    os.replace(tmp, TAREAS_JSON)
-
-def gen_id(tareas): return (max([int(t.get("id", 0)) for t in tareas]) + 1) if tareas else 1
+# - Persistencia en tareas.json (RAÍZ del repo) + diario tareas.json.journal
+
+# CAMBIO: ESTADOS y UNIDADES (= parciales) vienen del motor compartido con Semana 08.
+# CAMBIO: el motor se importa al entrar al panel, no al arrancar el Dashboard.
+
+_ALMACEN = None
+
+def almacen():
+    """# CAMBIO: Almacén indexado (instantánea + diario). Se carga UNA vez por sesión;
+    # cada operación añade una línea al diario en vez de reescribir tareas.json.
+    # NUEVO: solo se recarga si tareas.json/diario cambiaron en disco (huella inodo/tamaño/mtime)
+    #        y las escrituras se agrupan (write-behind) hasta 32 operaciones, hasta la primera
+    #        operación pasados 2 s, o hasta salir del panel (no hay temporizador).
+    # NUEVO: seguro entre procesos (bloqueo en tareas.json.lock + revisión compare-and-swap).
+    # CAMBIO: con el vigilante activo ni siquiera se mira la huella si no hubo eventos."""
+    global _ALMACEN, _TAREAS_CAMBIADAS
+    if _ALMACEN is None:
+        import atexit
+        from nucleo_dashboard.almacen_tareas import AlmacenTareas
+        vigilante()  # CAMBIO: primero (crea el pool de intérpretes antes que cualquier hilo)
+        _ALMACEN = AlmacenTareas(ruta_raiz("tareas.json"), lote=32, max_retraso=2.0)
+        atexit.register(_ALMACEN.sincronizar)
+    elif _TAREAS_CAMBIADAS or _VIGILANTE is None:  # CAMBIO: solo si el vigilante vio cambios
+        _TAREAS_CAMBIADAS = False
+        _ALMACEN.refrescar()
+    return _ALMACEN
 
 def fecha_valida(s):
+    from datetime import datetime
     try: datetime.strptime(s, "%Y-%m-%d"); return True
     except: return False
 
 def crear_tarea():
-    tareas = cargar_tareas()
+    from nucleo_dashboard.almacen_tareas import ESTADOS, UNIDADES
     print("\n== Nueva tarea ==")
     titulo = input("Título: ").strip()
     if not titulo: print("El título es obligatorio."); return
@@ -255,46 +423,35 @@ def crear_tarea():
     fecha = input("Fecha límite (YYYY-MM-DD, opcional): ").strip()
     if fecha and not fecha_valida(fecha): print("Fecha inválida. Se deja vacía."); fecha = ""
     nota = input("Nota (opcional): ").strip()
-    nueva = {"id": gen_id(tareas), "titulo": titulo, "unidad": unidad, "estado": estado, "fecha_limite": fecha, "nota": nota}
-    tareas.append(nueva); guardar_tareas(tareas); print(f"✔ Tarea creada (id={nueva['id']})")
-
-def _parse_fecha(s):
-    try: return datetime.strptime(s, "%Y-%m-%d")
-    except: return None
-
-def listar_tareas(f_estado=None, f_unidad=None, proximas=False):
-    tareas = cargar_tareas(); data = tareas
-    if f_estado: data = [t for t in data if t.get("estado") == f_estado]
-    if f_unidad: data = [t for t in data if t.get("unidad") == f_unidad]
-    if proximas:
-        hoy = datetime.now().date()
-        data = [t for t in data if t.get("estado") != "completada" and _parse_fecha(t.get("fecha_limite") or "") and _parse_fecha(t["fecha_limite"]).date() >= hoy]
-        data.sort(key=lambda t: _parse_fecha(t["fecha_limite"]))
+    nueva = almacen().crear(titulo, unidad, estado, fecha, nota); print(f"✔ Tarea creada (id={nueva['id']})")
+
+def listar_tareas(f_estado=None, f_unidad=None, proximas=False, limite=None):
+    from datetime import datetime
+    if proximas:  # CAMBIO: heap de vencimientos (fechas parseadas una vez al cargar)
+        data = almacen().proximas(datetime.now().date(), limite=limite, estado=f_estado, unidad=f_unidad)
+    else:
+        data = almacen().listar(estado=f_estado, unidad=f_unidad)  # CAMBIO: filtros por índice
     if not data: print("(Sin tareas)"); return
     print("\n== Tareas ==")
     for t in data:
         print(f"[{int(t['id']):03}] {t['titulo']} | {t['unidad']} | {t['estado']} | vence: {t.get('fecha_limite') or '—'} | nota: {t.get('nota') or '—'}")
 
 def completar_tarea():
-    tareas = cargar_tareas()
     try:
         i = int(input("ID a completar: ").strip())
     except: print("ID inválido."); return
-    for t in tareas:
-        if int(t.get("id", -1)) == i:
-            t["estado"] = "completada"; guardar_tareas(tareas); print("✔ Marcada como completada."); return
-    print("No existe ese ID.")
+    if almacen().completar(i): print("✔ Marcada como completada.")
+    else: print("No existe ese ID.")
 
 def eliminar_tarea():
-    tareas = cargar_tareas()
     try:
         i = int(input("ID a eliminar: ").strip())
     except: print("ID inválido."); return
-    nuevo = [t for t in tareas if int(t.get("id", -1)) != i]
-    if len(nuevo) == len(tareas): print("No existe ese ID."); return
-    guardar_tareas(nuevo); print("🗑 Eliminada.")
+    if almacen().eliminar(i): print("🗑 Eliminada.")
+    else: print("No existe ese ID.")
 
 def panel_tareas():
+    from nucleo_dashboard.almacen_tareas import ESTADOS, UNIDADES
     while True:
         limpiar()
         print("PANEL DE TAREAS")
@@ -319,10 +476,17 @@ def panel_tareas():
             if u in UNIDADES: listar_tareas(f_unidad=u)
             else: print("Unidad inválida.")
             pausar()
-        elif op == "5": listar_tareas(proximas=True); pausar()
+        elif op == "5":
+            n = input("¿Cuántas? (Enter = todas): ").strip()
+            listar_tareas(proximas=True, limite=int(n) if n.isdigit() else None); pausar()
         elif op == "6": completar_tarea(); pausar()
         elif op == "7": eliminar_tarea(); pausar()
-        elif op == "0": break
+        elif op == "0":
+            if _ALMACEN is not None:  # NUEVO: volcar lo pendiente al salir
+                for viejo, nuevo in _ALMACEN.sincronizar().items():
+                    print(f"Aviso: otro proceso usó el id {viejo}; tu tarea quedó con id={nuevo}.")
+                if _ALMACEN.renumeradas: pausar()
+            break
         else: print("Opción no válida."); pausar()
 
 # ============= GESTOR (OPCIÓN 3) =============
@@ -334,35 +498,162 @@ def gestor():
         print("1) Crear carpeta")
         print("2) Crear archivo")
         print("3) Panel de Tareas")
+        print("4) Crear en lote (manifiesto JSON/YAML)")
         print("0) Volver")
         op = input("Opción: ").strip()
         if op == "1": crear_carpeta(); pausar()
         elif op == "2": crear_archivo(); pausar()
         elif op == "3": panel_tareas()
+        elif op == "4": crear_lote(); pausar()
         elif op == "0": break
         else: print("Opción no válida."); pausar()
 
+# ============= ESTADÍSTICAS (OPCIÓN 4) =============
+# NUEVO: archivos, líneas y clases/funciones por Semana (análisis ast en paralelo,
+#        caché por archivo en .cache_dashboard/estadisticas.json).
+
+_ESTADISTICAS = None
+
+def estadisticas():
+    global _ESTADISTICAS
+    from nucleo_dashboard.estadisticas import EstadisticasRepo, formatear
+    if _ESTADISTICAS is None:
+        _ESTADISTICAS = EstadisticasRepo(raiz(), ruta_raiz(CACHE_DIR, "estadisticas.json"))
+    limpiar()
+    print("ESTADÍSTICAS DEL REPOSITORIO\n")
+    print(formatear(_ESTADISTICAS.escanear()))
+
 # ============= MENÚ PRINCIPAL =============
 
-def menu():
+def menu(al_mostrar=None):
+    """al_mostrar: # NUEVO: se llama una vez, justo después de dibujar el primer menú."""
     while True:
         limpiar()
         print("DASHBOARD POO – Repositorio")
-        print("Raíz:", RAIZ)
+        print("Raíz:", raiz())
         print("1) Navegar PARCIAL 01")
         print("2) Navegar PARCIAL 02")
         print("3) Gestor (crear + tareas)")
+        print("4) Estadísticas del repo")
         print("0) Salir")
+        if al_mostrar: al_mostrar(); al_mostrar = None
         op = input("Opción: ").strip()
         if op == "0": break
-        if op == "1":
-            if os.path.isdir(PARCIAL_01): navegar(PARCIAL_01, "Explorador PARCIAL 01")
-            else: print("No existe PARCIAL 01."); pausar()
-        elif op == "2":
-            if os.path.isdir(PARCIAL_02): navegar(PARCIAL_02, "Explorador PARCIAL 02")
-            else: print("No existe PARCIAL 02."); pausar()
+        if op in ("1", "2"):
+            nombre = f"PARCIAL 0{op}"; carpeta = ruta_raiz(nombre)
+            if os.path.isdir(carpeta): navegar(carpeta, f"Explorador {nombre}")
+            else: print(f"No existe {nombre}."); pausar()
         elif op == "3": gestor()
+        elif op == "4": estadisticas(); pausar()
         else: print("Opción no válida."); pausar()
 
+# ============= TUI (--tui) =============
+# NUEVO: python "practico Experimental2(Dashoard).py" --tui
+# Interfaz sin bloqueos (asyncio): se navega con flechas mientras la indexación, la ejecución
+# de scripts y el vigilante de archivos trabajan en segundo plano. Sin terminal real (o en
+# Windows) se usa el menú clásico.
+
+def _ejecutar_fondo(ruta, forzar=False):
+    """Ejecución para la TUI (corre en un hilo): subprocess en vez del pool de intérpretes,
+    porque bifurcar (fork) desde varios hilos a la vez no es seguro."""
+    from nucleo_dashboard.cache_ejecucion import ejecutar_con_cache
+    from nucleo_dashboard.pool_interpretes import ejecutar_subproceso
+    if es_interactivo(ruta):  # sin teclado: input() recibe EOF
+        return ejecutar_subproceso(ruta), False
+    return ejecutar_con_cache(ruta, cache_ejecucion(), forzar=forzar, ejecutor=ejecutar_subproceso)
+
+def tui():
+    from nucleo_dashboard.tui import Terminal
+    from nucleo_dashboard.vistas_tui import Contexto, ejecutar_tui
+    if not Terminal.disponible():
+        print("La TUI necesita una terminal POSIX; se usa el menú clásico."); pausar()
+        menu(); return
+    from nucleo_dashboard.estadisticas import EstadisticasRepo
+    global _ESTADISTICAS
+    if _ESTADISTICAS is None:
+        _ESTADISTICAS = EstadisticasRepo(raiz(), ruta_raiz(CACHE_DIR, "estadisticas.json"))
+    vigilante(con_pool=False)  # la TUI ejecuta con subprocess (_ejecutar_fondo)
+    ejecutar_tui(Contexto(raiz=raiz(), dentro_repo=dentro_repo, listar=_LISTADOS.listar,
+                          vigilante=_VIGILANTE, almacen=almacen, ejecutar=_ejecutar_fondo,
+                          estadisticas=_ESTADISTICAS.escanear))
+    if _ALMACEN is not None:
+        for viejo, nuevo in _ALMACEN.sincronizar().items():
+            print(f"Aviso: otro proceso usó el id {viejo}; tu tarea quedó con id={nuevo}.")
+
+# ============= PERFIL (--perfil) =============
+# NUEVO: python "practico Experimental2(Dashoard).py" --perfil
+# Cuenta las syscalls de archivos de la sesión y, al salir, compara las versiones
+# anteriores de las comprobaciones de ruta con las actuales sobre las carpetas del repo.
+
+def _dentro_repo_anterior(path):
+    try:
+        return os.path.commonpath([os.path.realpath(path), os.path.realpath(raiz())]) == os.path.realpath(raiz())
+    except Exception:
+        return False
+
+def _contiene_parciales_anterior(path):
+    try:
+        d = {e.name.upper() for e in os.scandir(path) if e.is_dir()}
+        return ("PARCIAL 01" in d) or ("PARCIAL 02" in d)
+    except Exception:
+        return False
+
+def reporte_perfil(contador):
+    from nucleo_dashboard.perfil import comparar
+    contador.desactivar()
+    print("\n== Perfil de la sesión ==")
+    print("Syscalls de archivos:", contador.resumen())
+    bases = (ruta_raiz("PARCIAL 01"), ruta_raiz("PARCIAL 02"))
+    carpetas = [r for base in bases if os.path.isdir(base) for r, _, _ in os.walk(base)]
+    # 'U' (subir) comprueba el padre de la carpeta actual en cada navegación
+    print(comparar("dentro_repo al subir", [os.path.dirname(c) for c in carpetas],
+                   _dentro_repo_anterior, lambda r: dentro_repo(r, resuelta=True)))
+    print(comparar("detección de raíz", [raiz()] * 10, _contiene_parciales_anterior, contiene_parciales))
+
+# ============= ARRANQUE (--arranque) =============
+# NUEVO: python "practico Experimental2(Dashoard).py" --arranque
+# Relanza el Dashboard con 'python -X importtime', le envía "0" (salir) y reporta:
+# tiempo hasta el primer menú, tiempo total de imports y los imports más costosos.
+
+def _marcar_menu():
+    ms = (time.perf_counter() - _T0) * 1000
+    print(f"[arranque] primer menú a {ms:.1f} ms del inicio del módulo", file=sys.stderr, flush=True)
+
+def reporte_arranque(top=10):
+    import subprocess
+    t0 = time.perf_counter()
+    res = subprocess.run([sys.executable, "-X", "importtime", os.path.abspath(__file__), "--medir-arranque"],
+                         input="0\n", text=True, capture_output=True)
+    total_ms = (time.perf_counter() - t0) * 1000
+    imports, menu_ms = [], None
+    for linea in res.stderr.splitlines():
+        if linea.startswith("import time:") and "|" in linea:
+            propio, acumulado, nombre = linea.split(":", 1)[1].split("|")
+            if propio.strip().isdigit():  # salta la cabecera "self [us] | cumulative | ..."
+                imports.append((int(acumulado), int(propio), nombre.rstrip()))
+        elif linea.startswith("[arranque] primer menú a "):
+            menu_ms = float(linea.split()[4])
+    print("== Arranque del Dashboard ==")
+    print(f"Proceso completo (intérprete + primer menú + salir): {total_ms:.1f} ms")
+    if menu_ms is not None:
+        print(f"Módulo del Dashboard hasta el primer menú: {menu_ms:.1f} ms")
+    raiz_imports = [i for i in imports if not i[2].startswith("  ")]  # sin sangría = import de primer nivel
+    print(f"Imports: {len(imports)} módulos, {sum(i[0] for i in raiz_imports) / 1000:.1f} ms acumulados")
+    print(f"\nTop {top} imports (acumulado):")
+    for acumulado, propio, nombre in sorted(imports, reverse=True)[:top]:
+        print(f"  {acumulado / 1000:7.2f} ms  (propio {propio / 1000:6.2f})  {nombre.strip()}")
+
 if __name__ == "__main__":
-    menu()
\ No newline at end of file
+    if "--arranque" in sys.argv:
+        reporte_arranque()
+    elif "--tui" in sys.argv:
+        tui()
+    elif "--medir-arranque" in sys.argv:
+        menu(al_mostrar=_marcar_menu)
+    elif "--perfil" in sys.argv:
+        from nucleo_dashboard.perfil import ContadorSyscalls
+        contador = ContadorSyscalls(); contador.activar()
+        try: menu()
+        finally: reporte_perfil(contador)
+    else:
+        menu()
\ No newline at end of file
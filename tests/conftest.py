@@ -0,0 +1,25 @@
+# tests/conftest.py
+# Las carpetas de las semanas no son paquetes (y tienen espacios): se agregan a sys.path y
+# los scripts con nombres no importables se cargan por ruta con cargar_script().
+import importlib.util
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parents[1]
+SEMANA06 = RAIZ / "PARCIAL 01" / "Semana 06"
+SEMANA07 = RAIZ / "PARCIAL 01" / "Semana 07-Metodo_constructor-destructor"
+
+for _carpeta in (RAIZ, SEMANA06, SEMANA07):
+    if str(_carpeta) not in sys.path:
+        sys.path.insert(0, str(_carpeta))
+
+
+def cargar_script(ruta: Path, nombre: str):
+    """Importa un script por ruta (una sola vez por sesión)."""
+    if nombre in sys.modules:
+        return sys.modules[nombre]
+    spec = importlib.util.spec_from_file_location(nombre, ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules[nombre] = modulo
+    spec.loader.exec_module(modulo)
+    return modulo
@@ -0,0 +1,78 @@
+# tests/test_almacen_concurrencia.py — bloqueo + compare-and-swap + merge entre "procesos".
+# Dos AlmacenTareas sobre la misma ruta se comportan como dos Dashboards: cada uno trabaja
+# sobre su revisión base y el merge ocurre al sincronizar.
+import pytest
+
+from nucleo_dashboard.almacen_tareas import AlmacenTareas
+from nucleo_dashboard.estres_tareas import estres
+
+BACKENDS = ("diario", "instantanea")
+
+
+def _par(ruta, backend):
+    return (AlmacenTareas(ruta, backend=backend, lote=100, max_retraso=3600),
+            AlmacenTareas(ruta, backend=backend, lote=100, max_retraso=3600))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_crear_en_paralelo_renumera_sin_perder(tmp_path, backend):
+    ruta = tmp_path / "tareas.json"
+    a, b = _par(ruta, backend)
+    ta = a.crear("de a", "PARCIAL 01", "pendiente")
+    tb = b.crear("de b", "PARCIAL 01", "pendiente")
+    assert ta["id"] == tb["id"] == 1
+    assert b.sincronizar() == {}
+    assert a.sincronizar() == {1: 2}
+    assert a.renumeradas == {1: 2}
+    final = AlmacenTareas(ruta, backend=backend)
+    assert {t["id"]: t["titulo"] for t in final.listar()} == {1: "de b", 2: "de a"}
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_operaciones_sobre_tarea_renumerada_siguen_al_id_final(tmp_path, backend):
+    ruta = tmp_path / "tareas.json"
+    a, b = _par(ruta, backend)
+    t = a.crear("de a", "PARCIAL 01", "pendiente")
+    a.completar(t["id"])
+    b.crear("de b", "PARCIAL 01", "pendiente"); b.sincronizar()
+    a.sincronizar()
+    final = {t["titulo"]: t for t in AlmacenTareas(ruta, backend=backend).listar()}
+    assert final["de a"]["estado"] == "completada" and final["de a"]["id"] == 2
+    assert final["de b"]["estado"] == "pendiente"
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_actualizar_gana_la_ultima_escritura(tmp_path, backend):
+    ruta = tmp_path / "tareas.json"
+    AlmacenTareas(ruta, backend=backend).crear("x", "PARCIAL 01", "pendiente")
+    a, b = _par(ruta, backend)
+    b.actualizar(1, nota="de b", estado="en progreso"); b.sincronizar()
+    a.actualizar(1, nota="de a"); a.sincronizar()
+    t = AlmacenTareas(ruta, backend=backend).obtener(1)
+    assert t["nota"] == "de a"
+    assert t["estado"] == "en progreso"  # campo que 'a' no tocó: se conserva el de 'b'
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_actualizar_tarea_eliminada_por_otro_se_descarta(tmp_path, backend):
+    ruta = tmp_path / "tareas.json"
+    AlmacenTareas(ruta, backend=backend).crear("x", "PARCIAL 01", "pendiente")
+    a, b = _par(ruta, backend)
+    b.eliminar(1); b.sincronizar()
+    a.completar(1); a.sincronizar()
+    assert AlmacenTareas(ruta, backend=backend).listar() == []
+    assert a.listar() == []
+
+
+def test_refrescar_solo_recarga_si_otro_escribio(tmp_path):
+    ruta = tmp_path / "tareas.json"
+    a, b = AlmacenTareas(ruta), AlmacenTareas(ruta)
+    assert a.refrescar() is False
+    b.crear("x", "PARCIAL 01", "pendiente")
+    assert a.refrescar() is True
+    assert [t["titulo"] for t in a.listar()] == ["x"]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_estres_varios_procesos_sin_perdidas(backend):
+    assert estres(procesos=4, n=40, umbral=25, backend=backend)
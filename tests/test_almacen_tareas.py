@@ -0,0 +1,115 @@
+# tests/test_almacen_tareas.py — diario (journal) del almacén y cola de pendientes próximas.
+from datetime import date
+import json
+
+from nucleo_dashboard.almacen_tareas import AlmacenTareas
+
+HOY = date(2026, 1, 1)
+
+
+def _titulos(tareas):
+    return [t["titulo"] for t in tareas]
+
+
+def test_diario_persiste_y_se_reproduce(tmp_path):
+    ruta = tmp_path / "tareas.json"
+    a = AlmacenTareas(ruta)
+    x = a.crear("x", "PARCIAL 01", "pendiente", "2030-01-01")
+    y = a.crear("y", "PARCIAL 02", "pendiente")
+    a.actualizar(x["id"], nota="hola")
+    a.eliminar(y["id"])
+    diario = (tmp_path / "tareas.json.journal").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(l)["op"] for l in diario] == ["crear", "crear", "actualizar", "eliminar"]
+
+    b = AlmacenTareas(ruta)
+    assert [dict(t) for t in b.listar()] == [dict(t) for t in a.listar()]
+    assert b.obtener(x["id"])["nota"] == "hola"
+    assert b.siguiente_id == 3  # persistido: no reutiliza el id eliminado
+
+
+def test_reproduccion_idempotente_tras_corte_en_compactacion(tmp_path):
+    ruta = tmp_path / "tareas.json"
+    a = AlmacenTareas(ruta)
+    for i in range(3):
+        a.crear(f"t{i}", "PARCIAL 01", "pendiente")
+    diario = (tmp_path / "tareas.json.journal").read_bytes()
+    a.compactar()
+    # Corte simulado: la instantánea ya se escribió pero el diario no llegó a vaciarse.
+    (tmp_path / "tareas.json.journal").write_bytes(diario)
+    b = AlmacenTareas(ruta)
+    assert _titulos(b.listar()) == ["t0", "t1", "t2"]
+
+
+def test_linea_truncada_del_diario_se_descarta(tmp_path):
+    ruta = tmp_path / "tareas.json"
+    a = AlmacenTareas(ruta)
+    a.crear("completa", "PARCIAL 01", "pendiente")
+    with open(tmp_path / "tareas.json.journal", "ab") as f:
+        f.write(b'{"op": "crear", "seq": 2, "tarea": {"id": 2, "tit')
+    b = AlmacenTareas(ruta)
+    assert _titulos(b.listar()) == ["completa"]
+    assert b.crear("nueva", "PARCIAL 01", "pendiente")["id"] == 2
+    assert _titulos(AlmacenTareas(ruta).listar()) == ["completa", "nueva"]
+
+
+def test_compacta_al_llegar_al_umbral(tmp_path):
+    ruta = tmp_path / "tareas.json"
+    a = AlmacenTareas(ruta, umbral_compactacion=5)
+    for i in range(7):
+        a.crear(f"t{i}", "PARCIAL 01", "pendiente")
+    instantanea = json.loads(ruta.read_text(encoding="utf-8"))
+    assert len(instantanea["tareas"]) >= 5
+    assert len(AlmacenTareas(ruta).listar()) == 7
+
+
+def test_lote_diferido_se_escribe_al_sincronizar(tmp_path):
+    ruta = tmp_path / "tareas.json"
+    a = AlmacenTareas(ruta, lote=10, max_retraso=3600)
+    a.crear("x", "PARCIAL 01", "pendiente")
+    assert len(AlmacenTareas(ruta)) == 0
+    a.sincronizar()
+    assert len(AlmacenTareas(ruta)) == 1
+
+
+def test_proximas_ordenadas_con_limite_y_filtros(tmp_path):
+    a = AlmacenTareas(tmp_path / "tareas.json")
+    a.crear("tarde", "PARCIAL 01", "pendiente", "2030-03-01")
+    a.crear("pronto", "PARCIAL 02", "pendiente", "2030-01-01")
+    a.crear("medio", "PARCIAL 01", "en progreso", "2030-02-01")
+    a.crear("vencida", "PARCIAL 01", "pendiente", "2020-01-01")
+    a.crear("sin fecha", "PARCIAL 01", "pendiente")
+    hecha = a.crear("hecha", "PARCIAL 01", "pendiente", "2029-01-01")
+    a.completar(hecha["id"])
+    assert _titulos(a.proximas(HOY)) == ["pronto", "medio", "tarde"]
+    assert _titulos(a.proximas(HOY, limite=2)) == ["pronto", "medio"]
+    assert _titulos(a.proximas(HOY, unidad="PARCIAL 01")) == ["medio", "tarde"]
+    assert _titulos(a.proximas(HOY, estado="pendiente")) == ["pronto", "tarde"]
+    assert _titulos(a.proximas(HOY)) == ["pronto", "medio", "tarde"]  # consultar no consume
+
+
+def test_proximas_sigue_cambios_de_fecha_y_estado(tmp_path):
+    a = AlmacenTareas(tmp_path / "tareas.json")
+    x = a.crear("x", "PARCIAL 01", "pendiente", "2030-01-01")
+    y = a.crear("y", "PARCIAL 01", "pendiente", "2030-02-01")
+    a.actualizar(y["id"], fecha_limite="2029-01-01")
+    assert _titulos(a.proximas(HOY)) == ["y", "x"]
+    a.completar(y["id"])
+    assert _titulos(a.proximas(HOY)) == ["x"]
+    a.actualizar(y["id"], estado="pendiente")
+    assert _titulos(a.proximas(HOY)) == ["y", "x"]
+
+
+def test_cambiar_estado_muchas_veces_no_duplica_proximas(tmp_path):
+    a = AlmacenTareas(tmp_path / "tareas.json")
+    x = a.crear("x", "PARCIAL 01", "pendiente", "2030-01-01")
+    a.crear("y", "PARCIAL 01", "pendiente", "2030-02-01")
+    for i in range(50):
+        a.actualizar(x["id"], estado="en progreso" if i % 2 == 0 else "pendiente")
+        if i % 10 == 0:
+            a.completar(x["id"]); a.actualizar(x["id"], estado="pendiente")
+    assert _titulos(a.proximas(HOY)) == ["x", "y"]
+    assert _titulos(a.proximas(HOY, limite=1)) == ["x"]
+    assert _titulos(a.proximas(HOY, estado="pendiente")) == ["x", "y"]
+    assert _titulos(a.proximas(HOY, estado="en progreso")) == []
+    # Consultar no consume nada: repetir da lo mismo.
+    assert _titulos(a.proximas(HOY)) == ["x", "y"]
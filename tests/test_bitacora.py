@@ -0,0 +1,289 @@
+# tests/test_bitacora.py — group commit y durabilidad, modo asíncrono (contrapresión, drenado en
+# close, errores) e IndiceBitacora comparado contra releer el CSV completo.
+import csv
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from conftest import SEMANA07, cargar_script
+
+bitacora = cargar_script(SEMANA07 / "Metodo_Construtor_Destructor_BITACORA-INGRESO.py", "bitacora_ingreso")
+Bitacora, IndiceBitacora = bitacora.Bitacora, bitacora.IndiceBitacora
+
+NOMBRES = ["Ana", "Luis", "Pérez, Ana", 'Juan "JJ"', "Zoë", "María José"]
+
+
+def _filas_csv(ruta):
+    with open(ruta, encoding="utf-8", newline="") as f:
+        filas = [tuple(r) for r in csv.reader(f)]
+    assert filas[0] == tuple(Bitacora.HEAD)
+    return filas[1:]
+
+
+def _reloj(b, inicio=datetime(2026, 3, 1, 7, 0, 0), paso=7, retrocesos=False, semilla=1):
+    """Reemplaza la hora de la bitácora por un reloj controlado (cruza varios días)."""
+    rnd = random.Random(semilla)
+    estado = {"t": inicio}
+
+    def marca():
+        t = estado["t"]
+        salto = paso if not retrocesos or rnd.random() > 0.05 else -paso * 20
+        estado["t"] = t + timedelta(seconds=salto)
+        return t.strftime("%Y-%m-%d"), t.strftime("%H:%M:%S")
+
+    b._marca = marca
+
+
+def _eventos(b, n, semilla=2):
+    rnd = random.Random(semilla)
+    for _ in range(n):
+        nombre = rnd.choice(NOMBRES)
+        (b.entrada if rnd.random() < 0.55 else b.salida)(nombre)
+
+
+# ---------------- group commit y durabilidad ----------------
+
+def test_lote_1_confirma_cada_evento(tmp_path):
+    ruta = tmp_path / "b.csv"
+    with Bitacora(ruta) as b:
+        b.entrada("Ana")
+        assert [f[2:] for f in _filas_csv(ruta)] == [("Ana", "ENTRADA")]
+        assert b.pendientes() == 0
+
+
+def test_lote_acumula_hasta_llenarse(tmp_path):
+    ruta = tmp_path / "b.csv"
+    with Bitacora(ruta, lote=5, max_retraso=60) as b:
+        for i in range(4):
+            b.entrada(f"p{i}")
+        assert b.pendientes() == 4 and _filas_csv(ruta) == []
+        b.salida("p0")
+        assert b.pendientes() == 0 and len(_filas_csv(ruta)) == 5
+        b.entrada("tarde")
+        b.flush()
+        assert len(_filas_csv(ruta)) == 6
+        b.entrada("al cerrar")
+    assert [f[2] for f in _filas_csv(ruta)][-2:] == ["tarde", "al cerrar"]
+
+
+def test_max_retraso_confirma_la_mas_antigua(tmp_path, monkeypatch):
+    ruta = tmp_path / "b.csv"
+    reloj = {"t": 100.0}
+    monkeypatch.setattr(bitacora.time, "monotonic", lambda: reloj["t"])
+    with Bitacora(ruta, lote=100, max_retraso=1.0) as b:
+        b.entrada("a"); reloj["t"] += 0.5
+        b.entrada("b")
+        assert b.pendientes() == 2
+        reloj["t"] += 0.6          # la más antigua ya lleva 1.1 s
+        b.entrada("c")
+        assert b.pendientes() == 0 and len(_filas_csv(ruta)) == 3
+
+
+def test_durabilidades(tmp_path, monkeypatch):
+    sincronizados = []
+    monkeypatch.setattr(bitacora.os, "fsync", lambda fd: sincronizados.append(fd))
+    for durabilidad, esperados in (("ninguna", 0), ("flush", 0), ("fsync", 2)):
+        ruta = tmp_path / f"{durabilidad}.csv"
+        sincronizados.clear()
+        with Bitacora(ruta, lote=3, max_retraso=60, durabilidad=durabilidad) as b:
+            _eventos(b, 6)
+            if durabilidad == "flush":
+                assert len(_filas_csv(ruta)) == 6     # cada commit llega al SO
+        assert len(sincronizados) == esperados, durabilidad
+        assert len(_filas_csv(ruta)) == 6
+    with pytest.raises(ValueError):
+        Bitacora(tmp_path / "x.csv", durabilidad="siempre")
+
+
+def test_nombres_invalidos_y_cerrada(tmp_path):
+    b = Bitacora(tmp_path / "b.csv")
+    for malo in ("", "   ", "a\nb", "a\rb"):
+        with pytest.raises(ValueError):
+            b.entrada(malo)
+    b.close()
+    b.close()
+    with pytest.raises(RuntimeError):
+        b.entrada("Ana")
+
+
+# ---------------- modo asíncrono ----------------
+
+@pytest.fixture
+def escritor_trabado(monkeypatch):
+    """El hilo escritor se queda dentro de la escritura hasta que la prueba lo suelte."""
+    dentro, soltar = threading.Event(), threading.Event()
+    real = bitacora._escribir_filas
+
+    def escribir(fh, w, filas, durabilidad):
+        dentro.set()
+        assert soltar.wait(5)
+        real(fh, w, filas, durabilidad)
+
+    monkeypatch.setattr(bitacora, "_escribir_filas", escribir)
+    return dentro, soltar
+
+
+@pytest.mark.parametrize("lote", [1, 7])
+def test_asincrono_escribe_todo_en_orden(tmp_path, lote):
+    ruta = tmp_path / "b.csv"
+    b = Bitacora(ruta, asincrono=True, lote=lote, capacidad=64)
+    _reloj(b)
+    _eventos(b, 2000)
+    b.flush()
+    assert b.pendientes() == 0 and len(_filas_csv(ruta)) == 2000
+    _eventos(b, 500, semilla=3)
+    b.close()
+    filas = _filas_csv(ruta)
+    assert len(filas) == 2500
+    assert [f"{f[0]} {f[1]}" for f in filas] == sorted(f"{f[0]} {f[1]}" for f in filas)
+    assert list(Bitacora.historial(ruta)) == filas
+
+
+def test_contrapresion_con_espera_max(tmp_path, escritor_trabado):
+    dentro, soltar = escritor_trabado
+    ruta = tmp_path / "b.csv"
+    b = Bitacora(ruta, asincrono=True, capacidad=2, espera_max=0.05)
+    b.entrada("a")
+    assert dentro.wait(5)                 # el escritor tomó "a" y quedó trabado
+    b.entrada("b"); b.entrada("c")        # llenan la cola
+    t0 = time.monotonic()
+    with pytest.raises(TimeoutError):
+        b.entrada("d")
+    assert time.monotonic() - t0 >= 0.04
+    assert b.pendientes() == 2
+    soltar.set()
+    b.close()
+    assert [f[2] for f in _filas_csv(ruta)] == ["a", "b", "c"]
+
+
+def test_close_espera_a_que_se_vacie_la_cola(tmp_path, escritor_trabado):
+    dentro, soltar = escritor_trabado
+    ruta = tmp_path / "b.csv"
+    b = Bitacora(ruta, asincrono=True, capacidad=1000)
+    for i in range(300):
+        b.entrada(f"p{i}")
+    assert dentro.wait(5)
+    threading.Timer(0.1, soltar.set).start()
+    b.close()                              # bloquea hasta que el escritor termina
+    assert [f[2] for f in _filas_csv(ruta)] == [f"p{i}" for i in range(300)]
+    assert b._hilo is None
+
+
+def test_error_en_segundo_plano_se_informa_una_vez(tmp_path, monkeypatch):
+    real, fallas = bitacora._escribir_filas, {"n": 1}
+
+    def escribir(fh, w, filas, durabilidad):
+        if fallas["n"]:
+            fallas["n"] -= 1
+            raise OSError("disco lleno")
+        real(fh, w, filas, durabilidad)
+
+    monkeypatch.setattr(bitacora, "_escribir_filas", escribir)
+    ruta = tmp_path / "b.csv"
+    b = Bitacora(ruta, asincrono=True)
+    b.entrada("perdida")
+    with pytest.raises(OSError, match="disco lleno"):
+        b.flush()
+    b.entrada("ok")
+    b.close()                              # ya no hay error pendiente
+    assert [f[2] for f in _filas_csv(ruta)] == ["ok"]
+
+
+# ---------------- IndiceBitacora ----------------
+
+def _dentro_esperado(filas):
+    dentro = {}
+    for fecha, hora, nombre, tipo in filas:
+        if tipo == "ENTRADA":
+            dentro[nombre] = f"{fecha} {hora}"
+        else:
+            dentro.pop(nombre, None)
+    return dentro
+
+
+def _comparar(indice, ruta):
+    filas = _filas_csv(ruta)
+    for nombre in NOMBRES + ["Nadie"]:
+        assert indice.de_nombre(nombre) == [f for f in filas if f[2] == nombre], nombre
+    assert indice.de_nombre("  Ana  ") == [f for f in filas if f[2] == "Ana"]
+    dentro = _dentro_esperado(filas)
+    assert indice.dentro == dentro and indice.ocupacion() == len(dentro)
+    assert list(indice.presentes().values()) == sorted(dentro.values())
+    assert all(indice.esta_dentro(n) == (n in dentro) for n in NOMBRES)
+    marcas = sorted({f"{f[0]} {f[1]}" for f in filas})
+    rnd = random.Random(len(filas))
+    consultas = [(marcas[0], marcas[-1]), ("2000-01-01 00:00:00", "2000-12-31 23:59:59")]
+    consultas += [tuple(sorted(rnd.sample(marcas, 2))) for _ in range(25)]
+    consultas += [(m, m) for m in rnd.sample(marcas, 5)]
+    for desde, hasta in consultas:
+        esperado = [f for f in filas if desde <= f"{f[0]} {f[1]}" <= hasta]
+        assert sorted(indice.entre(desde, hasta)) == sorted(esperado), (desde, hasta)
+    desde = datetime.strptime(marcas[len(marcas) // 3], "%Y-%m-%d %H:%M:%S")
+    hasta = desde + timedelta(hours=5)
+    assert sorted(indice.entre(desde, hasta)) == sorted(
+        f for f in filas if str(desde) <= f"{f[0]} {f[1]}" <= str(hasta))
+
+
+@pytest.mark.parametrize("retrocesos", [False, True])
+def test_indice_igual_a_releer_el_csv(tmp_path, retrocesos):
+    ruta = tmp_path / "b.csv"
+    with Bitacora(ruta, indexar=True, lote=50) as b:
+        _reloj(b, retrocesos=retrocesos)
+        _eventos(b, 6000)                  # ~12 h por día: tramos de varias decenas de KB
+        _comparar(b.indice, ruta)          # abierta: de_nombre/entre vacían lo pendiente antes de leer
+    assert (tmp_path / "b.csv.idx.json").exists()
+    _comparar(IndiceBitacora(ruta), ruta)  # reabierto desde el .idx.json
+
+
+def test_indice_incremental_al_reabrir(tmp_path):
+    ruta = tmp_path / "b.csv"
+    with Bitacora(ruta, indexar=True) as b:
+        _reloj(b)
+        _eventos(b, 800)
+    # Segunda sesión con índice: retoma desde el último byte indexado.
+    with Bitacora(ruta, indexar=True, asincrono=True) as b:
+        _reloj(b, inicio=datetime(2026, 3, 4, 8, 0, 0))
+        assert b.indice.bytes == ruta.stat().st_size
+        _eventos(b, 800, semilla=5)
+        _comparar(b.indice, ruta)
+    # Filas agregadas sin índice: al abrir el índice se pone al día con lo que falta.
+    with Bitacora(ruta) as b:
+        _reloj(b, inicio=datetime(2026, 3, 6, 8, 0, 0))
+        _eventos(b, 300, semilla=6)
+    indice = IndiceBitacora(ruta)
+    assert indice.bytes == ruta.stat().st_size
+    _comparar(indice, ruta)
+
+
+def test_indice_se_reconstruye_si_el_csv_es_mas_corto(tmp_path):
+    ruta = tmp_path / "b.csv"
+    with Bitacora(ruta, indexar=True) as b:
+        _reloj(b)
+        _eventos(b, 500)
+    ruta.unlink()                          # p.ej. lo borraron a mano; el .idx.json quedó
+    with Bitacora(ruta) as b:
+        _reloj(b, inicio=datetime(2026, 4, 1, 9, 0, 0))
+        _eventos(b, 40, semilla=9)
+    indice = IndiceBitacora(ruta)
+    assert indice.bytes == ruta.stat().st_size
+    _comparar(indice, ruta)
+
+
+def test_indice_ignora_una_fila_a_medio_escribir(tmp_path):
+    ruta = tmp_path / "b.csv"
+    with Bitacora(ruta) as b:
+        _reloj(b)
+        _eventos(b, 20)
+    completo = ruta.stat().st_size
+    with open(ruta, "a", encoding="utf-8", newline="") as f:
+        f.write("2026-03-01,09:00:00,Ana,ENT")   # sin salto de línea
+    indice = IndiceBitacora(ruta)
+    assert indice.bytes == completo
+    with open(ruta, "a", encoding="utf-8", newline="") as f:
+        f.write("RADA\r\n")
+    indice = IndiceBitacora(ruta)
+    assert indice.bytes == ruta.stat().st_size
+    _comparar(indice, ruta)
@@ -0,0 +1,107 @@
+# tests/test_cache_ejecucion.py — caché de ejecuciones: opt-in, clave con módulos vecinos, LRU.
+import os
+import time
+
+from nucleo_dashboard.cache_ejecucion import (CacheEjecucion, ejecutar_con_cache,
+                                              es_determinista, lee_stdin, modulos_vecinos)
+
+MARCA = "# dashboard: determinista\n"
+
+
+class _Ejecutor:
+    """Ejecutor falso: cuenta llamadas y devuelve un resultado fijo."""
+    def __init__(self, returncode=0):
+        self.llamadas = []
+        self.returncode = returncode
+
+    def __call__(self, ruta, entrada=""):
+        self.llamadas.append((ruta, entrada))
+        return {"stdout": f"corrida {len(self.llamadas)}\n", "stderr": "",
+                "returncode": self.returncode, "duracion": 0.0}
+
+
+def _script(carpeta, nombre, codigo):
+    ruta = carpeta / nombre
+    ruta.write_text(codigo, encoding="utf-8")
+    return str(ruta)
+
+
+def test_marca_y_stdin():
+    assert es_determinista(b"x = 1\n" + MARCA.encode())
+    assert not es_determinista(b"print('# dashboard: determinista')\n")
+    assert lee_stdin(b"n = input('n: ')") and lee_stdin(b"import sys\nsys.stdin.read()")
+    assert not lee_stdin(b"print(1)")
+
+
+def test_acierto_y_forzar(tmp_path):
+    cache = CacheEjecucion(tmp_path / "cache")
+    script = _script(tmp_path, "a.py", MARCA + "print(1)\n")
+    ej = _Ejecutor()
+    r1, desde1 = ejecutar_con_cache(script, cache, ejecutor=ej)
+    r2, desde2 = ejecutar_con_cache(script, cache, ejecutor=ej)
+    assert (desde1, desde2) == (False, True) and r1 == r2 and len(ej.llamadas) == 1
+    r3, desde3 = ejecutar_con_cache(script, cache, forzar=True, ejecutor=ej)
+    assert not desde3 and r3["stdout"] == "corrida 2\n"
+    assert ejecutar_con_cache(script, cache, ejecutor=ej)[0]["stdout"] == "corrida 2\n"
+
+
+def test_sin_marca_siempre_se_ejecuta(tmp_path):
+    cache = CacheEjecucion(tmp_path / "cache")
+    script = _script(tmp_path, "b.py", "open('salida.txt', 'w').write('x')\n")
+    ej = _Ejecutor()
+    for _ in range(3):
+        assert ejecutar_con_cache(script, cache, ejecutor=ej)[1] is False
+    assert len(ej.llamadas) == 3
+    assert not (tmp_path / "cache").exists()
+
+
+def test_returncode_distinto_de_cero_no_se_cachea(tmp_path):
+    cache = CacheEjecucion(tmp_path / "cache")
+    script = _script(tmp_path, "c.py", MARCA + "raise SystemExit(2)\n")
+    ej = _Ejecutor(returncode=2)
+    ejecutar_con_cache(script, cache, ejecutor=ej)
+    assert ejecutar_con_cache(script, cache, ejecutor=ej)[1] is False
+    assert len(ej.llamadas) == 2
+
+
+def test_stdin_sin_entrada_no_se_cachea_y_con_entrada_si(tmp_path):
+    cache = CacheEjecucion(tmp_path / "cache")
+    script = _script(tmp_path, "d.py", MARCA + "print(input())\n")
+    ej = _Ejecutor()
+    ejecutar_con_cache(script, cache, ejecutor=ej)
+    assert ejecutar_con_cache(script, cache, ejecutor=ej)[1] is False
+    ejecutar_con_cache(script, cache, entrada="hola\n", ejecutor=ej)
+    assert ejecutar_con_cache(script, cache, entrada="hola\n", ejecutor=ej)[1] is True
+    assert ejecutar_con_cache(script, cache, entrada="chao\n", ejecutor=ej)[1] is False
+    assert [e for _, e in ej.llamadas] == ["", "", "hola\n", "chao\n"]
+
+
+def test_editar_un_modulo_vecino_invalida(tmp_path):
+    cache = CacheEjecucion(tmp_path / "cache")
+    _script(tmp_path, "util.py", "import base\nVALOR = 1\n")
+    base = _script(tmp_path, "base.py", "X = 1\n")
+    script = _script(tmp_path, "e.py", MARCA + "import os\nfrom util import VALOR\nprint(VALOR)\n")
+    assert [os.path.basename(m) for m in modulos_vecinos(script)] == ["base.py", "util.py"]
+    ej = _Ejecutor()
+    ejecutar_con_cache(script, cache, ejecutor=ej)
+    assert ejecutar_con_cache(script, cache, ejecutor=ej)[1] is True
+    # Un cambio en un import indirecto (e -> util -> base) también cuenta.
+    with open(base, "a", encoding="utf-8") as f:
+        f.write("X = 2\n")
+    assert ejecutar_con_cache(script, cache, ejecutor=ej)[1] is False
+    assert ejecutar_con_cache(script, cache, ejecutor=ej)[1] is True
+
+
+def test_desalojo_lru(tmp_path):
+    cache = CacheEjecucion(tmp_path / "cache", max_bytes=10_000)
+    relleno = {"stdout": "x" * 3000, "stderr": "", "returncode": 0, "duracion": 0.0}
+    for i, clave in enumerate("abc"):
+        cache.guardar(clave, relleno)
+        os.utime(cache._ruta(clave), (i, i))  # a es la más vieja
+    assert cache.obtener("a") is not None     # usar 'a' la vuelve la más reciente
+    time.sleep(0.01)
+    cache.guardar("d", relleno)               # 4 x ~3 KB > 10 KB: sale la menos usada
+    restantes = sorted(n[:-len(".json")] for n in os.listdir(tmp_path / "cache"))
+    assert restantes == ["a", "c", "d"]
+    cache.limpiar()
+    assert os.listdir(tmp_path / "cache") == []
@@ -0,0 +1,92 @@
+# tests/test_conexion_asincrona.py — ConexionAsincrona: pipelining FIFO, conexión perdida y abanico.
+import asyncio
+
+import pytest
+
+from conftest import SEMANA07, cargar_script
+
+gestor = cargar_script(SEMANA07 / "GESTORdeARCHIVOS_constructor y destructor.py", "gestor_archivos")
+ConexionAsincrona, ServidorEcoAsincrono = gestor.ConexionAsincrona, gestor.ServidorEcoAsincrono
+
+# Largos distintos: si las respuestas se entregaran fuera de orden, no calzarían.
+MENSAJES = [b"m%03d:" % i + b"x" * (i * 37 % 300) for i in range(200)]
+
+
+def test_enviar_ping_concurrente_respeta_el_orden():
+    async def principal():
+        async with ServidorEcoAsincrono() as srv:
+            async with ConexionAsincrona(srv.host, srv.port) as conn:
+                ecos = await asyncio.gather(*(conn.enviar_ping(m) for m in MENSAJES))
+                assert ecos == MENSAJES
+                assert not conn._esperando
+            assert srv.aceptadas == 1      # todo por un mismo stream
+    asyncio.run(principal())
+
+
+def test_pipeline_igual_a_los_mensajes():
+    async def principal():
+        async with ServidorEcoAsincrono() as srv:
+            async with ConexionAsincrona(srv.host, srv.port) as conn:
+                assert await conn.pipeline(MENSAJES) == MENSAJES
+                assert await conn.pipeline([]) == []
+                grande = [bytes([i % 251]) * 70_000 for i in range(20)]   # más que un read() del servidor
+                assert await conn.pipeline(iter(grande)) == grande
+                assert await conn.enviar_ping() == b"ping"
+    asyncio.run(principal())
+
+
+def test_servidor_cerrado_con_pedidos_en_vuelo():
+    async def principal():
+        srv = await ServidorEcoAsincrono().abrir()
+        conn = await ConexionAsincrona(srv.host, srv.port).abrir()
+        assert await conn.enviar_ping(b"antes") == b"antes"
+        tareas = [asyncio.create_task(conn.enviar_ping(m)) for m in MENSAJES]
+        await asyncio.sleep(0)             # cada tarea ya escribió su pedido
+        await srv.close()
+        resultados = await asyncio.gather(*tareas, return_exceptions=True)
+        for m, r in zip(MENSAJES, resultados):
+            assert r == m or isinstance(r, ConnectionError), r
+        assert any(isinstance(r, ConnectionError) for r in resultados)
+        assert not conn._esperando
+        with pytest.raises(ConnectionError):
+            await conn.enviar_ping()       # la lectora terminó: no se aceptan pedidos nuevos
+        await conn.close()
+        await conn.close()                 # idempotente
+        with pytest.raises(RuntimeError):
+            await conn.enviar_ping()
+    asyncio.run(principal())
+
+
+def test_close_propio_falla_los_pendientes():
+    async def principal():
+        async with ServidorEcoAsincrono() as srv:
+            conn = await ConexionAsincrona(srv.host, srv.port).abrir()
+            futuros = conn._pedir(MENSAJES)
+            await conn.close()
+            resultados = await asyncio.gather(*futuros, return_exceptions=True)
+            assert all(r == m or isinstance(r, ConnectionError) for m, r in zip(MENSAJES, resultados))
+            assert not conn._esperando
+    asyncio.run(principal())
+
+
+def test_abanico_a_varios_servidores():
+    async def principal():
+        servidores = [await ServidorEcoAsincrono().abrir() for _ in range(3)]
+        try:
+            direcciones = [(s.host, s.port) for s in servidores]
+            resultados = await gestor.abanico(direcciones, MENSAJES[:50])
+            assert resultados == [MENSAJES[:50]] * 3
+            assert [s.aceptadas for s in servidores] == [1, 1, 1]
+        finally:
+            for s in servidores:
+                await s.close()
+    asyncio.run(principal())
+
+
+def test_abanico_propaga_la_conexion_rechazada():
+    async def principal():
+        async with ServidorEcoAsincrono() as srv:
+            libre = (srv.host, srv.port)
+        with pytest.raises(OSError):       # el puerto quedó sin servidor
+            await gestor.abanico([libre], [b"x"])
+    asyncio.run(principal())
@@ -0,0 +1,93 @@
+# tests/test_fixtures_stdin.py — grabar una sesión de input() y reproducirla sin teclado.
+import subprocess
+import types
+
+import pytest
+
+from nucleo_dashboard import fixtures_stdin
+from nucleo_dashboard.fixtures_stdin import (cargar, expandir, grabar, listar_fixtures,
+                                             reproducir, ruta_fixture)
+from nucleo_dashboard.pool_interpretes import ejecutar_subproceso
+
+MENU = """\
+total = 0
+while True:
+    op = input("1) sumar 2) salir: ")
+    if op == "2":
+        break
+    total += int(input("valor: "))
+    print("total", total)
+print("fin", total)
+"""
+
+
+@pytest.fixture
+def teclado(monkeypatch):
+    """grabar() hereda la terminal; aquí las 'teclas' llegan por stdin desde la prueba."""
+    teclas = {"texto": ""}
+    real = subprocess.run
+
+    def run(*args, **kwargs):
+        return real(*args, input=teclas["texto"], text=True, **kwargs)
+
+    # Solo el subprocess que ve fixtures_stdin: ejecutar_subproceso sigue con el real.
+    monkeypatch.setattr(fixtures_stdin, "subprocess", types.SimpleNamespace(run=run))
+    return teclas
+
+
+def _script(tmp_path, codigo=MENU):
+    carpeta = tmp_path / "Semana X"
+    carpeta.mkdir(exist_ok=True)
+    ruta = carpeta / "menu.py"
+    ruta.write_text(codigo, encoding="utf-8")
+    return str(ruta)
+
+
+def test_grabar_y_reproducir_coincide(tmp_path, teclado):
+    script = _script(tmp_path)
+    teclado["texto"] = "1\n5\n1\n7\n2\n"
+    destino, fx = grabar(script, str(tmp_path), "base")
+    assert destino == ruta_fixture(str(tmp_path), script, "base")
+    assert listar_fixtures(str(tmp_path), script) == [destino]
+    assert fx["script"] == "Semana X/menu.py"
+    assert fx["entradas"] == ["1", "5", "1", "7", "2"]
+    assert fx["returncode"] == 0
+    assert "total 12" in fx["salida"] and "valor: " in fx["salida"]
+    assert cargar(destino) == fx
+
+    informe = reproducir(cargar(destino), str(tmp_path), ejecutar_subproceso)
+    assert informe["coincide"], informe["diff"]
+    assert informe["operaciones"] == 5
+
+
+def test_reproducir_detecta_cambios(tmp_path, teclado):
+    script = _script(tmp_path)
+    teclado["texto"] = "1\n5\n2\n"
+    destino, _ = grabar(script, str(tmp_path))
+    _script(tmp_path, MENU.replace('print("fin", total)', 'print("FIN", total)'))
+    informe = reproducir(cargar(destino), str(tmp_path), ejecutar_subproceso)
+    assert not informe["coincide"]
+    assert "+1) sumar 2) salir: FIN 5" in informe["diff"]
+
+
+def test_eof_queda_grabado(tmp_path, teclado):
+    script = _script(tmp_path)
+    teclado["texto"] = "1\n3\n"  # sin "2": input() recibe EOF
+    _, fx = grabar(script, str(tmp_path), "eof")
+    assert fx["entradas"] == ["1", "3", None]
+    assert fx["returncode"] == 1
+    informe = reproducir(fx, str(tmp_path), ejecutar_subproceso)
+    assert informe["coincide"] and informe["operaciones"] == 2
+
+
+def test_expandir_y_bucle_de_carga(tmp_path):
+    assert expandir(["a", "b", None]) == ["a", "b"]
+    assert expandir(["x", "1", "5", "2"], 3, (1, 3)) == ["x", "1", "5", "1", "5", "1", "5", "2"]
+
+    script = _script(tmp_path)
+    fx = {"script": "Semana X/menu.py", "entradas": ["1", "5", "2"], "salida": "", "returncode": 0}
+    informe = reproducir(fx, str(tmp_path), ejecutar_subproceso, repeticiones=100, bucle=(0, 2))
+    assert informe["operaciones"] == 201
+    assert "coincide" not in informe
+    assert informe["resultado"]["stdout"].rstrip().endswith("fin 500")
+    assert script.endswith("menu.py")
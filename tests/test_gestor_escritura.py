@@ -0,0 +1,95 @@
+# tests/test_gestor_escritura.py — write_lines (texto, writev, bytes) igual byte a byte que write_line.
+import os
+
+import pytest
+
+from conftest import SEMANA07, cargar_script
+
+gestor = cargar_script(SEMANA07 / "GESTORdeARCHIVOS_constructor y destructor.py", "gestor_archivos")
+
+LINEAS = ["uno", "dos\n", "tres\n\n", "", "\n", "ñandú ☃", "con\rretorno", "x" * 5000] + \
+         [f"registro {i:05d}" for i in range(3000)]
+
+writev = pytest.mark.skipif(not hasattr(os, "writev"), reason="os.writev no disponible")
+
+
+@pytest.fixture
+def referencia(tmp_path):
+    ruta = tmp_path / "referencia.txt"
+    with gestor.GestorArchivo(ruta, mode="w") as g:
+        for linea in LINEAS:
+            g.write_line(linea)
+    return ruta.read_bytes()
+
+
+@pytest.mark.parametrize("bloque", [1, 64, 1 << 16])
+def test_write_lines_texto(tmp_path, referencia, bloque):
+    ruta = tmp_path / "lote.txt"
+    with gestor.GestorArchivo(ruta, mode="w", buffering=1 << 20) as g:
+        g.write_lines(iter(LINEAS), bloque=bloque)
+    assert ruta.read_bytes() == referencia
+
+
+@writev
+def test_write_lines_writev_texto_y_bytes(tmp_path, referencia):
+    for nombre, lineas in (("str", LINEAS), ("bytes", [l.encode() for l in LINEAS])):
+        ruta = tmp_path / f"writev_{nombre}.txt"
+        with gestor.GestorArchivo(ruta, mode="w", writev=True) as g:
+            g.write_lines(lineas)
+        assert ruta.read_bytes() == referencia, nombre
+
+
+@writev
+def test_write_line_writev_y_modo_append(tmp_path, referencia):
+    ruta = tmp_path / "mixto.txt"
+    with gestor.GestorArchivo(ruta, mode="w", writev=True) as g:
+        g.write_line(LINEAS[0])
+        g.write_lines(LINEAS[1:100])
+    with gestor.GestorArchivo(ruta, mode="a", writev=True) as g:
+        g.write_lines(LINEAS[100:])
+    assert ruta.read_bytes() == referencia
+
+
+@writev
+@pytest.mark.parametrize("iov_max", [2, 3, 5, 8])
+def test_writev_no_pasa_de_iov_max(tmp_path, referencia, monkeypatch, iov_max):
+    # Con IOV_MAX impar, una línea + su salto no deben pasar del límite (EINVAL).
+    monkeypatch.setattr(gestor, "_IOV_MAX", iov_max)
+    real, tamanos = os.writev, []
+
+    def writev_contado(fd, bufs):
+        tamanos.append(len(bufs))
+        if len(bufs) > gestor._IOV_MAX:
+            raise OSError(22, "Invalid argument")
+        return real(fd, bufs)
+
+    monkeypatch.setattr(gestor.os, "writev", writev_contado)
+    ruta = tmp_path / "limite.txt"
+    with gestor.GestorArchivo(ruta, mode="w", writev=True) as g:
+        g.write_lines(LINEAS)
+    assert ruta.read_bytes() == referencia
+    assert max(tamanos) <= gestor._IOV_MAX
+
+
+@writev
+def test_escritura_parcial_se_completa(tmp_path, referencia, monkeypatch):
+    real = os.writev
+
+    def writev_corto(fd, bufs):  # el SO acepta solo la mitad de lo pedido
+        datos = b"".join(bufs)
+        return real(fd, [datos[:max(1, len(datos) // 2)]])
+
+    monkeypatch.setattr(gestor.os, "writev", writev_corto)
+    ruta = tmp_path / "parcial.txt"
+    with gestor.GestorArchivo(ruta, mode="w", writev=True) as g:
+        g.write_lines(LINEAS)
+    assert ruta.read_bytes() == referencia
+
+
+def test_cerrado_rechaza_escrituras(tmp_path):
+    g = gestor.GestorArchivo(tmp_path / "c.txt", mode="w")
+    g.close()
+    with pytest.raises(RuntimeError):
+        g.write_lines(["x"])
+    with pytest.raises(RuntimeError):
+        g.write_line("x")
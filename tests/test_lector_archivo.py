@@ -0,0 +1,115 @@
+# tests/test_lector_archivo.py — LectorArchivo (mmap + índice por bloques) contra splitlines().
+import pytest
+
+from conftest import SEMANA07, cargar_script
+
+gestor = cargar_script(SEMANA07 / "GESTORdeARCHIVOS_constructor y destructor.py", "gestor_archivos")
+LectorArchivo = gestor.LectorArchivo
+
+CASOS = {
+    "vacio": b"",
+    "solo_salto": b"\n",
+    "saltos": b"\n\n\n",
+    "una_sin_salto": b"hola",
+    "una_con_salto": b"hola\n",
+    "sin_salto_final": b"uno\ndos\ntres",
+    "con_salto_final": b"uno\ndos\ntres\n",
+    "crlf": b"uno\r\ndos\r\n\r\ntres\r\n",
+    "crlf_sin_final": b"uno\r\ndos\r\ntres",
+    "larga_al_inicio": b"x" * 50 + b"\ncorta\n",
+    "larga_al_final": b"corta\n" + b"y" * 50,
+    "solo_larga": b"z" * 37,
+    "no_ascii": "ñandú\ncafé ☕\n€\n".encode(),
+    "mezcla": b"".join(b"l%d%s\n" % (i, b"-" * (i * 7 % 23)) for i in range(60)) + b"\n\nfin",
+}
+BLOQUES = [1, 3, 8, 1 << 20]
+
+
+def _referencia(datos):
+    return datos.decode().splitlines()
+
+
+@pytest.fixture
+def lector(tmp_path, monkeypatch):
+    def abrir(datos, bloque):
+        monkeypatch.setattr(LectorArchivo, "BLOQUE", bloque)
+        ruta = tmp_path / "datos.txt"
+        ruta.write_bytes(datos)
+        return LectorArchivo(ruta)
+    return abrir
+
+
+@pytest.mark.parametrize("bloque", BLOQUES)
+@pytest.mark.parametrize("caso", sorted(CASOS))
+def test_linea_len_y_negativos(lector, caso, bloque):
+    ref = _referencia(CASOS[caso])
+    with lector(CASOS[caso], bloque) as lec:
+        assert [lec.linea(i) for i in range(len(ref))] == ref   # índice perezoso, en orden
+        assert len(lec) == len(ref)
+        assert [lec.linea(-i) for i in range(1, len(ref) + 1)] == ref[::-1]
+        with pytest.raises(IndexError):
+            lec.linea(len(ref))
+        with pytest.raises(IndexError):
+            lec.linea(-len(ref) - 1)
+
+
+@pytest.mark.parametrize("bloque", BLOQUES)
+@pytest.mark.parametrize("caso", sorted(CASOS))
+def test_acceso_salteado_sin_len(lector, caso, bloque):
+    ref = _referencia(CASOS[caso])
+    with lector(CASOS[caso], bloque) as lec:
+        # Primero la última (indexa todo de una) y luego hacia atrás de a saltos.
+        for i in range(len(ref) - 1, -1, -3):
+            assert lec.linea(i) == ref[i]
+    if ref:
+        with lector(CASOS[caso], bloque) as lec:
+            assert lec.linea(len(ref) - 1) == ref[-1]
+
+
+@pytest.mark.parametrize("caso", sorted(CASOS))
+def test_invertido_y_cola(lector, caso):
+    ref = _referencia(CASOS[caso])
+    with lector(CASOS[caso], 8) as lec:
+        assert list(lec.invertido()) == ref[::-1]
+        assert lec.cola(0) == []
+        for k in (1, 2, 3, len(ref) + 5):
+            assert lec.cola(k) == ref[-k:]
+
+
+@pytest.mark.parametrize("bloque", BLOQUES)
+@pytest.mark.parametrize("caso", sorted(CASOS))
+def test_rango_lineas(lector, caso, bloque):
+    datos = CASOS[caso]
+    crudas = datos.splitlines(keepends=True)
+    with lector(datos, bloque) as lec:
+        for i in range(len(crudas) + 1):
+            for j in range(i, min(len(crudas), i + 4) + 1):
+                with lec.rango_lineas(i, j) as v:
+                    assert v.tobytes() == b"".join(crudas[i:j])
+        with lec.rango_lineas(2, 1) as v:
+            assert v.nbytes == 0
+
+
+def test_close_con_vistas_vivas(tmp_path):
+    ruta = tmp_path / "v.txt"
+    ruta.write_bytes(b"uno\ndos\n")
+    lec = LectorArchivo(ruta)
+    vista = lec.rango_bytes(0, 3)
+    with pytest.raises(RuntimeError):
+        lec.close()
+    assert vista.tobytes() == b"uno" and lec.linea(1) == "dos"   # sigue abierto
+    vista.release()
+    lec.close()
+    lec.close()  # idempotente
+    with pytest.raises(RuntimeError):
+        lec.linea(0)
+    with pytest.raises(RuntimeError):
+        list(lec.invertido())
+
+
+def test_lector_desde_gestor_ve_lo_no_vaciado(tmp_path):
+    ruta = tmp_path / "g.txt"
+    with gestor.GestorArchivo(ruta, mode="w", buffering=1 << 20) as g:
+        g.write_lines(f"fila {i}" for i in range(100))
+        with g.lector() as lec:
+            assert len(lec) == 100 and lec.linea(-1) == "fila 99" and lec.cola(2) == ["fila 98", "fila 99"]
@@ -0,0 +1,71 @@
+# tests/test_migracion_tareas.py — migración única al esquema 2 (unidades "PARCIAL 0n").
+import json
+import os
+
+import pytest
+
+from nucleo_dashboard.almacen_tareas import ESQUEMA, AlmacenTareas
+
+ANTIGUAS = [
+    {"id": 1, "titulo": "a", "unidad": "UNIDAD 1", "estado": "pendiente", "fecha_limite": "2030-01-01", "nota": ""},
+    {"id": "2", "titulo": "b", "unidad": "UNIDAD 2", "estado": "completada", "fecha_limite": "", "nota": ""},
+    {"id": 3, "titulo": "c", "unidad": "UNIDAD 3", "estado": "en progreso", "fecha_limite": "", "nota": ""},
+    {"id": 7, "titulo": "d", "unidad": "UNIDAD 4", "estado": "pendiente", "fecha_limite": "", "nota": ""},
+    {"id": "x", "titulo": "id inválido", "unidad": "UNIDAD 1", "estado": "pendiente"},
+]
+ESPERADAS = {1: "PARCIAL 01", 2: "PARCIAL 01", 3: "PARCIAL 02", 7: "PARCIAL 02"}
+
+
+def _escribir(ruta, data):
+    ruta.write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.mark.parametrize("backend", ("diario", "instantanea"))
+def test_lista_antigua_migra_unidades_una_vez(tmp_path, backend):
+    ruta = tmp_path / "tareas.json"
+    _escribir(ruta, ANTIGUAS)
+    a = AlmacenTareas(ruta, backend=backend)
+    assert {t["id"]: t["unidad"] for t in a.listar()} == ESPERADAS
+    assert a.siguiente_id == 8
+    disco = json.loads(ruta.read_text(encoding="utf-8"))
+    assert disco["esquema"] == ESQUEMA
+    assert {t["id"]: t["unidad"] for t in disco["tareas"]} == ESPERADAS
+
+    antes = os.stat(ruta).st_mtime_ns
+    b = AlmacenTareas(ruta, backend=backend)  # ya migrado: no se vuelve a escribir
+    assert os.stat(ruta).st_mtime_ns == antes
+    assert {t["id"]: t["unidad"] for t in b.listar()} == ESPERADAS
+
+
+def test_instantanea_esquema_1_con_diario_migra(tmp_path):
+    ruta = tmp_path / "tareas.json"
+    _escribir(ruta, {"formato": 2, "siguiente_id": 2, "seq": 1, "tareas": ANTIGUAS[:1]})
+    op = {"op": "crear", "seq": 2, "tarea": {"id": 2, "titulo": "nueva", "unidad": "PARCIAL 02",
+                                               "estado": "pendiente", "fecha_limite": "", "nota": ""}}
+    (tmp_path / "tareas.json.journal").write_text(json.dumps(op) + "\n", encoding="utf-8")
+    a = AlmacenTareas(ruta)
+    assert {t["id"]: t["unidad"] for t in a.listar()} == {1: "PARCIAL 01", 2: "PARCIAL 02"}
+    assert json.loads(ruta.read_text(encoding="utf-8"))["esquema"] == ESQUEMA
+    assert (tmp_path / "tareas.json.journal").read_text(encoding="utf-8") == ""  # incluido en la instantánea
+
+
+def test_unidad_desconocida_se_conserva(tmp_path):
+    ruta = tmp_path / "tareas.json"
+    _escribir(ruta, [{"id": 1, "titulo": "a", "unidad": "OTRA", "estado": "pendiente"}])
+    assert AlmacenTareas(ruta).obtener(1)["unidad"] == "OTRA"
+
+
+def test_esquema_actual_no_se_toca(tmp_path):
+    ruta = tmp_path / "tareas.json"
+    _escribir(ruta, {"formato": 2, "esquema": ESQUEMA, "siguiente_id": 2, "seq": 0,
+                     "tareas": [{"id": 1, "titulo": "a", "unidad": "UNIDAD 1", "estado": "pendiente"}]})
+    antes = os.stat(ruta).st_mtime_ns
+    assert AlmacenTareas(ruta).obtener(1)["unidad"] == "UNIDAD 1"
+    assert os.stat(ruta).st_mtime_ns == antes
+
+
+def test_archivo_invalido_arranca_vacio(tmp_path, capsys):
+    ruta = tmp_path / "tareas.json"
+    ruta.write_text("{no es json", encoding="utf-8")
+    assert len(AlmacenTareas(ruta)) == 0
+    assert "inválido" in capsys.readouterr().out
@@ -0,0 +1,80 @@
+# tests/test_nomina.py — NominaPorLotes da exactamente lo mismo que calcular_nomina().
+import random
+
+import pytest
+
+import NominaEmpleados as nomina
+from NominaEmpleados import (EmpleadoAsalariado, EmpleadoPorHoras, NominaPorLotes,
+                             calcular_nomina)
+
+
+class _ConBono(EmpleadoPorHoras):
+    def calcular_pago(self) -> float:
+        return super().calcular_pago() + 10.0
+
+
+def _empleados(semilla, n, con_subclase=False):
+    rnd = random.Random(semilla)
+    res = []
+    for i in range(n):
+        k = rnd.random()
+        horas = rnd.choice([40.0, 0.0, rnd.uniform(0, 40), rnd.uniform(40, 80)])
+        if k < 0.3:
+            res.append(EmpleadoAsalariado(f"A{i}", rnd.uniform(0, 5000)))
+        elif con_subclase and k < 0.4:
+            res.append(_ConBono(f"B{i}", rnd.uniform(0, 50), horas))
+        else:
+            res.append(EmpleadoPorHoras(f"H{i}", rnd.uniform(0, 50), horas))
+    return res
+
+
+@pytest.fixture(params=["numpy", "sin numpy"])
+def motor(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(nomina, "np", None)
+    return request.param
+
+
+@pytest.mark.parametrize("semilla", range(20))
+def test_pagos_y_total_identicos_bit_a_bit(motor, semilla):
+    empleados = _empleados(semilla, random.Random(semilla).randint(0, 300), con_subclase=semilla % 2 == 1)
+    lote = NominaPorLotes(empleados)
+    assert len(lote) == len(empleados)
+    # ==, no aproximado: mismas operaciones en el mismo orden.
+    assert lote.pagos() == [e.calcular_pago() for e in empleados]
+    assert lote.total() == calcular_nomina(empleados)
+
+
+@pytest.mark.parametrize("tipo", ["asalariados", "por horas"])
+def test_un_solo_tipo(motor, tipo):
+    empleados = [e for e in _empleados(7, 200)
+                 if isinstance(e, EmpleadoAsalariado) == (tipo == "asalariados")]
+    assert NominaPorLotes(empleados).total() == calcular_nomina(empleados)
+
+
+def test_vacia(motor):
+    assert NominaPorLotes().total() == calcular_nomina([]) == 0
+    assert NominaPorLotes().pagos() == []
+
+
+def test_agregar_sin_objetos_equivale_a_objetos(motor):
+    lote = NominaPorLotes()
+    lote.agregar_por_horas(5.5, 45)
+    lote.agregar_asalariado(1200)
+    lote.agregar_por_horas(6.0, 38)
+    objetos = [EmpleadoPorHoras("M", 5.5, 45), EmpleadoAsalariado("A", 1200), EmpleadoPorHoras("L", 6.0, 38)]
+    assert lote.pagos() == [261.25, 1200.0, 228.0]
+    assert lote.total() == calcular_nomina(objetos) == 1689.25
+
+
+def test_agregar_valida_como_las_properties():
+    lote = NominaPorLotes()
+    with pytest.raises(ValueError):
+        lote.agregar_asalariado(-1)
+    with pytest.raises(ValueError):
+        lote.agregar_por_horas(-1, 10)
+    with pytest.raises(ValueError):
+        lote.agregar_por_horas(10, -1)
+    assert len(lote) == 0
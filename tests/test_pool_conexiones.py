@@ -0,0 +1,144 @@
+# tests/test_pool_conexiones.py — PoolConexiones y ConexionSimulada.viva() contra un ServidorEco local.
+import threading
+import time
+
+import pytest
+
+from conftest import SEMANA07, cargar_script
+
+gestor = cargar_script(SEMANA07 / "GESTORdeARCHIVOS_constructor y destructor.py", "gestor_archivos")
+PoolConexiones, ServidorEco = gestor.PoolConexiones, gestor.ServidorEco
+
+
+@pytest.fixture
+def servidor():
+    with ServidorEco(port=0) as srv:
+        yield srv
+
+
+def _esperar(condicion, plazo=2.0):
+    limite = time.monotonic() + plazo
+    while not condicion():
+        if time.monotonic() > limite:
+            raise AssertionError("La condición no se cumplió a tiempo.")
+        time.sleep(0.005)
+
+
+def test_reutiliza_una_sola_conexion(servidor):
+    with PoolConexiones(servidor.host, servidor.port, max_tamano=4) as pool:
+        for i in range(10):
+            with pool.obtener() as conn:
+                assert conn.enviar_ping(b"hola %d" % i) == b"hola %d" % i
+        assert (pool.creadas, pool.reutilizadas, pool.descartadas) == (1, 9, 0)
+        assert pool.libres() == 1
+    assert servidor.aceptadas == 1
+
+
+def test_libres_en_orden_lifo(servidor):
+    with PoolConexiones(servidor.host, servidor.port, max_tamano=2) as pool:
+        with pool.obtener() as a:
+            with pool.obtener() as b:
+                pass
+        assert pool.libres() == 2 and pool.creadas == 2
+        with pool.obtener() as c:
+            assert c is a   # la última devuelta es la primera en salir
+
+
+def test_espera_max_sin_cupo(servidor):
+    with PoolConexiones(servidor.host, servidor.port, max_tamano=1, espera_max=0.05) as pool:
+        with pool.obtener():
+            t0 = time.monotonic()
+            with pytest.raises(TimeoutError):
+                with pool.obtener():
+                    pass
+            assert time.monotonic() - t0 >= 0.04
+        with pool.obtener() as conn:   # el cupo volvió
+            assert conn.enviar_ping(b"x") == b"x"
+
+
+def test_hilos_no_pasan_de_max_tamano(servidor):
+    errores = []
+    with PoolConexiones(servidor.host, servidor.port, max_tamano=3) as pool:
+        def trabajar(n):
+            try:
+                for i in range(20):
+                    with pool.obtener() as conn:
+                        msg = b"%d-%d" % (n, i)
+                        assert conn.enviar_ping(msg) == msg
+            except Exception as e:   # pragma: no cover - solo si falla
+                errores.append(e)
+        hilos = [threading.Thread(target=trabajar, args=(n,)) for n in range(8)]
+        for h in hilos:
+            h.start()
+        for h in hilos:
+            h.join()
+        assert not errores
+        assert pool.creadas <= 3 and pool.creadas + pool.reutilizadas == 160
+    assert servidor.aceptadas == pool.creadas
+
+
+def test_descarta_las_inactivas(servidor):
+    with PoolConexiones(servidor.host, servidor.port, inactividad_max=0.05) as pool:
+        with pool.obtener() as primera:
+            pass
+        time.sleep(0.1)
+        with pool.obtener() as segunda:
+            assert segunda is not primera and segunda.enviar_ping() == b"ping"
+        assert primera._cerrado
+        assert (pool.creadas, pool.reutilizadas, pool.descartadas) == (2, 0, 1)
+
+
+def test_descarta_las_muertas_tras_reiniciar_el_servidor():
+    srv = ServidorEco(port=0)
+    try:
+        pool = PoolConexiones(srv.host, srv.port)
+        with pool.obtener() as vieja:
+            assert vieja.enviar_ping() == b"ping"
+        srv.close()
+        _esperar(lambda: not vieja.viva())
+        srv = ServidorEco(srv.host, srv.port)     # "reinicio" en el mismo puerto
+        with pool.obtener() as nueva:
+            assert nueva is not vieja and nueva.enviar_ping(b"otra vez") == b"otra vez"
+        assert vieja._cerrado
+        assert (pool.creadas, pool.reutilizadas, pool.descartadas) == (2, 0, 1)
+        pool.close()
+    finally:
+        srv.close()
+
+
+def test_excepcion_en_el_with_cierra_la_conexion(servidor):
+    with PoolConexiones(servidor.host, servidor.port, max_tamano=1) as pool:
+        with pytest.raises(ValueError):
+            with pool.obtener() as conn:
+                conn.enviar_ping()
+                raise ValueError("a mitad del intercambio")
+        assert conn._cerrado and pool.libres() == 0 and pool.descartadas == 1
+        with pool.obtener() as otra:   # el cupo se liberó igual
+            assert otra is not conn and otra.enviar_ping() == b"ping"
+
+
+def test_close_del_pool(servidor):
+    pool = PoolConexiones(servidor.host, servidor.port)
+    with pool.obtener() as prestada:
+        with pool.obtener() as libre:
+            pass
+        pool.close()
+        assert libre._cerrado and not prestada._cerrado
+    assert prestada._cerrado   # se cierra al devolverse
+    with pytest.raises(RuntimeError):
+        with pool.obtener():
+            pass
+    with pytest.raises(ValueError):
+        PoolConexiones(max_tamano=0)
+
+
+def test_viva(servidor):
+    with gestor.ConexionSimulada(port=1) as sin_conectar:
+        assert not sin_conectar.viva()
+    with gestor.ConexionSimulada(servidor.host, servidor.port, conectar=True) as conn:
+        assert conn.viva()
+        conn._sock.sendall(b"x")                         # eco sin leer = protocolo desfasado
+        _esperar(lambda: not conn.viva())
+        assert conn._sock.recv(1) == b"x"
+        assert conn.viva() and conn.enviar_ping() == b"ping"   # viva() no consumió nada
+    assert not conn.viva()
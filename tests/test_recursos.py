@@ -0,0 +1,101 @@
+# tests/test_recursos.py — rastreo de recursos: fugas por __del__, modos y pila de creación.
+import gc
+
+import pytest
+
+import recursos
+from conftest import SEMANA07, cargar_script
+
+gestor = cargar_script(SEMANA07 / "GESTORdeARCHIVOS_constructor y destructor.py", "gestor_archivos")
+bitacora = cargar_script(SEMANA07 / "Metodo_Construtor_Destructor_BITACORA-INGRESO.py", "bitacora_ingreso")
+
+
+@pytest.fixture(autouse=True)
+def _rastreo_limpio():
+    recursos.reiniciar()
+    yield
+    recursos.desactivar()
+    recursos.reiniciar()
+
+
+class _Sub(gestor.ConexionSimulada):
+    def __init__(self):
+        super().__init__(host="h", port=1)
+
+
+def _crear_sub():
+    return _Sub()
+
+
+def test_apagado_no_registra():
+    c = gestor.ConexionSimulada(host="h", port=1)
+    c.close()
+    assert recursos.abiertos() == {} and recursos.fugas() == []
+
+
+def test_close_y_with_no_son_fugas(tmp_path):
+    with recursos.rastrear():
+        with gestor.GestorArchivo(str(tmp_path / "a.txt")) as g:
+            g.write_line("x")
+        c = gestor.ConexionSimulada(host="h", port=1)
+        c.close()
+        b = bitacora.Bitacora(tmp_path / "b.csv")
+        b.close()
+    assert "ConexionSimulada" in recursos.reporte()
+
+
+def test_fuga_por_del_falla_en_modo_error(tmp_path):
+    with pytest.raises(recursos.FugaDeRecurso, match="GestorArchivo"):
+        with recursos.rastrear():
+            gestor.GestorArchivo(str(tmp_path / "a.txt")).write_line("sin close")
+            gc.collect()
+
+
+def test_abierto_al_salir_falla_salvo_que_se_excluya(tmp_path):
+    b = None
+    with pytest.raises(recursos.FugaDeRecurso, match="sigue abierto"):
+        with recursos.rastrear():
+            b = bitacora.Bitacora(tmp_path / "b.csv")
+    b.close()
+    with recursos.rastrear(incluir_abiertos=False):
+        b = bitacora.Bitacora(tmp_path / "c.csv")
+    b.close()
+
+
+def test_modo_advertir_reporta_sin_fallar():
+    with recursos.rastrear("advertir"):
+        c = gestor.ConexionSimulada(host="h", port=1)
+        del c
+    assert len(recursos.fugas()) == 1
+    recursos.activar("advertir")
+    problemas = recursos.verificar()
+    assert len(problemas) == 1 and "lo cerró __del__" in problemas[0]
+
+
+def test_pila_apunta_a_quien_creo_la_subclase():
+    recursos.activar()
+    c = _crear_sub()
+    try:
+        registro = recursos._E.vivos[id(c)]
+        assert registro.tipo == "_Sub"
+        assert registro.pila[0][2] == "_crear_sub"
+        assert "_crear_sub" in registro.texto_pila()
+    finally:
+        c.close()
+
+
+def test_reporte_cuenta_abiertos_cerrados_y_fugas():
+    recursos.activar()
+    abiertas = [gestor.ConexionSimulada(host="h", port=i) for i in range(3)]
+    abiertas.pop().close()
+    abiertas.pop()
+    gc.collect()
+    assert recursos.abiertos() == {"ConexionSimulada": 1}
+    fila = next(l for l in recursos.reporte().splitlines() if l.startswith("ConexionSimulada"))
+    assert fila.split()[1:4] == ["1", "2", "1"]  # abiertos, cerrados, por __del__
+    abiertas[0].close()
+
+
+def test_modo_invalido():
+    with pytest.raises(ValueError):
+        recursos.activar("estricto")
@@ -0,0 +1,98 @@
+# tests/test_rotacion.py — rotación por tamaño/día, compresión y retención de segmentos.
+import pytest
+
+import rotacion
+from rotacion import ArchivoRotativo, PoliticaRotacion, leer_lineas, segmentos
+
+CABECERA = "fecha,nombre\n"
+
+
+def _escribir(arch, lineas, fecha=None):
+    for linea in lineas:
+        if arch.reservar(len(linea.encode()), fecha):
+            arch.rotar()
+        arch.write(linea)
+    arch.flush()
+
+
+def _lineas(n, inicio=0):
+    return [f"2026-01-01,persona{i:04d}\n" for i in range(inicio, inicio + n)]
+
+
+def test_rota_por_tamano_y_conserva_todo_en_orden(tmp_path):
+    ruta = tmp_path / "b.csv"
+    arch = ArchivoRotativo(ruta, PoliticaRotacion(max_bytes=200, conservar=None), cabecera=CABECERA)
+    _escribir(arch, _lineas(50))
+    arch.close()
+    segs = segmentos(ruta)
+    assert len(segs) > 3
+    assert all(s.name.endswith(".gz") for s in segs)
+    assert all(s.stat().st_size > 0 for s in segs)
+    lineas = [l for l in leer_lineas(ruta) if l != CABECERA]
+    assert lineas == _lineas(50)
+    assert ruta.read_text().startswith(CABECERA)
+
+
+def test_retencion_conserva_los_ultimos_n(tmp_path):
+    ruta = tmp_path / "b.csv"
+    arch = ArchivoRotativo(ruta, PoliticaRotacion(max_bytes=200, conservar=2), cabecera=CABECERA)
+    _escribir(arch, _lineas(80))
+    arch.close()
+    segs = segmentos(ruta)
+    assert len(segs) == 2
+    secuencias = [int(s.name.split(".")[3]) for s in segs]
+    assert secuencias == sorted(secuencias) and secuencias[-1] - secuencias[0] == 1
+    lineas = [l for l in leer_lineas(ruta) if l != CABECERA]
+    assert lineas == _lineas(80)[-len(lineas):]  # se perdió solo lo más viejo
+
+
+@pytest.mark.parametrize("comprimir", (True, False))
+def test_retencion_cero_sin_segmentos(tmp_path, comprimir):
+    ruta = tmp_path / "b.csv"
+    arch = ArchivoRotativo(ruta, PoliticaRotacion(max_bytes=100, conservar=0, comprimir=comprimir))
+    _escribir(arch, _lineas(20))
+    arch.close()
+    assert segmentos(ruta) == []
+    assert [p.name for p in tmp_path.iterdir()] == ["b.csv"]
+
+
+def test_rotacion_diaria_nombra_con_la_fecha_del_segmento(tmp_path):
+    ruta = tmp_path / "b.csv"
+    arch = ArchivoRotativo(ruta, PoliticaRotacion(diaria=True, comprimir=False), cabecera=CABECERA)
+    _escribir(arch, ["a\n", "b\n"], fecha="2026-01-01")
+    _escribir(arch, ["c\n"], fecha="2026-01-02")
+    _escribir(arch, ["d\n"], fecha="2026-01-03")
+    arch.close()
+    assert [s.name for s in segmentos(ruta)] == ["b.csv.2026-01-01.000001", "b.csv.2026-01-02.000002"]
+    assert [l for l in leer_lineas(ruta) if l != CABECERA] == ["a\n", "b\n", "c\n", "d\n"]
+
+
+def test_comprimir_segmento_ya_borrado_no_falla(tmp_path):
+    rotacion._comprimir(tmp_path / "b.csv.2026-01-01.000001")  # la retención lo borró antes
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_segmentos_prefiere_el_plano_mientras_se_comprime(tmp_path):
+    (tmp_path / "b.csv.2026-01-01.000001").write_text("x\n")
+    (tmp_path / "b.csv.2026-01-01.000001.gz").write_bytes(b"")
+    (tmp_path / "otro.csv.2026-01-01.000001").write_text("y\n")
+    assert [s.name for s in segmentos(tmp_path / "b.csv")] == ["b.csv.2026-01-01.000001"]
+
+
+def test_cerrar_compresor_espera_y_se_puede_volver_a_rotar(tmp_path):
+    ruta = tmp_path / "b.csv"
+    arch = ArchivoRotativo(ruta, PoliticaRotacion(max_bytes=100, conservar=None))
+    _escribir(arch, _lineas(10))
+    rotacion.cerrar_compresor()
+    rotacion.cerrar_compresor()  # idempotente
+    assert all(s.name.endswith(".gz") for s in segmentos(ruta))
+    _escribir(arch, _lineas(10, inicio=10))  # crea otro compresor
+    arch.close()
+    assert list(leer_lineas(ruta)) == _lineas(20)
+
+
+def test_politica_invalida():
+    with pytest.raises(ValueError):
+        PoliticaRotacion(max_bytes=0)
+    with pytest.raises(ValueError):
+        PoliticaRotacion(conservar=-1)